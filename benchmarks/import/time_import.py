@@ -0,0 +1,29 @@
+"""Benchmark import time of geomstats."""
+
+import subprocess
+import sys
+
+import pytest
+
+MODULES = [
+    "geomstats",
+    "geomstats.backend",
+    "geomstats.geometry.hypersphere",
+    "geomstats.geometry.special_euclidean",
+]
+
+
+def _import_in_subprocess(module):
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_benchmark_import(module, benchmark):
+    """Benchmark import of a module in a fresh interpreter.
+
+    Parameters
+    ----------
+    module : str
+        Name of the module to import.
+    """
+    benchmark.pedantic(_import_in_subprocess, args=(module,), iterations=1, rounds=5)
@@ -0,0 +1,80 @@
+"""Benchmark per-call overhead of single-point operations."""
+
+import pytest
+
+import geomstats.backend as gs
+from geomstats.geometry.euclidean import Euclidean
+from geomstats.geometry.hypersphere import Hypersphere
+from geomstats.geometry.spd_matrices import SPDMatrices
+from geomstats.geometry.special_orthogonal import SpecialOrthogonal
+from geomstats.vectorization import get_batch_shape, repeat_out
+
+SPACES = {
+    "euclidean": Euclidean(dim=3),
+    "hypersphere": Hypersphere(dim=2),
+    "special_orthogonal": SpecialOrthogonal(n=3),
+    "spd_matrices": SPDMatrices(n=3),
+}
+OPERATIONS = ["inner_product", "squared_norm", "exp", "log", "dist"]
+
+
+def _get_call(space, operation):
+    point_a, point_b = space.random_point(2)
+    tangent_vec = space.metric.log(point_b, point_a)
+    args = {
+        "inner_product": (tangent_vec, tangent_vec, point_a),
+        "squared_norm": (tangent_vec, point_a),
+        "exp": (tangent_vec, point_a),
+        "log": (point_b, point_a),
+        "dist": (point_a, point_b),
+    }[operation]
+    return getattr(space.metric, operation), args
+
+
+@pytest.mark.parametrize("space_name", SPACES)
+@pytest.mark.parametrize("operation", OPERATIONS)
+def test_benchmark_single_point_call(space_name, operation, benchmark):
+    """Benchmark a metric operation on a single point.
+
+    Parameters
+    ----------
+    space_name : str
+        Key of the space in SPACES.
+    operation : str
+        Name of the metric method.
+    """
+    func, args = _get_call(SPACES[space_name], operation)
+    benchmark.pedantic(func, args=args, iterations=100, rounds=10)
+
+
+@pytest.mark.parametrize("n_points", [1, 10])
+def test_benchmark_get_batch_shape(n_points, benchmark):
+    """Benchmark batch shape bookkeeping.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of points in the first argument.
+    """
+    space = SPACES["hypersphere"]
+    point = space.random_point(n_points)
+    benchmark.pedantic(
+        get_batch_shape, args=(space, point, None, point), iterations=1000, rounds=10
+    )
+
+
+@pytest.mark.parametrize("n_points", [1, 10])
+def test_benchmark_repeat_out(n_points, benchmark):
+    """Benchmark output broadcasting bookkeeping.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of points in the first argument.
+    """
+    space = SPACES["hypersphere"]
+    point = space.random_point(n_points)
+    out = gs.ones(point.shape[:-1])
+    benchmark.pedantic(
+        repeat_out, args=(space, out, point, point), iterations=1000, rounds=10
+    )
@@ -20,4 +20,6 @@ python generate_benchmark_params.py
 pytest exp/time_exp.py  --benchmark-columns='min, max'  --benchmark-sort='fullname'
 pytest log/time_log.py  --benchmark-columns='min, max'  --benchmark-sort='fullname'
 pytest dist/time_dist.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
-pytest inner_produuct/time_inner_product.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
\ No newline at end of file
+pytest inner_produuct/time_inner_product.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
+pytest import/time_import.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
+pytest overhead/time_overhead.py --benchmark-columns='min, max'  --benchmark-sort='fullname'
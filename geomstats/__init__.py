@@ -1,23 +1,22 @@
-"""Import main modules."""
+"""Import main modules.
+
+Subpackages and modules are loaded lazily, on first attribute access.
+"""
 
 __version__ = "2.7.0"
 
+import importlib
+
 import geomstats._backend
-import geomstats._logging
-import geomstats.geometry.discrete_curves
-import geomstats.geometry.euclidean
-import geomstats.geometry.hyperbolic
-import geomstats.geometry.hypersphere
-import geomstats.geometry.invariant_metric
-import geomstats.geometry.landmarks
-import geomstats.geometry.lie_algebra
-import geomstats.geometry.lie_group
-import geomstats.geometry.manifold
-import geomstats.geometry.minkowski
-import geomstats.geometry.poincare_polydisk
-import geomstats.geometry.product_manifold
-import geomstats.geometry.riemannian_metric
-import geomstats.geometry.skew_symmetric_matrices
-import geomstats.geometry.spd_matrices
-import geomstats.geometry.special_euclidean
-import geomstats.geometry.special_orthogonal  # NOQA
+import geomstats._logging  # noqa: F401
+
+
+def __getattr__(name):
+    """Import submodules lazily."""
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
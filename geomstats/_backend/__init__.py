@@ -3,12 +3,14 @@
 Lead authors: Johan Mathe and Niklas Koep.
 """
 
+import functools
 import importlib
 import logging
 import os
 import sys
 import types
 
+import geomstats._backend._backend_config as _config
 import geomstats._backend._common as common
 
 
@@ -83,6 +85,7 @@ BACKEND_ATTRIBUTES = {
         "floor",
         "from_numpy",
         "gamma",
+        "gammaln",
         "get_default_dtype",
         "get_default_cdtype",
         "get_slice",
@@ -198,6 +201,7 @@ BACKEND_ATTRIBUTES = {
     ],
     "random": [
         "choice",
+        "gamma",
         "normal",
         "multivariate_normal",
         # TODO (nkoep): Remove 'rand' and replace it by 'uniform'. Much like
@@ -267,8 +271,31 @@ class BackendImporter:
                 else:
                     setattr(new_submodule, attribute_name, attribute)
 
+        new_module.set_default_dtype = self._dtype_aware_set_default_dtype(new_module)
+
         return new_module
 
+    @staticmethod
+    def _dtype_aware_set_default_dtype(module):
+        """Make default tolerances follow the default dtype.
+
+        `atol` and `rtol` of the backend module are updated each time the
+        default dtype is set.
+        """
+        set_default_dtype = module.set_default_dtype
+        tolerances = {
+            "float32": (_config.float32_atol, _config.float32_rtol),
+            "float64": (module.atol, module.rtol),
+        }
+
+        @functools.wraps(set_default_dtype)
+        def _set_default_dtype(value):
+            dtype = set_default_dtype(value)
+            module.atol, module.rtol = tolerances[value]
+            return dtype
+
+        return _set_default_dtype
+
     def find_module(self, fullname, path=None):
         """Find module."""
         if self._path != fullname:
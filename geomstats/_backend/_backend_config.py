@@ -4,6 +4,9 @@ pytorch_rtol = 1e-5
 np_atol = 1e-12
 np_rtol = 1e-6
 
+float32_atol = 1e-5
+float32_rtol = 1e-4
+
 
 DEFAULT_DTYPE = None
 DEFAULT_COMPLEX_DTYPE = None
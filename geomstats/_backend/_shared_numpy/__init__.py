@@ -408,6 +408,10 @@ def scatter_add(input, dim, index, src):
     input : array-like
         Modified input array.
     """
+    if BACKEND_NAME == "numpy" and dim in (0, 1):
+        indices = index if dim == 0 else (_np.arange(len(input))[:, None], index)
+        _np.add.at(input, indices, src)
+        return input
     if dim == 0:
         for i, val in zip(index, src):
             input[i] += val
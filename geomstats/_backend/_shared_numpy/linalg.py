@@ -23,6 +23,74 @@ _diag_vec = _np.vectorize(_np.diag, signature="(n)->(n,n)")
 _logm_vec = _cast_fout_to_input_dtype(
     target=_np.vectorize(_scipy.linalg.logm, signature="(n,m)->(n,m)")
 )
+_sqrtm_vec = _np.vectorize(_scipy.linalg.sqrtm, signature="(n,m)->(n,m)")
+_solve_sylvester_vec = _np.vectorize(
+    _scipy.linalg.solve_sylvester, signature="(m,m),(n,n),(m,n)->(m,n)"
+)
+
+EIG_COND_MAX = 1e4
+
+
+def _well_conditioned(eigvecs):
+    sing_vals = _np.linalg.svd(eigvecs, compute_uv=False)
+    return sing_vals[..., -1] * EIG_COND_MAX > sing_vals[..., 0]
+
+
+def _off_negative_real_axis(eigvals, include_zero=True):
+    if include_zero:
+        return _np.all((eigvals.real >= 0) | (eigvals.imag != 0), axis=-1)
+    return _np.all((eigvals.real > 0) | (eigvals.imag != 0), axis=-1)
+
+
+def _merge_batches(valid, result, fallback, *args):
+    """Complete batched result with fallback computed on invalid matrices."""
+    if _np.all(valid):
+        return result
+
+    fallback_result = fallback(*[arg[~valid] for arg in args])
+    out = _np.empty(
+        valid.shape + fallback_result.shape[-2:],
+        dtype=_np.result_type(result, fallback_result),
+    )
+    out[valid] = result
+    out[~valid] = fallback_result
+    return out
+
+
+def _funm_eig(x, func, include_zero, fallback):
+    """Apply a matrix function to a batch of matrices by eigendecomposition.
+
+    The principal branch of `func` is evaluated on the eigenvalues. Matrices
+    whose eigenvectors are ill-conditioned, or with eigenvalues on the
+    branch cut, are computed with `fallback`.
+
+    Parameters
+    ----------
+    x : array-like, shape=[n_mat, n, n]
+    func : callable
+        Elementwise function, e.g. `log` or `sqrt`.
+    include_zero : bool
+        Whether zero eigenvalues are allowed.
+    fallback : callable
+        Vectorized matrix function.
+    """
+    eigvals, eigvecs = _np.linalg.eig(x)
+    valid = _well_conditioned(eigvecs) & _off_negative_real_axis(
+        eigvals, include_zero=include_zero
+    )
+
+    eigvecs = eigvecs[valid]
+    result = _np.matmul(
+        eigvecs * func(eigvals[valid])[..., None, :], _np.linalg.inv(eigvecs)
+    )
+    if not _np.iscomplexobj(x):
+        result = result.real
+
+    return _merge_batches(valid, result, fallback, x)
+
+
+def _flatten_batch(x):
+    return _np.reshape(x, (-1,) + x.shape[-2:])
 
 
 def logm(x):
@@ -38,15 +106,22 @@ def logm(x):
             result = _np.matmul(eigvecs, eigvals)
             result = _np.matmul(result, transp_eigvecs)
         else:
-            result = _logm_vec(new_x)
+            result = _logm_eig(new_x)
     else:
-        result = _logm_vec(new_x)
+        result = _logm_eig(new_x)
 
     if ndim == 2:
         return result[0]
     return result
 
 
+@_cast_fout_to_input_dtype
+def _logm_eig(x):
+    flat_x = _flatten_batch(x)
+    result = _funm_eig(flat_x, _np.log, include_zero=False, fallback=_logm_vec)
+    return _np.reshape(result, x.shape)
+
+
 def solve_sylvester(a, b, q, tol=atol):
     if a.shape == b.shape:
         axes = (0, 2, 1) if a.ndim == 3 else (1, 0)
@@ -59,14 +134,53 @@ def solve_sylvester(a, b, q, tol=atol):
                 tilde_x = tilde_q / (eigvals[..., :, None] + eigvals[..., None, :])
                 return eigvecs @ tilde_x @ _np.transpose(eigvecs, axes)
 
-    return _np.vectorize(
-        _scipy.linalg.solve_sylvester, signature="(m,m),(n,n),(m,n)->(m,n)"
-    )(a, b, q)
+    batch_shape = _np.broadcast_shapes(a.shape[:-2], b.shape[:-2], q.shape[:-2])
+    a, b, q = [
+        _flatten_batch(_np.broadcast_to(mat, batch_shape + mat.shape[-2:]))
+        for mat in (a, b, q)
+    ]
+
+    eigvals_a, eigvecs_a = _np.linalg.eig(a)
+    eigvals_b, eigvecs_b = _np.linalg.eig(b)
+    denominator = eigvals_a[..., :, None] + eigvals_b[..., None, :]
+
+    scale = _np.maximum(
+        _np.max(_np.abs(eigvals_a), axis=-1), _np.max(_np.abs(eigvals_b), axis=-1)
+    )
+    valid = (
+        _well_conditioned(eigvecs_a)
+        & _well_conditioned(eigvecs_b)
+        & (_np.min(_np.abs(denominator), axis=(-2, -1)) * EIG_COND_MAX > scale)
+    )
+
+    eigvecs_a, eigvecs_b = eigvecs_a[valid], eigvecs_b[valid]
+    tilde_q = _np.linalg.solve(eigvecs_a, q[valid]) @ eigvecs_b
+    tilde_x = tilde_q / denominator[valid]
+    result = eigvecs_a @ _np.linalg.solve(
+        _np.swapaxes(eigvecs_b, -1, -2), _np.swapaxes(tilde_x, -1, -2)
+    ).swapaxes(-1, -2)
+    if not any(_np.iscomplexobj(mat) for mat in (a, b, q)):
+        result = result.real
+
+    result = _merge_batches(valid, result, _solve_sylvester_vec, a, b, q)
+    return _np.reshape(result, batch_shape + result.shape[-2:])
 
 
 @_cast_fout_to_input_dtype
 def sqrtm(x):
-    return _np.vectorize(_scipy.linalg.sqrtm, signature="(n,m)->(n,m)")(x)
+    flat_x = _flatten_batch(x)
+
+    if not _np.iscomplexobj(flat_x) and _is_symmetric(flat_x):
+        eigvals, eigvecs = _np.linalg.eigh(flat_x)
+        if (eigvals >= 0).all():
+            result = _np.matmul(
+                eigvecs * _np.sqrt(eigvals)[..., None, :],
+                _np.swapaxes(eigvecs, -1, -2),
+            )
+            return _np.reshape(result, x.shape)
+
+    result = _funm_eig(flat_x, _np.sqrt, include_zero=True, fallback=_sqrtm_vec)
+    return _np.reshape(result, x.shape)
 
 
 def quadratic_assignment(a, b, options):
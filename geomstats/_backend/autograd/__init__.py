@@ -72,7 +72,7 @@ from autograd.numpy import (
     where,
     zeros_like,
 )
-from autograd.scipy.special import erf, gamma, polygamma  # NOQA
+from autograd.scipy.special import erf, gamma, gammaln, polygamma  # NOQA
 
 from .._shared_numpy import (
     abs,
@@ -2,4 +2,11 @@
 import autograd.numpy as _np
 from autograd.numpy.random import randint, seed
 
-from .._shared_numpy.random import choice, multivariate_normal, normal, rand, uniform
+from .._shared_numpy.random import (
+    choice,
+    gamma,
+    multivariate_normal,
+    normal,
+    rand,
+    uniform,
+)
@@ -72,7 +72,7 @@ from numpy import (
     where,
     zeros_like,
 )
-from scipy.special import erf, gamma, polygamma  # NOQA
+from scipy.special import erf, gamma, gammaln, polygamma  # NOQA
 
 from .._shared_numpy import (
     abs,
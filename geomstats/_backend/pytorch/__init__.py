@@ -796,6 +796,10 @@ def gamma(a):
     return _torch.exp(_gammaln(a))
 
 
+def gammaln(a):
+    return _gammaln(a)
+
+
 def imag(a):
     if not _torch.is_tensor(a):
         a = _torch.tensor(a)
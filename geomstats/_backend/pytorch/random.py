@@ -2,6 +2,7 @@
 
 import torch as _torch
 from torch import rand, randint
+from torch.distributions.gamma import Gamma as _Gamma
 from torch.distributions.multivariate_normal import (
     MultivariateNormal as _MultivariateNormal,
 )
@@ -36,6 +37,19 @@ def uniform(low=0.0, high=1.0, size=(1,), dtype=None):
     return (high - low) * rand(*size, dtype=dtype) + low
 
 
+@_modify_func_default_dtype(copy=False, kw_only=True)
+@_allow_complex_dtype
+def gamma(shape, scale=1.0, size=None):
+    shape = _torch.as_tensor(shape, dtype=_torch.get_default_dtype())
+    scale = _torch.as_tensor(scale, dtype=shape.dtype)
+    shape, scale = _torch.broadcast_tensors(shape, scale)
+    if size is not None:
+        if not hasattr(size, "__iter__"):
+            size = (size,)
+        shape, scale = shape.expand(size), scale.expand(size)
+    return _Gamma(shape, 1.0 / scale).sample()
+
+
 @_modify_func_default_dtype(copy=False, kw_only=True)
 @_allow_complex_dtype
 def multivariate_normal(mean, cov, size=(1,)):
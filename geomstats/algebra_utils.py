@@ -4,6 +4,7 @@ import math
 import geomstats.backend as gs
 
 EPSILON = 1e-6
+FLOAT32_EPSILON = 1e-2
 COS_TAYLOR_COEFFS = [
     1.0,
     -1.0 / math.factorial(2),
@@ -133,7 +134,30 @@ def from_vector_to_diagonal_matrix(vector, num_diag=0):
     return gs.squeeze(diagonals) if gs.ndim(vector) == 1 else diagonals
 
 
-def taylor_exp_even_func(point, taylor_function, order=5, tol=EPSILON):
+def get_epsilon(dtype=None):
+    """Get threshold below which Taylor approximations are used.
+
+    In single precision, closed-form expressions such as `(1 - cos(x)) / x**2`
+    lose accuracy through cancellation much further away from zero, hence a
+    larger threshold is used.
+
+    Parameters
+    ----------
+    dtype : dtype
+        Dtype of the computation.
+        Optional, default: backend default dtype.
+
+    Returns
+    -------
+    epsilon : float
+        Threshold.
+    """
+    if dtype is None:
+        dtype = gs.get_default_dtype()
+    return FLOAT32_EPSILON if dtype == gs.float32 else EPSILON
+
+
+def taylor_exp_even_func(point, taylor_function, order=5, tol=None):
     """Taylor Approximation of an even function around zero.
 
     Parameters
@@ -151,12 +175,16 @@ def taylor_exp_even_func(point, taylor_function, order=5, tol=EPSILON):
     tol : float
         Threshold to use the approximation instead of the function's value.
         Where `abs(point) <= tol`, the approximation is returned.
+        Optional, default: `get_epsilon` for the dtype of point.
 
     Returns
     -------
     function_value: array-like
         Value of the function at point.
     """
+    if tol is None:
+        tol = get_epsilon(getattr(point, "dtype", None))
+
     approx = gs.einsum(
         "k,k...->...",
         gs.array(taylor_function["coefficients"][:order]),
@@ -1 +1,17 @@
-"""The Geometry Package."""
+"""The Geometry Package.
+
+Modules are loaded lazily, on first attribute access.
+"""
+
+import importlib
+
+
+def __getattr__(name):
+    """Import submodules lazily."""
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
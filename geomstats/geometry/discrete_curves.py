@@ -3,11 +3,11 @@
 Lead author: Alice Le Brigant.
 """
 
-import copy
+import functools
+import itertools
+import logging
 import math
 
-from scipy.interpolate import CubicSpline
-
 import geomstats.backend as gs
 from geomstats.algebra_utils import from_vector_to_diagonal_matrix
 from geomstats.geometry.base import LevelSet
@@ -18,7 +18,6 @@ from geomstats.geometry.manifold import Manifold
 from geomstats.geometry.pullback_metric import PullbackDiffeoMetric
 from geomstats.geometry.quotient_metric import QuotientMetric
 from geomstats.geometry.riemannian_metric import RiemannianMetric
-from geomstats.geometry.symmetric_matrices import SymmetricMatrices
 from geomstats.vectorization import get_batch_shape
 
 
@@ -493,6 +492,9 @@ class ClosedDiscreteCurves(LevelSet):
         The algorithm is from the paper cited above and modifies the srv
         iteratively so that G(srv) = (0, ..., 0) with the paper's notation.
 
+        The iterations run on the whole batch. Only the srvs that do not
+        satisfy the closeness criterion yet are updated.
+
         Remark: for now, the algorithm might not converge for some curves such
         as segments.
 
@@ -516,7 +518,7 @@ class ClosedDiscreteCurves(LevelSet):
         dim = self.ambient_manifold.dim
         srv_inner_prod = self.l2_curves_metric.inner_product
         srv_norm = self.l2_curves_metric.norm
-        inner_prod = self.ambient_manifold.metric.inner_product
+        ambient_norm = self.ambient_manifold.metric.norm
 
         def closeness_criterion(srv, srv_norms):
             """Compute the closeness criterion from [Sea2011]_.
@@ -531,60 +533,54 @@ class ClosedDiscreteCurves(LevelSet):
                 in IEEE Transactions on Pattern Analysis and Machine Intelligence,
                 vol. 33, no. 7, pp. 1415-1428, July 2011.
             """
-            return gs.sum(srv * srv_norms[:, None], axis=0)
+            return gs.sum(srv * srv_norms[..., None], axis=-2)
 
-        def one_srv_projection(one_srv):
-            """Project one srv by iteratively updating until closeness criterion is 0.
+        def srv_projection_step(proj, residual, initial_norm):
+            """Update a batch of srvs once towards the closeness constraint.
 
             Details can be found in [Sea2011]_ Section 4.2.
             """
-            initial_norm = srv_norm(one_srv)
-            proj = gs.copy(one_srv)
-            proj_norms = self.ambient_manifold.metric.norm(proj)
-            residual = closeness_criterion(proj, proj_norms)
-            criteria = self.ambient_manifold.metric.norm(residual)
-
-            nb_iter = 0
-
-            while criteria >= atol and nb_iter < max_iter:
-                jacobian_vec = []
-                for i in range(dim):
-                    for j in range(i, dim):
-                        coef = 3 * inner_prod(proj[:, i], proj[:, j])
-                        jacobian_vec.append(coef)
-                jacobian_vec = gs.stack(jacobian_vec)
-                g_jacobian = SymmetricMatrices.from_vector(jacobian_vec)
-
-                proj_squared_norm = srv_norm(proj) ** 2
-                g_jacobian += proj_squared_norm * gs.eye(dim)
-                beta = gs.linalg.inv(g_jacobian) @ residual
-
-                e_1, e_2 = gs.array([1, 0]), gs.array([0, 1])
-                grad_1 = proj_norms[:, None] * e_1
-                grad_1 = grad_1 + (proj[:, 0] / proj_norms)[:, None] * proj
-                grad_2 = proj_norms[:, None] * e_2
-                grad_2 = grad_2 + (proj[:, 1] / proj_norms)[:, None] * proj
-
-                basis_vector_1 = grad_1 / srv_norm(grad_1)
-                grad_2_component = srv_inner_prod(grad_2, basis_vector_1)
-                grad_2_proj = grad_2_component * basis_vector_1
-                basis_vector_2 = grad_2 - grad_2_proj
-                basis_vector_2 = basis_vector_2 / srv_norm(basis_vector_2)
-                basis = gs.array([basis_vector_1, basis_vector_2])
-
-                proj -= gs.sum(beta[:, None, None] * basis, axis=0)
-                proj = proj * initial_norm / srv_norm(proj)
-                proj_norms = self.ambient_manifold.metric.norm(proj)
-                residual = closeness_criterion(proj, proj_norms)
-                criteria = self.ambient_manifold.metric.norm(residual)
-
-                nb_iter += 1
-            return proj
-
-        if srv.ndim > 2:
-            return gs.stack([one_srv_projection(one_srv) for one_srv in srv])
-
-        return one_srv_projection(srv)
+            proj_norms = ambient_norm(proj)
+
+            g_jacobian = 3 * gs.einsum("...ki,...kj->...ij", proj, proj)
+            proj_squared_norm = srv_norm(proj) ** 2
+            g_jacobian += proj_squared_norm[..., None, None] * gs.eye(dim)
+            beta = gs.einsum("...ij,...j->...i", gs.linalg.inv(g_jacobian), residual)
+
+            e_1, e_2 = gs.array([1, 0]), gs.array([0, 1])
+            grad_1 = proj_norms[..., None] * e_1
+            grad_1 = grad_1 + (proj[..., 0] / proj_norms)[..., None] * proj
+            grad_2 = proj_norms[..., None] * e_2
+            grad_2 = grad_2 + (proj[..., 1] / proj_norms)[..., None] * proj
+
+            basis_vector_1 = grad_1 / srv_norm(grad_1)[..., None, None]
+            grad_2_component = srv_inner_prod(grad_2, basis_vector_1)
+            grad_2_proj = grad_2_component[..., None, None] * basis_vector_1
+            basis_vector_2 = grad_2 - grad_2_proj
+            basis_vector_2 = basis_vector_2 / srv_norm(basis_vector_2)[..., None, None]
+
+            proj = (
+                proj
+                - beta[..., 0, None, None] * basis_vector_1
+                - beta[..., 1, None, None] * basis_vector_2
+            )
+            return proj * (initial_norm / srv_norm(proj))[..., None, None]
+
+        shape = srv.shape
+        proj = gs.reshape(srv, (-1,) + shape[-2:])
+        initial_norm = srv_norm(proj)
+        for _ in range(max_iter):
+            residual = closeness_criterion(proj, ambient_norm(proj))
+            active = ambient_norm(residual) >= atol
+            if not gs.any(active):
+                break
+
+            proj_active = srv_projection_step(
+                proj[active], residual[active], initial_norm[active]
+            )
+            proj = gs.assignment(proj, proj_active, active)
+
+        return gs.reshape(proj, shape)
 
 
 class L2CurvesMetric(RiemannianMetric):
@@ -1481,6 +1477,323 @@ class SRVMetric(PullbackDiffeoMetric):
         return n_points * gs.matmul(mat_space_deriv, curve)
 
 
+@functools.lru_cache(maxsize=None)
+def _dp_step_kernels(max_slope):
+    """Tabulate the integrals of the dynamic programming algorithm per step.
+
+    On a subinterval where the reparametrization gamma is linear, i.e. on a
+    step `(a, b)` from `(i - a, j - b)` to `(i, j)`, the integral of
+    `srv_1(t) . srv_2(gamma(t)) |gamma'(t)|^(1/2)` splits into at most
+    `a + b - 1` pieces on which both resampled SRV functions are constant.
+    It is thus a weighted sum of the scalar products
+    `srv_1[i - max_slope + x] . srv_2[j - max_slope + y]` over the window
+    `0 <= x, y < max_slope`, with weights that only depend on `(a, b)`.
+
+    Steps are sorted by decreasing `a`, then decreasing `b`, i.e. in the scan
+    order of the starting points `(i - a, j - b)`.
+
+    Parameters
+    ----------
+    max_slope : int
+        Maximum slope allowed for a reparametrization.
+
+    Returns
+    -------
+    kernels : list, shape=[max_slope ** 2, max_slope ** 2]
+        Weight of the window position `max_slope * x + y` in the integral
+        on each step.
+    """
+    n_window = max_slope**2
+    kernels = [[0.0] * n_window for _ in range(n_window)]
+    steps = range(max_slope, 0, -1)
+    for index_step, (step_initial, step_end) in enumerate(
+        itertools.product(steps, steps)
+    ):
+        # breakpoints of both SRV functions, scaled by step_end to be integers
+        i, j = 1, 1
+        lower_bound = 0
+        while i <= step_initial and j <= step_end:
+            upper_bound = min(i * step_end, j * step_initial)
+            x_window = max_slope - step_initial + i - 1
+            y_window = max_slope - step_end + j - 1
+            kernels[max_slope * x_window + y_window][index_step] += (
+                (upper_bound - lower_bound)
+                / step_end
+                * math.sqrt(step_end / step_initial)
+            )
+
+            if i * step_end == j * step_initial:
+                i += 1
+                j += 1
+            elif i * step_end < j * step_initial:
+                i += 1
+            else:
+                j += 1
+            lower_bound = upper_bound
+
+    return kernels
+
+
+def _dp_max_scalar_product(gram, max_slope):
+    """Fill the dynamic programming table of a batch of pairs of curves.
+
+    The table is filled column by column, i.e. by increasing values of gamma.
+    All the cells of a column only depend on previous columns, so that a
+    column is computed at once for all pairs and all steps. As in [WAJ2007],
+    the first best predecessor in the scan order is kept.
+
+    Parameters
+    ----------
+    gram : array-like, shape=[n_pairs, n_discretization, n_discretization]
+        Scalar products between the resampled SRV functions of the pairs.
+    max_slope : int
+        Maximum slope allowed for a reparametrization.
+
+    Returns
+    -------
+    max_scalar_product : array-like, shape=[n_pairs]
+        n_discretization times the maximum scalar product.
+    predecessors : array-like, shape=[n_pairs, n_cells, n_cells]
+        Index of the best step leading to each cell `(j, i)`, where
+        `n_cells = n_discretization + 1`.
+    """
+    n_pairs, n_discretization = gram.shape[:2]
+    n_cells = n_discretization + 1
+    kernels = gs.array(_dp_step_kernels(max_slope), dtype=gram.dtype)
+
+    cells = gs.arange(n_cells)
+    offsets = gs.arange(max_slope**2)
+    x_offsets, y_offsets = offsets // max_slope, offsets % max_slope
+    window_rows = cells[:, None] + x_offsets
+
+    # index k of the srv functions is stored in max_slope + k
+    gram = gs.pad(gram, [[0, 0], [max_slope, 0], [max_slope, 0]])
+
+    # cells (j, i) of the table are stored in (max_slope + j, max_slope + i)
+    tableau = -math.inf * gs.ones(
+        (n_pairs, max_slope + n_cells, max_slope + n_cells), dtype=gram.dtype
+    )
+    tableau[:, max_slope, max_slope] = 0.0
+    predecessors = gs.zeros((n_pairs, n_cells, n_cells), dtype=gs.int64)
+
+    for j in range(1, n_cells):
+        windows = gs.reshape(gram[:, window_rows, j + y_offsets], (-1, max_slope**2))
+        integrals = gs.reshape(gs.matmul(windows, kernels), (n_pairs, n_cells, -1))
+        values = tableau[:, j + y_offsets, window_rows] + integrals
+
+        min_i = int(
+            max(
+                math.floor(j / max_slope),
+                n_discretization - max_slope * (n_discretization - j),
+            )
+        )
+        max_i = int(
+            min(
+                j * max_slope,
+                math.ceil(n_discretization - (n_discretization - j) * (1 / max_slope)),
+            )
+        )
+        in_band = (cells >= min_i) & (cells <= max_i)
+        tableau[:, max_slope + j, max_slope:] = gs.where(
+            in_band, gs.amax(values, axis=-1), -math.inf
+        )
+        predecessors[:, j] = gs.argmax(values, axis=-1)
+
+    return tableau[:, -1, -1], predecessors
+
+
+def _dp_backtrack(predecessors, max_slope):
+    """Recover the optimal piecewise linear reparametrizations.
+
+    Parameters
+    ----------
+    predecessors : array-like, shape=[n_pairs, n_cells, n_cells]
+        Index of the best step leading to each cell.
+    max_slope : int
+        Maximum slope allowed for a reparametrization.
+
+    Returns
+    -------
+    slope : array-like, shape=[n_pairs, n_cells]
+        Slope of the reparametrization on each subinterval.
+    constant : array-like, shape=[n_pairs, n_cells]
+        Constant of the reparametrization on each subinterval.
+    """
+    n_pairs, n_cells = predecessors.shape[:2]
+    steps = gs.arange(max_slope, 0, -1)
+    cells = gs.arange(n_cells)
+    pairs = gs.arange(n_pairs)
+
+    slope = gs.zeros((n_pairs, n_cells))
+    constant = gs.zeros((n_pairs, n_cells))
+    i_arrive = (n_cells - 1) * gs.ones(n_pairs, dtype=gs.int64)
+    j_arrive = (n_cells - 1) * gs.ones(n_pairs, dtype=gs.int64)
+    while gs.any(i_arrive > 0):
+        active = i_arrive > 0
+        step = predecessors[pairs, j_arrive, i_arrive]
+        i_depart = i_arrive - steps[step // max_slope]
+        j_depart = j_arrive - steps[step % max_slope]
+
+        gamma_slope = (j_arrive - j_depart) / (i_arrive - i_depart)
+        gamma_constant = j_depart - i_depart * gamma_slope
+        on_step = (
+            active[:, None] & (cells >= i_depart[:, None]) & (cells < i_arrive[:, None])
+        )
+        slope = gs.where(on_step, gamma_slope[:, None], slope)
+        constant = gs.where(on_step, gamma_constant[:, None], constant)
+
+        i_arrive = gs.where(active, i_depart, i_arrive)
+        j_arrive = gs.where(active, j_depart, j_arrive)
+
+    return slope, constant
+
+
+def _cubic_spline_coefficients(knots, values):
+    """Compute the coefficients of batches of cubic splines.
+
+    This is a batched counterpart of `scipy.interpolate.CubicSpline` with its
+    default not-a-knot boundary conditions, for splines that do not share
+    their knots. The tridiagonal systems giving the derivatives at the knots
+    are solved together by Gaussian elimination. The batch dimensions of the
+    inputs are broadcast against each other.
+
+    Parameters
+    ----------
+    knots : array-like, shape=[..., n_knots]
+        Increasing knots of the splines.
+    values : array-like, shape=[..., n_knots, dim]
+        Values of the splines at the knots.
+
+    Returns
+    -------
+    coefficients : array-like, shape=[..., n_knots - 1, 4, dim]
+        Coefficients of the polynomial on each interval between two knots,
+        by increasing degree, in the local coordinate starting at the left knot.
+    """
+    n_knots = knots.shape[-1]
+    d_knots = knots[..., 1:] - knots[..., :-1]
+    slope = (values[..., 1:, :] - values[..., :-1, :]) / d_knots[..., None]
+
+    if n_knots == 2:
+        derivs = gs.concatenate([slope, slope], axis=-2)
+    else:
+        zeros = gs.zeros_like(d_knots[..., :1])
+        ones = gs.ones_like(d_knots[..., :1])
+        lower = d_knots[..., 1:]
+        diag = 2 * (d_knots[..., :-1] + d_knots[..., 1:])
+        upper = d_knots[..., :-1]
+        rhs = 3 * (
+            d_knots[..., 1:, None] * slope[..., :-1, :]
+            + d_knots[..., :-1, None] * slope[..., 1:, :]
+        )
+        if n_knots == 3:
+            lower = gs.concatenate([zeros, lower, ones], axis=-1)
+            diag = gs.concatenate([ones, diag, ones], axis=-1)
+            upper = gs.concatenate([ones, upper, zeros], axis=-1)
+            rhs_start = 2 * slope[..., :1, :]
+            rhs_end = 2 * slope[..., -1:, :]
+        else:
+            width_start = knots[..., 2:3] - knots[..., :1]
+            width_end = knots[..., -1:] - knots[..., -3:-2]
+            lower = gs.concatenate([zeros, lower, width_end], axis=-1)
+            diag = gs.concatenate(
+                [d_knots[..., 1:2], diag, d_knots[..., -2:-1]], axis=-1
+            )
+            upper = gs.concatenate([width_start, upper, zeros], axis=-1)
+            rhs_start = (
+                (d_knots[..., :1] + 2 * width_start)[..., None]
+                * d_knots[..., 1:2, None]
+                * slope[..., :1, :]
+                + d_knots[..., :1, None] ** 2 * slope[..., 1:2, :]
+            ) / width_start[..., None]
+            rhs_end = (
+                d_knots[..., -1:, None] ** 2 * slope[..., -2:-1, :]
+                + (2 * width_end + d_knots[..., -1:])[..., None]
+                * d_knots[..., -2:-1, None]
+                * slope[..., -1:, :]
+            ) / width_end[..., None]
+        rhs = gs.concatenate([rhs_start, rhs, rhs_end], axis=-2)
+
+        upper_reduced = [upper[..., 0] / diag[..., 0]]
+        rhs_reduced = [rhs[..., 0, :] / diag[..., 0, None]]
+        for i in range(1, n_knots):
+            pivot = diag[..., i] - lower[..., i] * upper_reduced[-1]
+            upper_reduced.append(upper[..., i] / pivot)
+            rhs_reduced.append(
+                (rhs[..., i, :] - lower[..., i, None] * rhs_reduced[-1])
+                / pivot[..., None]
+            )
+
+        derivs = [rhs_reduced[-1]]
+        for i in range(n_knots - 2, -1, -1):
+            derivs.append(rhs_reduced[i] - upper_reduced[i][..., None] * derivs[-1])
+        derivs = gs.stack(derivs[::-1], axis=-2)
+
+    coef_2 = (3 * slope - 2 * derivs[..., :-1, :] - derivs[..., 1:, :]) / d_knots[
+        ..., None
+    ]
+    coef_3 = (derivs[..., :-1, :] + derivs[..., 1:, :] - 2 * slope) / d_knots[
+        ..., None
+    ] ** 2
+    return gs.stack(
+        [
+            gs.broadcast_to(values[..., :-1, :], coef_2.shape),
+            derivs[..., :-1, :],
+            coef_2,
+            coef_3,
+        ],
+        axis=-2,
+    )
+
+
+def _cubic_spline_evaluation(knots, coefficients, query):
+    """Evaluate batches of cubic splines.
+
+    The batch dimensions of the inputs are broadcast against each other.
+
+    Parameters
+    ----------
+    knots : array-like, shape=[..., n_knots]
+        Increasing knots of the splines.
+    coefficients : array-like, shape=[..., n_knots - 1, 4, dim]
+        Coefficients of the splines, see `_cubic_spline_coefficients`.
+    query : array-like, shape=[..., n_queries]
+        Points where to evaluate the splines. The splines are extrapolated
+        outside of the knots.
+
+    Returns
+    -------
+    interpolated : array-like, shape=[..., n_queries, dim]
+        Values of the splines at the query points.
+    """
+    indices = gs.sum(query[..., :, None] >= knots[..., None, 1:-1], axis=-1)
+    batch_shape = indices.shape[:-1]
+    n_intervals = knots.shape[-1] - 1
+    n_queries, dim = indices.shape[-1], coefficients.shape[-1]
+
+    indices = gs.reshape(indices, (-1, n_queries))
+    batch_indices = gs.arange(indices.shape[0])[:, None]
+    knots = gs.reshape(
+        gs.broadcast_to(knots[..., :-1], batch_shape + (n_intervals,)),
+        (-1, n_intervals),
+    )
+    coefficients = gs.reshape(
+        gs.broadcast_to(coefficients, batch_shape + (n_intervals, 4, dim)),
+        (-1, n_intervals, 4, dim),
+    )
+    query = gs.reshape(
+        gs.broadcast_to(query, batch_shape + (n_queries,)), (-1, n_queries)
+    )
+
+    coefficients = coefficients[batch_indices, indices]
+    step = (query - knots[batch_indices, indices])[..., None]
+    interpolated = coefficients[..., 0, :] + step * (
+        coefficients[..., 1, :]
+        + step * (coefficients[..., 2, :] + step * coefficients[..., 3, :])
+    )
+    return gs.reshape(interpolated, batch_shape + (n_queries, dim))
+
+
 class SRVShapeBundle(FiberBundle):
     """Principal bundle of shapes of curves induced by the SRV metric.
 
@@ -1660,11 +1973,18 @@ class SRVShapeBundle(FiberBundle):
         The algorithm stops when the new current_end_curve is sufficiently
         close to the former current_end_curve.
 
+        Pairs of curves are processed together, at all times at once. Only the
+        pairs that have not converged yet are updated. If the path of
+        reparametrizations of a pair stops being strictly increasing, it cannot
+        be inverted: a ValueError is raised for a single pair, while in a batch
+        a warning is logged and the horizontal geodesic of this pair only is
+        set to nan.
+
         Parameters
         ----------
-        initial_point : array-like, shape=[k_sampling_points, ambient_dim]
+        initial_point : array-like, shape=[..., k_sampling_points, ambient_dim]
             Initial discrete curve.
-        end_point : array-like, shape=[k_sampling_points, ambient_dim]
+        end_point : array-like, shape=[..., k_sampling_points, ambient_dim]
             End discrete curve.
         threshold: float
             When the difference between the new end curve and the current end
@@ -1676,10 +1996,18 @@ class SRVShapeBundle(FiberBundle):
         horizontal_path : callable
             Time parametrized horizontal geodesic.
         """
-        initial_curve, end_curve = initial_point, end_point
-        k_sampling_points = initial_curve.shape[0]
+        batch_shape = get_batch_shape(self.total_space, initial_point, end_point)
+        point_shape = initial_point.shape[-2:]
+        initial_curves = gs.reshape(
+            gs.broadcast_to(initial_point, batch_shape + point_shape),
+            (-1,) + point_shape,
+        )
+        end_curves = gs.reshape(
+            gs.broadcast_to(end_point, batch_shape + point_shape),
+            (-1,) + point_shape,
+        )
+        n_curves, k_sampling_points = initial_curves.shape[:2]
         t_space = gs.linspace(0.0, 1.0, k_sampling_points)
-        spline_end_curve = CubicSpline(t_space, end_curve, axis=0)
 
         def construct_reparametrization(vertical_norm, space_deriv_norm):
             r"""Construct path of reparametrizations.
@@ -1690,49 +2018,45 @@ class SRVShapeBundle(FiberBundle):
 
             Parameters
             ----------
-            vertical_norm: array-like, shape=[n_times, k_sampling_points]
+            vertical_norm: array-like, shape=[n_pairs, n_times - 1, k_sampling_points]
                 Pointwise norm of the vertical part of the time derivative of
                 the path of curves.
-            space_deriv_norm: array-like, shape=[n_times, k_sampling_points]
+            space_deriv_norm: array-like,
+                shape=[n_pairs, n_times - 1, k_sampling_points]
                 Pointwise norm of the space derivative of the path of curves.
 
             Returns
             -------
-            repar: array-like, shape=[n_times, k_sampling_points]
+            repar: array-like, shape=[n_pairs, n_times, k_sampling_points]
                 Path of parametrizations, such that the path of curves
                 composed with the path of parametrizations is a horizontal
                 path.
             """
-            n_times = gs.shape(vertical_norm)[0] + 1
-            repar = gs.to_ndarray(gs.linspace(0.0, 1.0, k_sampling_points), 2)
+            n_pairs, n_times = vertical_norm.shape[0], vertical_norm.shape[1] + 1
+            speed = (
+                k_sampling_points
+                * vertical_norm[..., 1:-1]
+                / space_deriv_norm[..., 1:-1]
+                / n_times
+            )
+            is_positive = vertical_norm[..., 1:-1] > 0
+            zeros = gs.zeros((n_pairs, 1), dtype=vertical_norm.dtype)
+            ones = gs.ones((n_pairs, 1), dtype=vertical_norm.dtype)
+
+            repar = [gs.broadcast_to(t_space, (n_pairs, k_sampling_points))]
             for i in range(n_times - 1):
-                repar_i = [gs.array(0.0)]
-                n_times = gs.cast(gs.array(n_times), vertical_norm.dtype)
-                for j in range(1, k_sampling_points - 1):
-                    d_repar_plus = repar[-1, j + 1] - repar[-1, j]
-                    d_repar_minus = repar[-1, j] - repar[-1, j - 1]
-                    if vertical_norm[i, j] > 0:
-                        repar_space_deriv = k_sampling_points * d_repar_plus
-                    else:
-                        repar_space_deriv = k_sampling_points * d_repar_minus
-                    repar_time_deriv = (
-                        repar_space_deriv * vertical_norm[i, j] / space_deriv_norm[i, j]
-                    )
-                    repar_i.append(repar[-1, j] + repar_time_deriv / n_times)
-                repar_i.append(gs.array(1.0))
-                repar_i = gs.to_ndarray(gs.stack(repar_i), to_ndim=2)
-                repar = gs.concatenate((repar, repar_i), axis=0)
-
-                test_repar = gs.sum(repar[-1, 2:] - repar[-1, 1:-1] < 0)
-                if gs.any(test_repar):
-                    print(
-                        "Warning: phi(t) is non increasing for at least "
-                        "one time t. Solution may be inaccurate."
-                    )
+                d_repar = repar[-1][:, 1:] - repar[-1][:, :-1]
+                repar_space_deriv = gs.where(
+                    is_positive[:, i], d_repar[:, 1:], d_repar[:, :-1]
+                )
+                repar_i = repar[-1][:, 1:-1] + repar_space_deriv * speed[:, i]
+                repar.append(gs.concatenate([zeros, repar_i, ones], axis=-1))
 
-            return repar
+            return gs.stack(repar, axis=1)
 
-        def invert_reparametrization(repar, path_of_curves, repar_inverse_end, counter):
+        def invert_reparametrization(
+            repar, path_of_curves, repar_inverse_end, spline_end_curve
+        ):
             r"""Invert path of reparametrizations.
 
             Given a path of curves c(t, u) and a path of reparametrizations
@@ -1740,48 +2064,51 @@ class SRVShapeBundle(FiberBundle):
             :math:`c(t, phi_inv(t, u))` where `phi_inv(t, .) = phi(t, .)^{-1}`
             The computation for the last time t=1 is done differently, using
             the spline function associated to the end curve and the composition
-            of the inverse reparametrizations contained in rep_inverse_end:
+            of the inverse reparametrizations contained in repar_inverse_end:
             :math:`spline_end_curve ° phi_inv(1, .) ° ... ° phi_inv(0, .)`.
 
             Parameters
             ----------
-            repar: array-like, shape=[n_times, k_sampling_points]
+            repar: array-like, shape=[n_pairs, n_times, k_sampling_points]
                 Path of reparametrizations.
             path_of_curves: array-like,
-                shape=[n_times, k_sampling_points, ambient_dim]
+                shape=[n_pairs, n_times, k_sampling_points, ambient_dim]
                 Path of curves.
             repar_inverse_end: list
-                List of the inverses of the reparametrizations applied to
-                the end curve during the optimal matching algorithm.
-            counter: int
-                Counter associated to the steps of the optimal matching
-                algorithm.
+                Knots and spline coefficients of the inverses of the
+                reparametrizations applied to the end curve during the optimal
+                matching algorithm.
+            spline_end_curve: array-like,
+                shape=[n_pairs, k_sampling_points - 1, 4, ambient_dim]
+                Spline coefficients of the end curve.
 
             Returns
             -------
             reparametrized_path: array-like,
-                shape=[n_times, k_sampling_points, ambient_dim]
+                shape=[n_pairs, n_times, k_sampling_points, ambient_dim]
                 Path of curves composed with the inverse of the path of
                 reparametrizations.
             """
-            n_times = repar.shape[0]
-            initial_curve = path_of_curves[0]
-            reparametrized_path = [initial_curve]
-            for i in range(1, n_times - 1):
-                spline = CubicSpline(t_space, path_of_curves[i], axis=0)
-                repar_inverse = CubicSpline(repar[i], t_space)
-                curve_repar = gs.from_numpy(spline(repar_inverse(t_space)))
-                curve_repar = gs.cast(curve_repar, repar.dtype)
-                reparametrized_path.append(curve_repar)
-
-            repar_inverse_end.append(CubicSpline(repar[-1, :], t_space))
+            repar_inverse = _cubic_spline_evaluation(
+                repar[:, 1:-1],
+                _cubic_spline_coefficients(repar[:, 1:-1], t_space[:, None]),
+                t_space,
+            )[..., 0]
+            path_repar = _cubic_spline_evaluation(
+                t_space,
+                _cubic_spline_coefficients(t_space, path_of_curves[:, 1:-1]),
+                repar_inverse,
+            )
+
             arg = t_space
-            for i in range(counter + 1):
-                arg = repar_inverse_end[-1 - i](arg)
-            end_curve_repar = gs.from_numpy(spline_end_curve(arg))
-            end_curve_repar = gs.cast(end_curve_repar, repar.dtype)
-            reparametrized_path.append(end_curve_repar)
-            return gs.stack(reparametrized_path)
+            for knots, coefficients in reversed(repar_inverse_end):
+                arg = _cubic_spline_evaluation(knots, coefficients, arg)[..., 0]
+            end_curve_repar = _cubic_spline_evaluation(t_space, spline_end_curve, arg)
+
+            return gs.concatenate(
+                [path_of_curves[:, :1], path_repar, end_curve_repar[:, None]],
+                axis=1,
+            )
 
         def horizontal_path(t):
             """Generate parametrized function for horizontal geodesic.
@@ -1792,48 +2119,187 @@ class SRVShapeBundle(FiberBundle):
                 Times at which to compute points of the horizontal geodesic.
             """
             n_times = len(t)
-            current_end_curve = gs.copy(end_curve)
-            repar_inverse_end = []
-            gap = 1.0
-            counter = 0
+            ambient_norm = self.total_space.ambient_manifold.metric.norm
 
-            while gap > threshold:
-                srv_geod_fun = self.total_space.metric.geodesic(
-                    initial_point=initial_curve, end_point=current_end_curve
-                )
-                geod = srv_geod_fun(t)
+            horizontal_paths = gs.zeros(
+                (n_curves, n_times) + point_shape, dtype=initial_curves.dtype
+            )
+            current_end_curves = gs.copy(end_curves)
+            spline_end_curves = _cubic_spline_coefficients(t_space, end_curves)
+
+            identity = gs.broadcast_to(t_space, (n_curves, k_sampling_points))
+            spline_identity = _cubic_spline_coefficients(identity, t_space[:, None])
+            repar_inverse_end = []
 
-                time_deriv = n_times * (geod[1:] - geod[:-1])
+            active = gs.ones(n_curves, dtype=bool)
+            failed = gs.zeros(n_curves, dtype=bool)
+            while gs.any(active):
+                initial_curves_active = initial_curves[active]
+                current_end_curves_active = current_end_curves[active]
+                geod = self.total_space.metric.geodesic(
+                    initial_point=initial_curves_active,
+                    end_point=current_end_curves_active,
+                )(t)
+                geod = gs.reshape(geod, (-1, n_times) + point_shape)
+
+                time_deriv = n_times * (geod[:, 1:] - geod[:, :-1])
                 _, vertical_norm = self.vertical_projection(
-                    time_deriv, geod[:-1], return_norm=True
+                    gs.reshape(time_deriv, (-1,) + point_shape),
+                    gs.reshape(geod[:, :-1], (-1,) + point_shape),
+                    return_norm=True,
                 )
-
-                space_deriv = SRVMetric.space_derivative(geod)
-                space_deriv_norm = self.total_space.ambient_manifold.metric.norm(
-                    space_deriv
+                vertical_norm = gs.reshape(
+                    vertical_norm, (-1, n_times - 1, k_sampling_points)
                 )
 
-                repar = construct_reparametrization(vertical_norm, space_deriv_norm)
+                space_deriv = SRVMetric.space_derivative(geod[:, :-1])
+                space_deriv_norm = ambient_norm(space_deriv)
 
-                horizontal_path = invert_reparametrization(
-                    repar, geod, repar_inverse_end, counter
+                repar = construct_reparametrization(vertical_norm, space_deriv_norm)
+                is_increasing = gs.all(
+                    repar[:, 1:, 1:] > repar[:, 1:, :-1], axis=(-2, -1)
                 )
+                if not gs.all(is_increasing):
+                    if not batch_shape:
+                        raise ValueError(
+                            "The reparametrizations must be strictly increasing "
+                            "to be inverted."
+                        )
+                    logging.warning(
+                        "The reparametrizations of %d pair(s) of curves are not "
+                        "strictly increasing and cannot be inverted. Their "
+                        "horizontal geodesics are set to nan.",
+                        int(gs.sum(~is_increasing)),
+                    )
+                    failed = gs.assignment(failed, ~is_increasing, active)
+                    active = gs.assignment(active, is_increasing, active)
+                    continue
 
-                new_end_curve = horizontal_path[-1]
-                gap = (
-                    gs.sum(
-                        gs.linalg.norm(new_end_curve - current_end_curve, axis=-1) ** 2
+                repar_end = repar[:, -1]
+                spline_repar_end = _cubic_spline_coefficients(
+                    repar_end, t_space[:, None]
+                )
+                repar_inverse_end.append(
+                    (
+                        gs.assignment(identity, repar_end, active),
+                        gs.assignment(spline_identity, spline_repar_end, active),
                     )
+                )
+
+                horizontal_paths_active = invert_reparametrization(
+                    repar,
+                    geod,
+                    [
+                        (knots[active], coefficients[active])
+                        for knots, coefficients in repar_inverse_end
+                    ],
+                    spline_end_curves[active],
+                )
+
+                new_end_curves = horizontal_paths_active[:, -1]
+                gap = gs.sum(
+                    ambient_norm(new_end_curves - current_end_curves_active) ** 2,
+                    axis=-1,
                 ) ** (1 / 2)
-                current_end_curve = gs.copy(new_end_curve)
 
-                counter += 1
-            return horizontal_path
+                horizontal_paths = gs.assignment(
+                    horizontal_paths, horizontal_paths_active, active
+                )
+                current_end_curves = gs.assignment(
+                    current_end_curves, new_end_curves, active
+                )
+                # diverging pairs are stopped so that they do not break the batch
+                is_active = gs.logical_and(gap > threshold, gap < math.inf)
+                active = gs.assignment(active, is_active, active)
+
+            horizontal_paths = gs.where(
+                failed[:, None, None, None], math.nan, horizontal_paths
+            )
+            return gs.reshape(horizontal_paths, batch_shape + (n_times,) + point_shape)
 
         return horizontal_path
 
-    def _dynamic_programming_single(
-        self, initial_curve, end_curve, n_discretization=100, max_slope=6
+    def _srv_function_resampled(self, point, n_discretization, tol=gs.atol):
+        """Compute SRV function of discrete curves and resample it.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., k_sampling_points, ambient_dim]
+            Discrete curve.
+        n_discretization : int
+            Number of samples of the SRV function.
+
+        Returns
+        -------
+        srv : array-like, shape=[..., n_discretization, ambient_dim]
+            SRV function of the curve at the right size.
+        """
+        ambient_metric = self.total_space.ambient_manifold.metric
+        if gs.any(ambient_metric.norm(point[..., 1:, :] - point[..., :-1, :]) < tol):
+            raise AssertionError(
+                "The square root velocity framework "
+                "is only defined for discrete curves "
+                "with distinct consecutive sample points."
+            )
+        k_sampling_point = point.shape[-2] - 1
+        velocity = k_sampling_point * (point[..., 1:, :] - point[..., :-1, :])
+        square_root_velocity = gs.sqrt(gs.sum(gs.abs(velocity), axis=-1))
+        srv = velocity / square_root_velocity[..., None]
+
+        indices = gs.cast(
+            gs.floor(
+                gs.arange(n_discretization) * (k_sampling_point / n_discretization)
+            ),
+            gs.int64,
+        )
+        return srv[..., indices, :]
+
+    @staticmethod
+    def _reparametrize_piecewise_linear(curve, slope, constant, n_discretization):
+        """Reparametrize curves by piecewise linear reparametrizations.
+
+        Parameters
+        ----------
+        curve : array-like, shape=[n_curves, k_sampling_points, ambient_dim]
+            Discrete curves.
+        slope : array-like, shape=[n_curves, n_discretization + 1]
+            Slope of the reparametrization on each subinterval.
+        constant : array-like, shape=[n_curves, n_discretization + 1]
+            Constant of the reparametrization on each subinterval.
+        n_discretization : int
+            Number of subintervals in which the reparametrization is linear.
+
+        Returns
+        -------
+        new_curve : array-like, shape=[n_curves, k_sampling_points, ambient_dim]
+            Curves reparametrized.
+        """
+        k_sampling_point = curve.shape[-2] - 1
+        batch_indices = gs.arange(curve.shape[0])[:, None]
+
+        times = n_discretization * gs.arange(1, k_sampling_point) / k_sampling_point
+        indices_n = gs.cast(gs.floor(times), gs.int64)
+        gamma = times * slope[:, indices_n] + constant[:, indices_n]
+        gamma = k_sampling_point * gamma / n_discretization
+        indices_k = gs.cast(gs.floor(gamma), gs.int64)
+        alpha = (gamma - indices_k)[..., None]
+
+        inner_curve = (
+            curve[batch_indices, indices_k] * (1 - alpha)
+            + curve[batch_indices, indices_k + 1] * alpha
+        )
+        return gs.concatenate(
+            [curve[:, :1], inner_curve, curve[:, -1:]],
+            axis=-2,
+        )
+
+    def _dynamic_programming(
+        self,
+        initial_curve,
+        end_curve,
+        n_discretization=100,
+        max_slope=6,
+        chunk_size=256,
     ):
         r"""Compute the dynamic programming algorithm.
 
@@ -1853,11 +2319,13 @@ class SRVShapeBundle(FiberBundle):
         :math: '\left[\frac{i}{n},\frac{i+1}{n}\right]' of :math: '\left[0,1\right]',
         gamma is linear.
 
+        Pairs of curves are processed together, by chunks of `chunk_size`.
+
         Inputs
         ----------
-        intial_curve : array-like, shape=[k_sampling_points, ambient_dim]
+        intial_curve : array-like, shape=[..., k_sampling_points, ambient_dim]
             Initial discrete curve.
-        end_curve : array-like, shape=[k_sampling_points, ambient_dim]
+        end_curve : array-like, shape=[..., k_sampling_points, ambient_dim]
             End discrete curve.
         n_discretization : int
             Number of subintervals in which the reparametrization is linear.
@@ -1865,291 +2333,79 @@ class SRVShapeBundle(FiberBundle):
         max_slope : int
             Maximum slope allowed for a reparametrization.
             Optional, default: 6.
-
+        chunk_size : int
+            Maximum number of pairs of curves processed at once.
+            Optional, default: 256.
 
         Outputs
         -------
-        geodesic: callable
-            Time parametrized geodesic.
-        dist : float
-            Quotient distance between intial_curve and end_curve.
+        results : dict,
+            keys : "geodesics" and "distances".
 
         References
         ----------
         [WAJ2007] M. Washington, S. Anuj & H. Joshi,
         "On Shape of Plane Elastic Curves", in International Journal of Computer
         Vision. 73(3):307-324, 2007.
-
         """
-
-        def srv_function_resampled(point, tol=gs.atol):
-            """Compute SRV function of a discrete curve and resample it.
-
-            Inputs
-            ----------
-            point : array , shape=[k_sampling_points, ambient_dim]
-                Discrete curve.
-
-            Outputs
-            -------
-            srv : array , shape=[n_discretization, ambient_dim]
-                SRV function of the curve at the right size.
-            """
-            ambient_metric = self.total_space.ambient_manifold.metric
-            if gs.any(
-                ambient_metric.norm(point[..., 1:, :] - point[..., :-1, :]) < tol
-            ):
-                raise AssertionError(
-                    "The square root velocity framework "
-                    "is only defined for discrete curves "
-                    "with distinct consecutive sample points."
-                )
-            k_sampling_point = point.shape[-2] - 1
-            velocity = k_sampling_point * (point[1:, :] - point[:-1, :])
-            square_root_velocity = gs.sqrt(gs.sum(gs.abs(velocity), axis=-1))
-            _srv = gs.array([i / j for (i, j) in zip(velocity, square_root_velocity)])
-            srv = gs.array(
-                [
-                    _srv[int(gs.floor(i * (k_sampling_point / n_discretization)))]
-                    for i in range(n_discretization)
-                ]
-            )
-
-            return srv
-
-        def reparametrize(curve, gamma):
-            """Reparametrize curve by gamma.
-
-            Inputs
-            ----------
-            curve : array , shape=[k_sampling_points, ambient_dim]
-                Discrete curve.
-            gamma : array, shape=[n_subinterval]
-                Parametrization of a curve.
-
-
-            Outputs
-            -------
-            new_curve : array , shape=[k_sampling_points, ambient_dim]
-                Curve reparametrized by gamma.
-
-            """
-            k_sampling_point = curve.shape[-2] - 1
-            new_curve = gs.zeros(curve.shape, dtype=float)
-            n_subinterval = len(gamma)
-            list_gamma_slope = gs.zeros(n_discretization + 1, dtype=float)
-            list_gamma_constant = gs.zeros(n_discretization + 1, dtype=float)
-
-            new_curve[0] = curve[0]
-            new_curve[-1] = curve[-1]
-
-            for k in range(1, n_subinterval):
-                (i_depart, j_depart) = gamma[k - 1]
-                (i_arrive, j_arrive) = gamma[k]
-                gamma_slope = (j_arrive - j_depart) / (i_arrive - i_depart)
-                gamma_constant = j_depart - i_depart * gamma_slope
-
-                for i in range(i_depart, i_arrive):
-                    list_gamma_slope[i] = gamma_slope
-                    list_gamma_constant[i] = gamma_constant
-
-            for k in range(1, k_sampling_point):
-                indice_n = int(gs.floor(n_discretization * k / k_sampling_point))
-                gamma_indice_n = (
-                    n_discretization * k / k_sampling_point
-                ) * list_gamma_slope[indice_n] + list_gamma_constant[indice_n]
-                gamma_indice_k = k_sampling_point * gamma_indice_n / n_discretization
-                indice_k = int(gs.floor(gamma_indice_k))
-                alpha = gamma_indice_k - indice_k
-
-                new_curve[k] = (
-                    curve[indice_k] * (1 - alpha) + curve[indice_k + 1] * alpha
-                )
-
-            return new_curve
-
-        def compute_integral_restricted(srv_1, srv_2, x_min, x_max, y_min, y_max):
-            r"""Compute the value of an integral over a subinterval.
-
-            Compute n * the value of the integral of
-            .. math::
-            srv_1(t)\cdotsrv_2(\gamma(t))\cdot|\gamma(t)|^\frac{1}{2}
-            over :math: '\left[\x_min,x_max\right]' where gamma restricted to
-            :math: '\left[\x_min,x_max\right]' is a linear.
-
-            Inputs
-            ----------
-            srv_1 : array , shape=[n, ambient_dim]
-                SRV function of the initial curve.
-            srv_2 : array, shape=[n, ambient_dim]
-                SRV function of the end curve.
-            x_min : int
-                Beginning of the subinterval.
-            x_max : int
-                End of the subinterval.
-            y_min : int
-                Value of gamma at x_min.
-            y_max : int
-                Value of gamma at x_max.
-
-
-            Outputs
-            -------
-            value : float
-                Value of the integral described above.
-            """
-            gamma_slope = (y_max - y_min) / (x_max - x_min)
-
-            list_l = list(range(x_min, x_max + 1))
-            list_k = [
-                (k - y_min) / gamma_slope + x_min for k in range(y_min, y_max + 1)
-            ]
-
-            lower_bound = x_min
-            i = 1
-            j = 1
-
-            value = 0.0
-            while i < x_max - x_min + 1 and j < y_max - y_min + 1:
-                upper_bound = min(list_l[i], list_k[j])
-                lenght = upper_bound - lower_bound
-                value += lenght * gs.dot(srv_1[x_min + i - 1], srv_2[y_min + j - 1])
-
-                if list_l[i] == list_k[j]:
-                    i += 1
-                    j += 1
-                elif list_l[i] < list_k[j]:
-                    i += 1
-                else:
-                    j += 1
-                lower_bound = upper_bound
-
-            value = math.pow(gamma_slope, 1 / 2) * value
-
-            return value
-
-        initial_srv = srv_function_resampled(initial_curve)
-        end_srv = srv_function_resampled(end_curve)
-
-        norm_squared_initial_srv = (
-            compute_integral_restricted(
-                initial_srv, initial_srv, 0, n_discretization, 0, n_discretization
-            )
-            / n_discretization
+        batch_shape = get_batch_shape(self.total_space, initial_curve, end_curve)
+        point_shape = initial_curve.shape[-2:]
+        initial_curves = gs.reshape(
+            gs.broadcast_to(initial_curve, batch_shape + point_shape),
+            (-1,) + point_shape,
         )
-        norm_squared_end_srv = (
-            compute_integral_restricted(
-                end_srv, end_srv, 0, n_discretization, 0, n_discretization
-            )
-            / n_discretization
+        end_curves = gs.reshape(
+            gs.broadcast_to(end_curve, batch_shape + point_shape),
+            (-1,) + point_shape,
         )
 
-        tableau = (-1.0) * gs.ones((n_discretization + 1, n_discretization + 1))
-        tableau[0, 0] = 0.0
-        gamma = {(0, 0): [(0, 0)]}
-        for j in range(1, n_discretization + 1):
-            min_i = int(
-                max(
-                    gs.floor(j / max_slope),
-                    n_discretization - max_slope * (n_discretization - j),
+        initial_srv = self._srv_function_resampled(initial_curves, n_discretization)
+        end_srv = self._srv_function_resampled(end_curves, n_discretization)
+
+        maximum_scalar_product = []
+        end_curves_reparametrized = []
+        for start in range(0, initial_curves.shape[0], chunk_size):
+            chunk = slice(start, start + chunk_size)
+            gram = gs.einsum("...id,...jd->...ij", initial_srv[chunk], end_srv[chunk])
+            scalar_product, predecessors = _dp_max_scalar_product(gram, max_slope)
+            slope, constant = _dp_backtrack(predecessors, max_slope)
+
+            maximum_scalar_product.append(scalar_product / n_discretization)
+            end_curves_reparametrized.append(
+                self._reparametrize_piecewise_linear(
+                    end_curves[chunk], slope, constant, n_discretization
                 )
             )
-            max_i = int(
-                min(
-                    j * max_slope,
-                    gs.ceil(
-                        n_discretization - (n_discretization - j) * (1 / max_slope)
-                    ),
-                )
-            )
-            for i in range(min_i, max_i + 1):
-                minimum_column_index = int(max(0, i - max_slope))
-                minimum_line_index = int(max(0, j - max_slope))
-                for m in range(minimum_column_index, i):
-                    for k in range(minimum_line_index, j):
-                        if tableau[k, m] != -1:
-                            new_value = tableau[k, m] + compute_integral_restricted(
-                                initial_srv, end_srv, m, i, k, j
-                            )
-
-                            if tableau[j, i] < new_value:
-                                tableau[j, i] = new_value
-                                new_gamma = copy.deepcopy(gamma[(m, k)])
-                                new_gamma.append((i, j))
-                                gamma[(i, j)] = new_gamma
-
-        maximum_scalar_product = (
-            tableau[(n_discretization, n_discretization)] / n_discretization
-        )
-
-        dist_squared = (
-            norm_squared_initial_srv + norm_squared_end_srv - 2 * maximum_scalar_product
-        )
-
-        distance = gs.sqrt(dist_squared)
-
-        end_curve_reparametrized = reparametrize(
-            end_curve, gamma[(n_discretization, n_discretization)]
-        )
-
-        geodesic = self.total_space.metric.geodesic(
-            initial_curve, end_curve_reparametrized
-        )
-
-        return {"geodesic": geodesic, "distance": distance}
-
-    def _dynamic_programming(
-        self, initial_curve, end_curve, n_discretization=100, max_slope=6
-    ):
-        """Vectorize the dynamic programming algorithm.
-
-        Inputs
-        ----------
-        intial_curve : array-like, shape=[k_sampling_points, ambient_dim]
-            Initial discrete curve.
-        end_curve : array-like, shape=[k_sampling_points, ambient_dim]
-            End discrete curve.
-        n_discretization : int
-            Number of subintervals in which the reparametrization is linear.
-            Optinal, default: 100.
-        max_slope : int
-            Maximum slope allowed for a reparametrization.
-            Optional, default: 6.
-
-
-        Outputs
-        -------
-        results : dict,
-            keys : "geodesics" and "distances".
-        """
-        point_ndim = gs.ndim(initial_curve)
-        results = {"geodesics": [], "distances": []}
-
-        if point_ndim == 2:
-            dp = self._dynamic_programming_single(
-                initial_curve, end_curve, n_discretization, max_slope
-            )
-            results["geodesics"] = dp["geodesic"]
-            results["distances"] = dp["distance"]
-            return results
-
-        initial_curves = gs.to_ndarray(initial_curve, to_ndim=3)
-        end_curves = gs.to_ndarray(end_curve, to_ndim=3)
-        n_points = initial_curves.shape[0]
-        geodesics = gs.zeros(n_points, dtype=object)
-        distances = gs.zeros(n_points, dtype=float)
-
-        for i in range(n_points):
-            dp = self._dynamic_programming_single(
-                initial_curves[i], end_curves[i], n_discretization, max_slope
-            )
-            geodesics[i] = dp["geodesic"]
-            distances[i] = dp["distance"]
 
-        results["geodesics"] = geodesics
-        results["distances"] = distances
+        maximum_scalar_product = gs.concatenate(maximum_scalar_product)
+        end_curves_reparametrized = gs.concatenate(end_curves_reparametrized)
 
-        return results
+        norm_squared_initial_srv = gs.sum(initial_srv**2, axis=(-2, -1))
+        norm_squared_end_srv = gs.sum(end_srv**2, axis=(-2, -1))
+        dist_squared = (
+            norm_squared_initial_srv + norm_squared_end_srv
+        ) / n_discretization - 2 * maximum_scalar_product
+        distances = gs.sqrt(gs.maximum(dist_squared, 0.0))
+
+        metric = self.total_space.metric
+        if not batch_shape:
+            return {
+                "geodesics": metric.geodesic(
+                    initial_curves[0], end_curves_reparametrized[0]
+                ),
+                "distances": distances[0],
+            }
+
+        geodesics = gs.zeros(distances.shape[0], dtype=object)
+        for i, (initial_curve_, end_curve_) in enumerate(
+            zip(initial_curves, end_curves_reparametrized)
+        ):
+            geodesics[i] = metric.geodesic(initial_curve_, end_curve_)
+
+        return {
+            "geodesics": gs.reshape(geodesics, batch_shape),
+            "distances": gs.reshape(distances, batch_shape),
+        }
 
     def horizontal_geodesic(
         self,
@@ -2202,9 +2458,9 @@ class SRVShapeBundle(FiberBundle):
 
         Parameters
         ----------
-        point : array-like, shape=[k_sampling_points, ambient_dim]
+        point : array-like, shape=[..., k_sampling_points, ambient_dim]
             Discrete curve.
-        base_point : array-like, shape=[k_sampling_points, ambient_dim]
+        base_point : array-like, shape=[..., k_sampling_points, ambient_dim]
             Discrete curve.
         threshold: float
             Threshold to use in the algorithm to compute the horizontal geodesic.
@@ -2212,7 +2468,7 @@ class SRVShapeBundle(FiberBundle):
 
         Returns
         -------
-        reparametrized_curve : array-like, shape=[k_sampling_points, ambient_dim]
+        reparametrized_curve : array-like, shape=[..., k_sampling_points, ambient_dim]
             Optimal reparametrization of the curve represented by point.
         """
         horizontal_path = self.horizontal_geodesic(
@@ -2220,7 +2476,7 @@ class SRVShapeBundle(FiberBundle):
         )
         times = gs.linspace(0.0, 1.0, n_times)
         hor_path = horizontal_path(times)
-        return hor_path[-1]
+        return hor_path[..., -1, :, :]
 
 
 class SRVQuotientMetric(QuotientMetric):
@@ -2272,9 +2528,9 @@ class SRVQuotientMetric(QuotientMetric):
 
         Parameters
         ----------
-        point_a : array-like, shape=[k_sampling_points, ambient_dim]
+        point_a : array-like, shape=[..., k_sampling_points, ambient_dim]
             Discrete curve.
-        point_b : array-like, shape=[k_sampling_points, ambient_dim]
+        point_b : array-like, shape=[..., k_sampling_points, ambient_dim]
             Discrete curve.
         method : str, {"iterative horizontal projection", "dynamic programming"}
             Type of method to use.
@@ -2294,7 +2550,7 @@ class SRVQuotientMetric(QuotientMetric):
 
         Returns
         -------
-        quotient_dist : float
+        quotient_dist : array-like, shape=[...]
             Quotient distance between the two curves represented by point_a and point_b.
         """
         if method == "iterative horizontal projection":
@@ -2304,12 +2560,12 @@ class SRVQuotientMetric(QuotientMetric):
             times = gs.linspace(0.0, 1.0, n_times)
             horizontal_geod = horizontal_path(times)
             horizontal_geod_velocity = n_times * (
-                horizontal_geod[:-1] - horizontal_geod[1:]
+                horizontal_geod[..., :-1, :, :] - horizontal_geod[..., 1:, :, :]
             )
             velocity_norms = self.fiber_bundle.total_space.metric.norm(
-                horizontal_geod_velocity, horizontal_geod[:-1]
+                horizontal_geod_velocity, horizontal_geod[..., :-1, :, :]
             )
-            return gs.sum(velocity_norms) / n_times
+            return gs.sum(velocity_norms, axis=-1) / n_times
 
         if method == "dynamic programming":
             results = self.fiber_bundle._dynamic_programming(
@@ -2,8 +2,6 @@
 
 Lead authors: Emmanuel Hartman, Adele Myers.
 """
-import math
-
 import geomstats.backend as gs
 from geomstats.geometry.euclidean import Euclidean
 from geomstats.geometry.manifold import Manifold
@@ -11,6 +9,89 @@ from geomstats.geometry.riemannian_metric import RiemannianMetric
 from geomstats.numerics.optimizers import ScipyMinimize
 
 
+class _MeshTopology:
+    """Connectivity of a triangulated surface.
+
+    Everything that only depends on the faces is computed once. Operators
+    whose values depend on the geometry, such as the vertex areas or the
+    mesh Laplacian, are then applied as sparse matrix-vector products, i.e.
+    a gather of per-face values followed by a scatter-add onto the vertices,
+    in O(n_faces).
+
+    Parameters
+    ----------
+    faces : integer array-like, shape=[n_faces, 3]
+        Triangulation of the surface.
+    n_vertices : int
+        Number of vertices.
+    """
+
+    def __init__(self, faces, n_vertices):
+        self.n_vertices = n_vertices
+        self.corners = tuple(faces[:, i] for i in range(3))
+
+        # incidence between vertices and the corners of the faces,
+        # listed face by face
+        self.corner_vertices = gs.flatten(faces)
+
+        # sparsity pattern of the mesh Laplacian: the value on the corner
+        # opposite to an edge (j, i) of a face acts from j onto i
+        self.laplacian_cols = gs.flatten(faces[:, [1, 2, 0]])
+        self.laplacian_rows = gs.flatten(faces[:, [2, 0, 1]])
+
+    def face_vertices(self, point):
+        """Gather the coordinates of the vertices of each face.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., n_vertices, 3]
+
+        Returns
+        -------
+        vertices : tuple of vertex_0, vertex_1, vertex_2 where:
+            vertex_i : array-like, shape=[..., n_faces, 3]
+        """
+        return tuple(point[..., index, :] for index in self.corners)
+
+    def scatter(self, values, index):
+        """Sum values onto the vertices.
+
+        Parameters
+        ----------
+        values : array-like, shape=[..., n_values]
+        index : array-like, shape=[n_values]
+            Vertex receiving each value.
+
+        Returns
+        -------
+        vertex_values : array-like, shape=[..., n_vertices]
+        """
+        batch_shape = values.shape[:-1]
+        values = gs.reshape(values, (-1, values.shape[-1]))
+        vertex_values = gs.scatter_add(
+            gs.zeros((values.shape[0], self.n_vertices), dtype=values.dtype),
+            dim=1,
+            index=gs.broadcast_to(index, values.shape),
+            src=values,
+        )
+        return gs.reshape(vertex_values, batch_shape + (self.n_vertices,))
+
+    def scatter_vectors(self, values, index):
+        """Sum vector values onto the vertices.
+
+        Parameters
+        ----------
+        values : array-like, shape=[..., n_values, 3]
+        index : array-like, shape=[n_values]
+            Vertex receiving each value.
+
+        Returns
+        -------
+        vertex_values : array-like, shape=[..., n_vertices, 3]
+        """
+        return gs.moveaxis(self.scatter(gs.moveaxis(values, -1, -2), index), -1, -2)
+
+
 class DiscreteSurfaces(Manifold):
     r"""Space of parameterized discrete surfaces.
 
@@ -44,6 +125,7 @@ class DiscreteSurfaces(Manifold):
         self.n_faces = len(faces)
         self.n_vertices = int(gs.amax(self.faces) + 1)
         self.shape = (self.n_vertices, ambient_dim)
+        self._topology = _MeshTopology(faces, self.n_vertices)
         super().__init__(
             dim=self.n_vertices * ambient_dim,
             shape=(self.n_vertices, 3),
@@ -173,20 +255,7 @@ class DiscreteSurfaces(Manifold):
             vertex_i : array-like, shape=[..., n_faces, 3]
                 3D coordinates of the ith vertex of that face.
         """
-        vertex = []
-        for i in range(3):
-            if point.ndim == 2:
-                vertex_i = [point[index, :] for index in self.faces[:, i]]
-            if point.ndim == 3:
-                vertex_i = [point[:, index, :] for index in self.faces[:, i]]
-            vertex.append(gs.stack(vertex_i, axis=-2))
-        vertex_0, vertex_1, vertex_2 = vertex
-
-        if point.ndim == 3 and vertex_0.ndim == 2:
-            vertex_0 = gs.expand_dims(vertex_0, axis=0)
-            vertex_1 = gs.expand_dims(vertex_1, axis=0)
-            vertex_2 = gs.expand_dims(vertex_2, axis=0)
-        return vertex_0, vertex_1, vertex_2
+        return self._topology.face_vertices(point)
 
     def _triangle_areas(self, point):
         """Compute triangle areas for each face of the surface.
@@ -236,23 +305,11 @@ class DiscreteSurfaces(Manifold):
         vertex_areas :  array-like, shape=[..., n_vertices, 1]
             Vertex area for each vertex.
         """
-        batch_shape = point.shape[:-2]
-        n_vertices = point.shape[-2]
-        n_faces = self.faces.shape[0]
         area = self._triangle_areas(point)
-        id_vertices = gs.broadcast_to(
-            gs.flatten(self.faces), batch_shape + (math.prod(self.faces.shape),)
+        incident_areas = self._topology.scatter(
+            gs.repeat(area, 3, axis=-1), self._topology.corner_vertices
         )
-        incident_areas = gs.zeros(batch_shape + (n_vertices,))
-        val = gs.reshape(
-            gs.broadcast_to(gs.expand_dims(area, axis=-2), batch_shape + (3, n_faces)),
-            batch_shape + (-1,),
-        )
-        incident_areas = gs.scatter_add(
-            incident_areas, dim=len(batch_shape), index=id_vertices, src=val
-        )
-        vertex_areas = 2 * incident_areas / 3.0
-        return vertex_areas
+        return 2 * incident_areas / 3.0
 
     def normals(self, point):
         """Compute normals at each face of a triangulated surface.
@@ -381,7 +438,7 @@ class DiscreteSurfaces(Manifold):
             Function that evaluates the mesh Laplacian operator at a
             tangent vector field to the surface.
         """
-        n_vertices, n_faces = point.shape[-2], self.faces.shape[0]
+        topology = self._topology
         vertex_0, vertex_1, vertex_2 = self._vertices(point)
         len_edge_12 = gs.linalg.norm((vertex_1 - vertex_2), axis=-1)
         len_edge_02 = gs.linalg.norm((vertex_0 - vertex_2), axis=-1)
@@ -404,13 +461,8 @@ class DiscreteSurfaces(Manifold):
         cot_12 = (sq_len_edge_02 + sq_len_edge_01 - sq_len_edge_12) / area
         cot_02 = (sq_len_edge_12 + sq_len_edge_01 - sq_len_edge_02) / area
         cot_01 = (sq_len_edge_12 + sq_len_edge_02 - sq_len_edge_01) / area
-        cot = gs.stack([cot_12, cot_02, cot_01], axis=1)
-        cot /= 2.0
-        id_vertices_120 = self.faces[:, [1, 2, 0]]
-        id_vertices_201 = self.faces[:, [2, 0, 1]]
-        id_vertices = gs.reshape(
-            gs.stack([id_vertices_120, id_vertices_201], axis=0), (2, n_faces * 3)
-        )
+        cot = gs.stack([cot_12, cot_02, cot_01], axis=-1)
+        cot = gs.reshape(cot, cot.shape[:-2] + (-1,)) / 2.0
 
         def _laplacian(tangent_vec):
             """Evaluate the mesh Laplacian operator.
@@ -432,33 +484,12 @@ class DiscreteSurfaces(Manifold):
                 Mesh Laplacian operator of the triangulated surface applied
                 to one its tangent vector tangent_vec.
             """
-            to_squeeze = False
-            if tangent_vec.ndim == 2:
-                tangent_vec = gs.expand_dims(tangent_vec, axis=0)
-                to_squeeze = True
-            n_tangent_vecs = len(tangent_vec)
             tangent_vec_diff = (
-                tangent_vec[:, id_vertices[0]] - tangent_vec[:, id_vertices[1]]
+                tangent_vec[..., topology.laplacian_cols, :]
+                - tangent_vec[..., topology.laplacian_rows, :]
             )
-            values = gs.einsum(
-                "bd,nbd->nbd", gs.stack([gs.flatten(cot)] * 3, axis=1), tangent_vec_diff
-            )
-
-            laplacian_at_tangent_vec = gs.zeros((n_tangent_vecs, n_vertices, 3))
-
-            id_vertices_201_repeated = gs.tile(id_vertices[1, :], (n_tangent_vecs, 1))
-
-            for i_dim in range(3):
-                laplacian_at_tangent_vec[:, :, i_dim] = gs.scatter_add(
-                    input=laplacian_at_tangent_vec[:, :, i_dim],
-                    dim=1,
-                    index=id_vertices_201_repeated,
-                    src=values[:, :, i_dim],
-                )
-            return (
-                gs.squeeze(laplacian_at_tangent_vec, axis=0)
-                if to_squeeze
-                else laplacian_at_tangent_vec
+            return topology.scatter_vectors(
+                cot[..., None] * tangent_vec_diff, topology.laplacian_rows
             )
 
         return _laplacian
@@ -740,7 +771,8 @@ class ElasticMetric(RiemannianMetric):
                     ),
                 ),
             )
-            * areas_bp
+            * areas_bp,
+            axis=-1,
         )
 
     def _inner_product_a2(
@@ -842,7 +874,7 @@ class ElasticMetric(RiemannianMetric):
 
         point_a = base_point + tangent_vec_a
         point_b = base_point + tangent_vec_b
-        inner_prod = gs.zeros((gs.maximum(len(tangent_vec_a), len(tangent_vec_b)), 1))
+        inner_prod = gs.zeros(gs.maximum(len(tangent_vec_a), len(tangent_vec_b)))
         if self.a0 > 0 or self.a2 > 0:
             vertex_areas_bp = self._space.vertex_areas(base_point)
             if self.a0 > 0:
@@ -856,7 +888,7 @@ class ElasticMetric(RiemannianMetric):
                     base_point=base_point,
                     vertex_areas_bp=vertex_areas_bp,
                 )
-        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.b1 > 0:
+        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.d1 > 0:
             one_forms_bp = self._space.surface_one_forms(base_point)
             surface_metrics_bp = self._space._surface_metric_matrices_from_one_forms(
                 one_forms_bp
@@ -944,7 +976,305 @@ class ElasticMetric(RiemannianMetric):
         energy : array-like, shape=[...,]
             Path energy.
         """
-        return 0.5 * gs.sum(self.path_energy_per_time(path), axis=(-1, -2))
+        return 0.5 * gs.sum(self.path_energy_per_time(path), axis=-1)
+
+    def _squared_norm_and_grad(self, tangent_vec, base_point):
+        r"""Compute the squared norm and its gradients.
+
+        The gradients are derived by hand from the six terms of the
+        inner-product, with respect to the tangent vector and with
+        respect to the base point. Every term is written with per-face
+        quantities, whose gradients are then scattered onto the vertices.
+
+        The :math:`d_1` term simplifies to
+        :math:`2 d_1 \omega^2 / \sqrt{\det g_q}` on each face, where
+        :math:`\omega = \langle dh_1, dq_2 \rangle - \langle dq_1, dh_2 \rangle`
+        is the skew part of the one-forms.
+
+        Parameters
+        ----------
+        tangent_vec : array-like, shape=[..., n_vertices, 3]
+            Tangent vector at base point.
+        base_point : array-like, shape=[..., n_vertices, 3]
+            Surface, as the 3D coordinates of the vertices of its triangulation.
+
+        Returns
+        -------
+        squared_norm : array-like, shape=[...]
+            Squared norm of the tangent vector.
+        grad_tangent_vec : array-like, shape=[..., n_vertices, 3]
+            Gradient of the squared norm with respect to the tangent vector.
+        grad_base_point : array-like, shape=[..., n_vertices, 3]
+            Gradient of the squared norm with respect to the base point.
+        """
+        topology = self._space._topology
+        squared_norm = 0.0
+        grad_tangent_vec = gs.zeros_like(tangent_vec)
+        grad_faces = [0.0, 0.0, 0.0]
+        grad_tangent_faces = [0.0, 0.0, 0.0]
+
+        if self.a0 > 0 or self.a2 > 0:
+            vertex_0, vertex_1, vertex_2 = self._space._vertices(base_point)
+            edge_12 = vertex_1 - vertex_2
+            edge_02 = vertex_0 - vertex_2
+            edge_01 = vertex_0 - vertex_1
+            sq_len_12 = gs.sum(edge_12**2, axis=-1)
+            sq_len_02 = gs.sum(edge_02**2, axis=-1)
+            sq_len_01 = gs.sum(edge_01**2, axis=-1)
+
+            # Heron's formula, as a function of the squared lengths
+            cot_numerators = gs.stack(
+                [
+                    sq_len_02 + sq_len_01 - sq_len_12,
+                    sq_len_12 + sq_len_01 - sq_len_02,
+                    sq_len_12 + sq_len_02 - sq_len_01,
+                ],
+                axis=-1,
+            )
+            heron = (
+                sq_len_12 * cot_numerators[..., 0]
+                + sq_len_02 * cot_numerators[..., 1]
+                + sq_len_01 * cot_numerators[..., 2]
+            ) / 16
+            areas = gs.sqrt(heron.clip(min=1e-6))
+            vertex_areas = (
+                2
+                * topology.scatter(
+                    gs.repeat(areas, 3, axis=-1), topology.corner_vertices
+                )
+                / 3
+            )
+
+            sq_tangent_vec = gs.sum(tangent_vec**2, axis=-1)
+            grad_vertex_areas = self.a0 * sq_tangent_vec
+            grad_areas = 0.0
+            grad_sq_lens = 0.0
+
+            squared_norm += self.a0 * gs.sum(vertex_areas * sq_tangent_vec, axis=-1)
+            grad_tangent_vec += 2 * self.a0 * vertex_areas[..., None] * tangent_vec
+
+            if self.a2 > 0:
+                weights = cot_numerators / (2 * areas[..., None])
+                flat_weights = gs.reshape(weights, weights.shape[:-2] + (-1,))
+                tangent_vec_diff = (
+                    tangent_vec[..., topology.laplacian_cols, :]
+                    - tangent_vec[..., topology.laplacian_rows, :]
+                )
+                laplacian = topology.scatter_vectors(
+                    flat_weights[..., None] * tangent_vec_diff, topology.laplacian_rows
+                )
+                dual_laplacian = laplacian / vertex_areas[..., None]
+
+                squared_norm += self.a2 * gs.sum(
+                    laplacian * dual_laplacian, axis=(-2, -1)
+                )
+                grad_vertex_areas -= self.a2 * gs.sum(dual_laplacian**2, axis=-1)
+
+                grad_laplacian = (
+                    2 * self.a2 * dual_laplacian[..., topology.laplacian_rows, :]
+                )
+                weighted_grad = flat_weights[..., None] * grad_laplacian
+                grad_tangent_vec += topology.scatter_vectors(
+                    weighted_grad, topology.laplacian_cols
+                ) - topology.scatter_vectors(weighted_grad, topology.laplacian_rows)
+
+                grad_weights = gs.reshape(
+                    gs.sum(grad_laplacian * tangent_vec_diff, axis=-1), weights.shape
+                )
+                grad_sq_lens = (
+                    gs.sum(grad_weights, axis=-1, keepdims=True)
+                    / (2 * areas[..., None])
+                    - grad_weights / areas[..., None]
+                )
+                grad_areas = -gs.sum(grad_weights * weights, axis=-1) / areas
+
+            grad_areas += (
+                2 * sum(grad_vertex_areas[..., index] for index in topology.corners) / 3
+            )
+            grad_heron = gs.where(heron > 1e-6, grad_areas / (2 * areas), 0.0)
+            grad_sq_lens += grad_heron[..., None] * cot_numerators / 8
+
+            grad_12 = 2 * grad_sq_lens[..., 0, None] * edge_12
+            grad_02 = 2 * grad_sq_lens[..., 1, None] * edge_02
+            grad_01 = 2 * grad_sq_lens[..., 2, None] * edge_01
+            grad_faces = [grad_02 + grad_01, grad_12 - grad_01, -grad_12 - grad_02]
+
+        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.d1 > 0:
+            one_forms = self._space.surface_one_forms(base_point)
+            tangent_one_forms = self._space.surface_one_forms(tangent_vec)
+            one_forms_t = gs.moveaxis(one_forms, -1, -2)
+            surface_metrics = gs.matmul(one_forms, one_forms_t)
+            inv_surface_metrics = gs.linalg.inv(surface_metrics)
+            areas = gs.sqrt(gs.linalg.det(surface_metrics))
+
+            grad_one_forms = 0.0
+            grad_tangent_one_forms = 0.0
+            grad_surface_metrics = 0.0
+            grad_areas = 0.0
+
+            if self.c1 > 0:
+                one_form_0, one_form_1 = one_forms[..., 0, :], one_forms[..., 1, :]
+                tangent_0 = tangent_one_forms[..., 0, :]
+                tangent_1 = tangent_one_forms[..., 1, :]
+                normals_diff = 0.5 * (
+                    gs.cross(one_form_0 + tangent_0, one_form_1 + tangent_1)
+                    - gs.cross(one_form_0, one_form_1)
+                )
+                sq_normals_diff = gs.sum(normals_diff**2, axis=-1)
+                squared_norm += self.c1 * gs.sum(areas * sq_normals_diff, axis=-1)
+                grad_areas += self.c1 * sq_normals_diff
+
+                grad_normals = self.c1 * areas[..., None] * normals_diff
+                grad_tangent_one_forms += gs.stack(
+                    [
+                        gs.cross(one_form_1 + tangent_1, grad_normals),
+                        gs.cross(grad_normals, one_form_0 + tangent_0),
+                    ],
+                    axis=-2,
+                )
+                grad_one_forms += gs.stack(
+                    [
+                        gs.cross(tangent_1, grad_normals),
+                        gs.cross(grad_normals, tangent_0),
+                    ],
+                    axis=-2,
+                )
+
+            if self.a1 > 0 or self.b1 > 0:
+                one_forms_a = one_forms + tangent_one_forms
+                dga = (
+                    gs.matmul(one_forms_a, gs.moveaxis(one_forms_a, -1, -2))
+                    - surface_metrics
+                )
+                ginvdga = gs.matmul(inv_surface_metrics, dga)
+                trace = gs.einsum("...ii->...", ginvdga)
+                trace_sq = gs.einsum("...ij,...ji->...", ginvdga, ginvdga)
+
+                squared_norm += gs.sum(
+                    (self.a1 * trace_sq + self.b1 * trace**2) * areas, axis=-1
+                )
+                grad_areas += self.a1 * trace_sq + self.b1 * trace**2
+
+                coef = 2 * areas[..., None, None]
+                trace = trace[..., None, None]
+                grad_dga = coef * (
+                    self.a1 * gs.matmul(ginvdga, inv_surface_metrics)
+                    + self.b1 * trace * inv_surface_metrics
+                )
+                grad_inv = coef * (
+                    self.a1 * gs.matmul(dga, gs.matmul(inv_surface_metrics, dga))
+                    + self.b1 * trace * dga
+                )
+                grad_surface_metrics += (
+                    -gs.matmul(
+                        inv_surface_metrics, gs.matmul(grad_inv, inv_surface_metrics)
+                    )
+                    - grad_dga
+                )
+                grad_one_forms_a = 2 * gs.matmul(grad_dga, one_forms_a)
+                grad_tangent_one_forms += grad_one_forms_a
+                grad_one_forms += grad_one_forms_a
+
+            if self.d1 > 0:
+                skew = gs.sum(
+                    tangent_one_forms[..., 0, :] * one_forms[..., 1, :]
+                    - one_forms[..., 0, :] * tangent_one_forms[..., 1, :],
+                    axis=-1,
+                )
+                squared_norm += 2 * self.d1 * gs.sum(skew**2 / areas, axis=-1)
+                grad_areas -= 2 * self.d1 * skew**2 / areas**2
+
+                grad_skew = (4 * self.d1 * skew / areas)[..., None, None]
+                grad_tangent_one_forms += grad_skew * gs.stack(
+                    [one_forms[..., 1, :], -one_forms[..., 0, :]], axis=-2
+                )
+                grad_one_forms += grad_skew * gs.stack(
+                    [-tangent_one_forms[..., 1, :], tangent_one_forms[..., 0, :]],
+                    axis=-2,
+                )
+
+            grad_surface_metrics += (
+                0.5 * (grad_areas * areas)[..., None, None] * inv_surface_metrics
+            )
+            grad_one_forms += 2 * gs.matmul(grad_surface_metrics, one_forms)
+
+            grad_faces = [
+                grad_faces[0] - gs.sum(grad_one_forms, axis=-2),
+                grad_faces[1] + grad_one_forms[..., 0, :],
+                grad_faces[2] + grad_one_forms[..., 1, :],
+            ]
+            grad_tangent_faces = [
+                -gs.sum(grad_tangent_one_forms, axis=-2),
+                grad_tangent_one_forms[..., 0, :],
+                grad_tangent_one_forms[..., 1, :],
+            ]
+
+        def _scatter_corners(grad_corners):
+            if isinstance(grad_corners[0], float):
+                return 0.0
+            grad_corners = gs.stack(grad_corners, axis=-2)
+            return topology.scatter_vectors(
+                gs.reshape(grad_corners, grad_corners.shape[:-3] + (-1, 3)),
+                topology.corner_vertices,
+            )
+
+        grad_tangent_vec += _scatter_corners(grad_tangent_faces)
+        grad_base_point = gs.zeros_like(base_point) + _scatter_corners(grad_faces)
+        return squared_norm, grad_tangent_vec, grad_base_point
+
+    def _path_energy_and_grad(self, path):
+        """Compute the path energy and its gradient.
+
+        Parameters
+        ----------
+        path : array-like, shape=[..., n_times, n_vertices, 3]
+            Piecewise linear path of discrete surfaces.
+
+        Returns
+        -------
+        energy : array-like, shape=[...,]
+            Path energy.
+        grad : array-like, shape=[..., n_times - 2, n_vertices, 3]
+            Gradient of the path energy with respect to the interior
+            surfaces of the path.
+        """
+        n_times = path.shape[-3]
+        surface_diffs = path[..., 1:, :, :] - path[..., :-1, :, :]
+        surface_midpoints = path[..., :-1, :, :] + surface_diffs / 2
+
+        energy, grad_diffs, grad_midpoints = self._squared_norm_and_grad(
+            surface_diffs, surface_midpoints
+        )
+        energy = 0.5 * n_times * gs.sum(energy, axis=-1)
+
+        grad_midpoints = grad_midpoints / 2
+        grad_step_end = grad_midpoints + grad_diffs
+        grad_step_start = grad_midpoints - grad_diffs
+        grad = (
+            0.5
+            * n_times
+            * (grad_step_end[..., :-1, :, :] + grad_step_start[..., 1:, :, :])
+        )
+        return energy, grad
+
+    def path_energy_grad(self, path):
+        """Compute the gradient of the path energy.
+
+        The gradient is taken with respect to the interior surfaces of the
+        path, its end points being fixed. It is computed in closed form.
+
+        Parameters
+        ----------
+        path : array-like, shape=[..., n_times, n_vertices, 3]
+            Piecewise linear path of discrete surfaces.
+
+        Returns
+        -------
+        grad : array-like, shape=[..., n_times - 2, n_vertices, 3]
+            Gradient of the path energy with respect to the interior
+            surfaces of the path.
+        """
+        return self._path_energy_and_grad(path)[1]
 
     def exp(self, tangent_vec, base_point):
         """Compute the exponential map.
@@ -990,7 +1320,7 @@ class _ExpSolver:
         if optimizer is None:
             optimizer = ScipyMinimize(
                 method="L-BFGS-B",
-                jac="autodiff",
+                jac=True,
                 options={"disp": False, "ftol": 0.00001},
             )
 
@@ -1072,6 +1402,17 @@ class _ExpSolver:
     def _stepforward(self, space, current_point, next_point):
         """Compute the next point on the geodesic.
 
+        The next next point cancels the gradient, with respect to the next
+        point, of the energy of the path going through the three points.
+        This gradient is computed in closed form, and the squared norm of
+        this residual is minimized.
+
+        The gradient of the residual squared norm involves the transpose
+        of the Jacobian of the residual. Since it is made of second
+        derivatives of the squared norm, which are symmetric, its product
+        with the residual is a directional derivative of the closed-form
+        gradients, computed by central differences.
+
         Parameters
         ----------
         current_point : array-like, shape=[n_vertices, 3]
@@ -1084,71 +1425,65 @@ class _ExpSolver:
         next_next_point : array-like, shape=[n_vertices, 3]
             Next next point on the geodesic.
         """
+        metric = space.metric
         current_point = gs.array(current_point)
         next_point = gs.array(next_point)
         n_vertices = current_point.shape[-2]
 
-        zeros = gs.zeros_like(current_point)
-        next_point_clone = gs.copy(next_point)
+        _, current_grad, _ = metric._squared_norm_and_grad(
+            next_point - current_point, current_point
+        )
+        step = 1e-5 * (1.0 + gs.linalg.norm(gs.flatten(next_point)))
 
         def energy_objective(next_next_point):
-            """Compute the energy objective to minimize.
+            """Compute the energy objective to minimize and its gradient.
 
             Parameters
             ----------
-            next_next_point : array-like, shape=[n_vertices, 3]
+            next_next_point : array-like, shape=[n_vertices * 3]
                 Next next point on the geodesic.
 
             Returns
             -------
             energy_tot : array-like, shape=[,]
                 Energy objective to minimize.
+            grad : array-like, shape=[n_vertices * 3]
+                Gradient of the energy objective.
             """
             next_next_point = gs.reshape(gs.array(next_next_point), (n_vertices, 3))
-            current_to_next = next_point - current_point
             next_to_next_next = next_next_point - next_point
 
-            def _inner_product_with_current_to_next(tangent_vec):
-                """Compute inner-product with tangent vector `current_to_next`.
-
-                The tangent vector `current_to_next` is the vector going from the
-                current point, i.e. discrete surface, to the next point on the
-                geodesic that is being computed.
-                """
-                return space.metric.inner_product(
-                    current_to_next, tangent_vec, current_point
-                )
-
-            def _inner_product_with_next_to_next_next(tangent_vec):
-                """Compute inner-product with tangent vector `next_to_next_next`.
-
-                The tangent vector `next_to_next_next` is the vector going from the
-                next point, i.e. discrete surface, to the next next point on the
-                geodesic that is being computed.
-                """
-                return space.metric.inner_product(
-                    next_to_next_next, tangent_vec, next_point
-                )
-
-            def _norm(base_point):
-                """Compute norm of `next_to_next_next` at the base_point.
-
-                The tangent vector `next_to_next_next` is the vector going from the
-                next point, i.e. discrete surface, to the next next point on the
-                geodesic that is being computed.
-                """
-                return space.metric.squared_norm(next_to_next_next, base_point)
-
-            _, energy_1 = gs.autodiff.value_and_grad(
-                _inner_product_with_current_to_next
-            )(zeros)
-            _, energy_2 = gs.autodiff.value_and_grad(
-                _inner_product_with_next_to_next_next
-            )(zeros)
-            _, energy_3 = gs.autodiff.value_and_grad(_norm)(next_point_clone)
-
-            energy_tot = 2 * energy_1 - 2 * energy_2 + energy_3
-            return gs.sum(energy_tot**2)
+            _, grad_tangent_vec, grad_base_point = metric._squared_norm_and_grad(
+                next_to_next_next, next_point
+            )
+            residual = current_grad - grad_tangent_vec + grad_base_point
+            residual_norm = gs.linalg.norm(gs.flatten(residual))
+            if residual_norm == 0.0:
+                return 0.0, gs.zeros(n_vertices * 3)
+
+            direction = step * residual / residual_norm
+            _, grads, _ = metric._squared_norm_and_grad(
+                gs.stack(
+                    [
+                        next_to_next_next,
+                        next_to_next_next,
+                        next_to_next_next + direction,
+                        next_to_next_next - direction,
+                    ]
+                ),
+                gs.stack(
+                    [
+                        next_point + direction,
+                        next_point - direction,
+                        next_point,
+                        next_point,
+                    ]
+                ),
+            )
+            jacobian_t_residual = (
+                residual_norm * (grads[0] - grads[1] - grads[2] + grads[3]) / (2 * step)
+            )
+            return gs.sum(residual**2), gs.flatten(2 * jacobian_t_residual)
 
         initial_next_next_point = gs.flatten(
             (2 * (next_point - current_point) + current_point)
@@ -1163,18 +1498,42 @@ class _ExpSolver:
 
 
 class _LogSolver:
-    """Class to solve the boundary value problem (BVP) for exp."""
+    """Class to solve the boundary value problem (BVP) for exp.
 
-    def __init__(self, n_steps=10, optimizer=None):
+    Parameters
+    ----------
+    n_steps : int
+        Number of time steps on the geodesic.
+    optimizer : ScipyMinimize
+        Optimizer minimizing the path energy.
+    n_levels : int
+        Number of time resolution levels. If greater than 1, the BVP is
+        first solved with about half the time steps, recursively, and each
+        solution is interpolated in time to initialize the next finer level.
+        Optional, default: 1.
+    cache_size : int
+        Number of coarse solutions kept to initialize the BVP between the
+        same surfaces again, in either direction, if n_levels is greater
+        than 1. The least recently used solution is evicted first. Each one
+        holds about n_steps / 2 surfaces, e.g. 6 MB in float64 for 10 steps
+        and 50000 vertices. If 0, nothing is cached.
+        Optional, default: 8.
+    """
+
+    def __init__(self, n_steps=10, optimizer=None, n_levels=1, cache_size=8):
         if optimizer is None:
             optimizer = ScipyMinimize(
                 method="L-BFGS-B",
-                jac="autodiff",
+                jac=True,
                 options={"disp": False, "ftol": 0.001},
             )
 
         self.n_steps = n_steps
         self.optimizer = optimizer
+        self.n_levels = n_levels
+        self.cache_size = cache_size
+
+        self._coarse_geodesics = {}
 
     def log(self, space, point, base_point):
         """Compute logarithm map associated to the Riemannian metric.
@@ -1211,17 +1570,19 @@ class _LogSolver:
 
         for one_point, one_base_point in zip(point, base_point):
             geod = self._bvp(space, one_base_point, one_point)
-            logs.append(geod[1] - geod[0])
+            logs.append((geod[1] - geod[0]) * (self.n_steps - 1))
 
         logs = gs.array(logs)
         if need_squeeze:
             logs = gs.squeeze(logs, axis=0)
         return logs
 
-    def _bvp(self, space, initial_point, end_point):
+    def _bvp(self, space, initial_point, end_point, initial_geod=None):
         """Solve boundary value problem (BVP).
 
-        Given an initial point and an end point, solve the geodesic equation.
+        Given an initial point and an end point, solve the geodesic equation
+        by minimizing the path energy, whose gradient is computed in
+        closed form.
 
         Parameters
         ----------
@@ -1229,91 +1590,164 @@ class _LogSolver:
             Initial point, i.e. initial discrete surface.
         end_point : array-like, shape=[n_vertices, 3]
             End point, i.e. end discrete surface.
-        times : array-like, shape=[n_times,]
-            Times between 0 and 1.
+        initial_geod : array-like, shape=[n_times, n_vertices, 3]
+            Initial guess for the discrete geodesic.
+            Optional, default: straight line with n_steps times, or
+            solution of the coarser levels if n_levels is greater than 1.
 
         Returns
         -------
         geod : array-like, shape=[n_times, n_vertices, 3]
-            Geodesic discretized on the times given as inputs.
+            Discrete geodesic.
         """
-        times = gs.linspace(0.0, 1.0, self.n_steps)
-        n_points = initial_point.shape[-2]
-        step = (end_point - initial_point) / (self.n_steps - 1)
-        geod = gs.array([initial_point + i * step for i in times])
-        midpoints = geod[1 : self.n_steps - 1]
-
-        all_need_squeeze = False
-        if midpoints.ndim == 3:
-            all_need_squeeze = True
-            initial_point = gs.expand_dims(initial_point, axis=0)
-            end_point = gs.expand_dims(end_point, axis=0)
-            midpoints = gs.expand_dims(midpoints, axis=0)
-            num_points = midpoints.shape[0]
-        else:
-            if initial_point.ndim == 2:
-                initial_point = gs.expand_dims(initial_point, axis=0)
-                num_points = end_point.shape[0]
-            if end_point.ndim == 2:
-                end_point = gs.expand_dims(end_point, axis=0)
-                num_points = initial_point.shape[0]
-            midpoints = gs.reshape(
-                midpoints, (num_points, self.n_times - 2, n_points, 3)
-            )
+        if initial_geod is None:
+            if self.n_levels > 1:
+                initial_geod = self._coarse_geodesic(space, initial_point, end_point)
+            else:
+                initial_geod = self._straight_path(
+                    initial_point, end_point, self.n_steps
+                )
+        midpoints_shape = (initial_geod.shape[0] - 2,) + initial_geod.shape[1:]
 
-        def objective(midpoint):
-            """Compute path energy of paths going through a midpoint.
+        def objective(midpoints):
+            """Compute path energy of paths going through midpoints.
 
             Parameters
             ----------
-            midpoint : array-like, shape=[..., n_vertices, 3]
-                Midpoint of the path, i.e. a discrete surface.
+            midpoints : array-like, shape=[(n_times - 2) * n_vertices * 3]
+                Interior points of the path, i.e. discrete surfaces.
 
             Returns
             -------
-            _ : array-like, shape=[...]
-                Energy of the path going through this midpoint.
+            energy : array-like, shape=[,]
+                Energy of the path going through these midpoints.
+            grad : array-like, shape=[(n_times - 2) * n_vertices * 3]
+                Gradient of the energy.
             """
-            midpoint = gs.reshape(
-                gs.array(midpoint), (num_points, self.n_steps - 2, n_points, 3)
+            midpoints = gs.reshape(gs.array(midpoints), midpoints_shape)
+            path = gs.concatenate(
+                [initial_point[None, :, :], midpoints, end_point[None, :, :]],
+                axis=0,
             )
+            energy, grad = space.metric._path_energy_and_grad(path)
+            return energy, gs.flatten(grad)
 
-            paths = []
-            for one_midpoint, one_initial_point, one_end_point in zip(
-                midpoint, initial_point, end_point
-            ):
-                one_path = gs.concatenate(
-                    [
-                        one_initial_point[None, :, :],
-                        one_midpoint,
-                        one_end_point[None, :, :],
-                    ],
-                    axis=0,
-                )
-                paths.append(one_path)
-            paths = gs.array(paths)
-            return space.metric.path_energy(paths)
-
-        initial_geod = gs.flatten(midpoints)
+        sol = self.optimizer.minimize(objective, gs.flatten(initial_geod[1:-1]))
 
-        sol = self.optimizer.minimize(
-            objective,
-            initial_geod,
+        midpoints = gs.reshape(gs.array(sol.x), midpoints_shape)
+        return gs.concatenate(
+            [initial_point[None, :, :], midpoints, end_point[None, :, :]], axis=0
         )
 
-        out = gs.reshape(gs.array(sol.x), (num_points, self.n_steps - 2, n_points, 3))
+    @staticmethod
+    def _straight_path(initial_point, end_point, n_times):
+        """Compute the straight line between two surfaces.
 
-        geod = []
-        for one_out, one_initial_point, one_end_point in zip(
-            out, initial_point, end_point
-        ):
-            one_geod = gs.concatenate(
-                [one_initial_point[None, :, :], one_out, one_end_point[None, :, :]],
-                axis=0,
-            )
-            geod.append(one_geod)
-        geod = gs.array(geod)
-        if all_need_squeeze:
-            geod = gs.squeeze(geod, axis=0)
+        Parameters
+        ----------
+        initial_point : array-like, shape=[n_vertices, 3]
+            Initial point, i.e. initial discrete surface.
+        end_point : array-like, shape=[n_vertices, 3]
+            End point, i.e. end discrete surface.
+        n_times : int
+            Number of times.
+
+        Returns
+        -------
+        path : array-like, shape=[n_times, n_vertices, 3]
+            Straight path.
+        """
+        times = gs.linspace(0.0, 1.0, n_times)[:, None, None]
+        return initial_point + times * (end_point - initial_point)
+
+    @staticmethod
+    def _interpolate(geod, n_times):
+        """Interpolate a discrete geodesic linearly in time.
+
+        Parameters
+        ----------
+        geod : array-like, shape=[n_coarse_times, n_vertices, 3]
+            Discrete geodesic.
+        n_times : int
+            Number of times of the interpolated path.
+
+        Returns
+        -------
+        path : array-like, shape=[n_times, n_vertices, 3]
+            Path going through the interpolated surfaces.
+        """
+        n_coarse_times = geod.shape[0]
+        times = [
+            index * (n_coarse_times - 1) / (n_times - 1) for index in range(n_times)
+        ]
+        lower = [min(int(time), n_coarse_times - 2) for time in times]
+        weights = gs.array(
+            [time - index for time, index in zip(times, lower)], dtype=geod.dtype
+        )[:, None, None]
+        return (1 - weights) * geod[lower] + weights * geod[
+            [index + 1 for index in lower]
+        ]
+
+    def _coarse_geodesic(self, space, initial_point, end_point):
+        """Initialize the BVP with the solutions at coarser time resolutions.
+
+        The BVP is solved with the fewest time steps first, and each
+        solution initializes the next finer level. The finest coarse solution
+        is cached before being interpolated to n_steps times, and reused
+        reversed for the BVP in the opposite direction. The cache is keyed
+        on the surfaces, the faces, the number of time steps and levels, and
+        the coefficients of the metric.
+
+        Parameters
+        ----------
+        space : DiscreteSurfaces
+            Space of discrete surfaces.
+        initial_point : array-like, shape=[n_vertices, 3]
+            Initial point, i.e. initial discrete surface.
+        end_point : array-like, shape=[n_vertices, 3]
+            End point, i.e. end discrete surface.
+
+        Returns
+        -------
+        geod : array-like, shape=[n_steps, n_vertices, 3]
+            Initial guess for the discrete geodesic.
+        """
+        metric = space.metric
+        settings = (
+            self.n_steps,
+            self.n_levels,
+            gs.to_numpy(space.faces).tobytes(),
+            metric.a0,
+            metric.a1,
+            metric.b1,
+            metric.c1,
+            metric.d1,
+            metric.a2,
+        )
+        initial_key = gs.to_numpy(initial_point).tobytes()
+        end_key = gs.to_numpy(end_point).tobytes()
+        key = (settings, initial_key, end_key)
+        reversed_key = (settings, end_key, initial_key)
+        if key in self._coarse_geodesics:
+            geod = self._coarse_geodesics.pop(key)
+        elif reversed_key in self._coarse_geodesics:
+            geod = gs.flip(self._coarse_geodesics.pop(reversed_key), axis=0)
+        else:
+            geod = None
+            for level in reversed(range(1, self.n_levels)):
+                n_times = max(3, (self.n_steps - 1) // 2**level + 1)
+                if geod is None:
+                    initial_geod = self._straight_path(
+                        initial_point, end_point, n_times
+                    )
+                else:
+                    initial_geod = self._interpolate(geod, n_times)
+                geod = self._bvp(
+                    space, initial_point, end_point, initial_geod=initial_geod
+                )
 
-        return geod
+        if self.cache_size > 0:
+            if len(self._coarse_geodesics) >= self.cache_size:
+                self._coarse_geodesics.pop(next(iter(self._coarse_geodesics)))
+            self._coarse_geodesics[key] = geod
+        return self._interpolate(geod, self.n_steps)
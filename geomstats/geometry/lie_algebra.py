@@ -16,7 +16,7 @@ import geomstats.errors
 from geomstats.geometry.base import VectorSpace
 from geomstats.geometry.matrices import Matrices
 
-from ._bch_coefficients import BCH_COEFFICIENTS
+from ._bch_coefficients import get_bch_coefficients
 
 
 class MatrixLieAlgebra(VectorSpace, abc.ABC):
@@ -73,16 +73,18 @@ class MatrixLieAlgebra(VectorSpace, abc.ABC):
         )
         n_terms = gs.sum(number_of_hom_degree[:order])
 
+        bch_coefficients = get_bch_coefficients()
+
         el = [matrix_a, matrix_b]
         result = matrix_a + matrix_b
 
         for i in gs.arange(2, n_terms):
-            i_p = BCH_COEFFICIENTS[i, 1] - 1
-            i_pp = BCH_COEFFICIENTS[i, 2] - 1
+            i_p = bch_coefficients[i, 1] - 1
+            i_pp = bch_coefficients[i, 2] - 1
 
             el.append(self.bracket(el[i_p], el[i_pp]))
             result += (
-                float(BCH_COEFFICIENTS[i, 3]) / float(BCH_COEFFICIENTS[i, 4]) * el[i]
+                float(bch_coefficients[i, 3]) / float(bch_coefficients[i, 4]) * el[i]
             )
         return result
 
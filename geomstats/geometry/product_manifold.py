@@ -4,6 +4,8 @@ Lead author: Nicolas Guigui, John Harvey.
 """
 import math
 
+import joblib
+
 import geomstats.backend as gs
 import geomstats.errors
 from geomstats.geometry.complex_manifold import ComplexManifold
@@ -86,13 +88,38 @@ def _find_product_shape(factors, default_point_type):
 
 class _IterateOverFactorsMixins:
     def __init__(
-        self, factors, cum_index, pool_outputs, has_mixed_fields, *args, **kwargs
+        self,
+        factors,
+        cum_index,
+        pool_outputs,
+        has_mixed_fields,
+        *args,
+        n_jobs=1,
+        **kwargs,
     ):
         self.factors = factors
         self._cum_index = cum_index
         self._pool_outputs = pool_outputs
         self._has_mixed_fields = has_mixed_fields
+        self.n_jobs = n_jobs
         super().__init__(*args, **kwargs)
+        self._factor_indices = self._build_factor_indices()
+
+    def _build_factor_indices(self):
+        """Build the indices selecting each factor in a point of the product.
+
+        The indices only use basic slicing, so that the factor components of
+        a point are views on the point rather than copies.
+        """
+        if self.default_point_type == "vector":
+            bounds = [0] + [int(index) for index in self._cum_index] + [self.shape[-1]]
+            return [
+                (Ellipsis, slice(start, stop))
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+
+        trailing_slices = (slice(None),) * (len(self.shape) - 1)
+        return [(Ellipsis, i) + trailing_slices for i in range(len(self.factors))]
 
     def embed_to_product(self, points):
         """Map a point in each factor to a point in the product.
@@ -150,19 +177,11 @@ class _IterateOverFactorsMixins:
         """
         geomstats.errors.check_point_shape(point, self)
 
+        projected_points = [point[index] for index in self._factor_indices]
         if self.default_point_type == "vector":
-            projected_points = gs.split(point, self._cum_index, axis=-1)
-            projected_points = [
-                self._reshape_trailing(projected_points[j], self.factors[j])
-                for j in range(len(self.factors))
-            ]
-
-        else:
-            splitting_axis = -1 * len(self.shape)
-            projected_points = gs.split(point, len(self.factors), axis=splitting_axis)
             projected_points = [
-                gs.squeeze(projected_point, axis=splitting_axis)
-                for projected_point in projected_points
+                self._reshape_trailing(projected_point, factor)
+                for projected_point, factor in zip(projected_points, self.factors)
             ]
 
         if self._has_mixed_fields:
@@ -186,10 +205,11 @@ class _IterateOverFactorsMixins:
         new_shape = leading_shape + trailing_shape
         return gs.reshape(argument, new_shape)
 
-    def _iterate_over_factors(self, func, args):
+    def _iterate_over_factors(self, func, args, parallel=True):
         """Apply a function to each factor of the product.
 
-        func is called on each factor of the product.
+        func is called on each factor of the product. If `n_jobs` is not 1,
+        the factors are dispatched to a pool of threads.
 
         Array-type arguments are separated out to be passed to func for each factor,
         but other arguments are passed unchanged.
@@ -204,6 +224,9 @@ class _IterateOverFactorsMixins:
             Dict of arguments.
             Array-type arguments must be of type (..., shape)
             Other arguments are passed to each factor unchanged
+        parallel : bool
+            Whether the factors can be dispatched to a pool of threads.
+            Optional, default: True.
 
         Returns
         -------
@@ -214,10 +237,23 @@ class _IterateOverFactorsMixins:
         # TODO be allowed, rather than packing and unpacking them repeatedly.
         args_list, numerical_args = self._validate_and_prepare_args_for_iteration(args)
 
-        out = [
-            self._get_method(self.factors[i], func, args_list[i], numerical_args)
-            for i in range(len(self.factors))
-        ]
+        if not parallel or self.n_jobs == 1 or len(self.factors) == 1:
+            out = [
+                self._get_method(factor, func, factor_args, numerical_args)
+                for factor, factor_args in zip(self.factors, args_list)
+            ]
+        else:
+            n_jobs = self.n_jobs
+            if isinstance(n_jobs, int) and n_jobs > 0:
+                n_jobs = min(n_jobs, len(self.factors))
+            with joblib.Parallel(n_jobs=n_jobs, prefer="threads") as parallel_:
+                out = parallel_(
+                    joblib.delayed(self._get_method)(
+                        factor, func, factor_args, numerical_args
+                    )
+                    for factor, factor_args in zip(self.factors, args_list)
+                )
+
         if self._pool_outputs:
             return self._pool_outputs_from_function(out)
         return out
@@ -274,9 +310,14 @@ class ProductManifold(_IterateOverFactorsMixins, Manifold):
         array. Matrix representation allows for a point to be represented by an array of
         shape (n, dim), if each manifold has default_point_type 'vector' with shape
         (dim,). 'other' will behave as `matrix` but for higher dimensions.
+    n_jobs : int
+        Number of threads over which the factors are dispatched. Only worth
+        it for factors with expensive computations, e.g. iterative solvers.
+        Follows the joblib convention, e.g. -1 uses all processors.
+        Optional, default: 1.
     """
 
-    def __init__(self, factors, default_point_type="auto", equip=True):
+    def __init__(self, factors, default_point_type="auto", equip=True, n_jobs=1):
         geomstats.errors.check_parameter_accepted_values(
             default_point_type,
             "default_point_type",
@@ -320,6 +361,7 @@ class ProductManifold(_IterateOverFactorsMixins, Manifold):
             cum_index=cum_index,
             pool_outputs=True,
             has_mixed_fields=_has_mixed_fields(factors),
+            n_jobs=n_jobs,
             dim=dim,
             shape=shape,
             default_coords_type=default_coords_type,
@@ -434,7 +476,7 @@ class ProductManifold(_IterateOverFactorsMixins, Manifold):
             Points sampled from the manifold.
         """
         samples = self._iterate_over_factors(
-            "random_point", {"n_samples": n_samples, "bound": bound}
+            "random_point", {"n_samples": n_samples, "bound": bound}, parallel=False
         )
         return samples
 
@@ -460,7 +502,9 @@ class ProductManifold(_IterateOverFactorsMixins, Manifold):
             Points sampled in the tangent space of the product manifold at base_point.
         """
         samples = self._iterate_over_factors(
-            "random_tangent_vec", {"base_point": base_point, "n_samples": n_samples}
+            "random_tangent_vec",
+            {"base_point": base_point, "n_samples": n_samples},
+            parallel=False,
         )
         return samples
 
@@ -536,9 +580,18 @@ class ProductManifold(_IterateOverFactorsMixins, Manifold):
 
 
 class ProductRiemannianMetric(_IterateOverFactorsMixins, RiemannianMetric):
-    """Class for product of Riemannian metrics."""
+    """Class for product of Riemannian metrics.
+
+    Parameters
+    ----------
+    space : ProductManifold
+        Product manifold.
+    n_jobs : int
+        Number of threads over which the factors are dispatched.
+        Optional, default: the one of the space.
+    """
 
-    def __init__(self, space):
+    def __init__(self, space, n_jobs=None):
         factors = [factor.metric for factor in space.factors]
         factor_signatures = [metric.signature for metric in factors]
 
@@ -551,6 +604,7 @@ class ProductRiemannianMetric(_IterateOverFactorsMixins, RiemannianMetric):
             cum_index=space._cum_index,
             pool_outputs=False,
             has_mixed_fields=space._has_mixed_fields,
+            n_jobs=space.n_jobs if n_jobs is None else n_jobs,
             signature=(sig_pos, sig_neg),
         )
 
@@ -701,8 +755,8 @@ class ProductRiemannianMetric(_IterateOverFactorsMixins, RiemannianMetric):
             Distance.
         """
         args = {"point_a": point_a, "point_b": point_b}
-        dists = gs.array(self._iterate_over_factors("dist", args))
-        return gs.linalg.norm(dists, ord=2, axis=0)
+        dists = self._iterate_over_factors("dist", args)
+        return gs.sqrt(sum(dist**2 for dist in dists))
 
     def geodesic(self, initial_point, end_point=None, initial_tangent_vec=None):
         """Generate parameterized function for the geodesic curve.
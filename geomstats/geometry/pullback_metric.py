@@ -3,13 +3,45 @@
 Lead author: Nina Miolane.
 """
 import abc
+import contextlib
+import functools
 import math
 
 import geomstats.backend as gs
 from geomstats.geometry.riemannian_metric import RiemannianMetric
 from geomstats.numerics.geodesic import ExpODESolver, LogShootingSolver
 from geomstats.numerics.ivp import GSIVPIntegrator
-from geomstats.vectorization import check_is_batch, get_batch_shape
+from geomstats.vectorization import get_batch_shape
+
+
+def _memoize_at_point(method):
+    """Share the result of a method at a base point within a call.
+
+    Results are stored for the duration of the outermost memoized call of
+    the metric, and keyed by the identity of the base point. Quantities that
+    are needed several times at the same point, such as the Jacobian of the
+    immersion, are then only computed once.
+
+    Parameters
+    ----------
+    method : callable
+        Method of the metric with signature `method(self, base_point)`.
+
+    Returns
+    -------
+    memoized_method : callable
+        Memoized method.
+    """
+
+    @functools.wraps(method)
+    def _wrapped(self, base_point):
+        with self._memoization():
+            key = (method.__name__, id(base_point))
+            if key not in self._memo:
+                self._memo[key] = base_point, method(self, base_point)
+            return self._memo[key][1]
+
+    return _wrapped
 
 
 class PullbackMetric(RiemannianMetric):
@@ -23,6 +55,11 @@ class PullbackMetric(RiemannianMetric):
     :math:`(f^*g)_p(u, v) = g_{f(p)}(df_p u , df_p v)
     \quad \forall u, v \in T_pM`
 
+    The Jacobian and the Hessian of the immersion are taken from the
+    immersed set, which computes them by automatic differentiation unless
+    it provides closed forms. Within a call, e.g. one evaluation of the
+    geodesic equation, they are computed once per base point.
+
     Note
     ----
     The pull-back metric is currently only implemented for an
@@ -33,6 +70,7 @@ class PullbackMetric(RiemannianMetric):
 
     def __init__(self, space, signature=None):
         super().__init__(space, signature)
+        self._memo = None
         self._instantiate_solvers()
 
     def _instantiate_solvers(self):
@@ -41,6 +79,28 @@ class PullbackMetric(RiemannianMetric):
             integrator=GSIVPIntegrator(n_steps=100, step_type="euler"),
         )
 
+    @contextlib.contextmanager
+    def _memoization(self):
+        """Store quantities computed at base points until the outermost exit."""
+        if self._memo is not None:
+            yield
+            return
+
+        self._memo = {}
+        try:
+            yield
+        finally:
+            self._memo = None
+
+    @_memoize_at_point
+    def _jacobian_immersion(self, base_point):
+        return self._space.jacobian_immersion(base_point)
+
+    @_memoize_at_point
+    def _hessian_immersion(self, base_point):
+        return self._space.hessian_immersion(base_point)
+
+    @_memoize_at_point
     def metric_matrix(self, base_point):
         r"""Metric matrix at the tangent space at a base point.
 
@@ -63,47 +123,38 @@ class PullbackMetric(RiemannianMetric):
         mat : array-like, shape=[..., dim, dim]
             Inner-product matrix.
         """
-        dim, dim_embedding = self._space.dim, self._space.embedding_space.dim
-        is_vec = check_is_batch(self._space, base_point)
-
         immersed_base_point = self._space.immersion(base_point)
-        jacobian_immersion = self._space.jacobian_immersion(base_point)
+        jacobian_immersion = self._jacobian_immersion(base_point)
+        embedding_metric_matrix = self._space.embedding_space.metric.metric_matrix(
+            immersed_base_point
+        )
+        return gs.einsum(
+            "...ai,...ab,...bj->...ij",
+            jacobian_immersion,
+            embedding_metric_matrix,
+            jacobian_immersion,
+        )
 
-        basis_elements = gs.eye(dim)
+    @_memoize_at_point
+    def cometric_matrix(self, base_point):
+        """Inner co-product matrix at the cotangent space at a base point.
 
-        if is_vec:
-            reshaped_jacobian_immersion = gs.reshape(jacobian_immersion, (-1, dim))
-            reshaped_immersed_basis_elements = gs.matvec(
-                reshaped_jacobian_immersion, basis_elements
-            )
-            immersed_basis_elements = gs.moveaxis(
-                gs.reshape(reshaped_immersed_basis_elements, (dim, -1, dim_embedding)),
-                0,
-                1,
-            )
+        This represents the cometric matrix, i.e. the inverse of the
+        metric matrix.
 
-        else:
-            immersed_basis_elements = gs.matvec(jacobian_immersion, basis_elements)
-
-        elems = {}
-        for i in range(dim):
-            for j in range(i, dim):
-                elem = self._space.embedding_space.metric.inner_product(
-                    immersed_basis_elements[..., i, :],
-                    immersed_basis_elements[..., j, :],
-                    immersed_base_point,
-                )
-                elems[(i, j)] = elem
-
-        mat = []
-        for i in range(dim):
-            for j in range(dim):
-                elem = elems[(i, j)] if j > i else elems[(j, i)]
-                mat.append(elem)
-
-        shape = (-1, dim, dim) if is_vec else (dim, dim)
-        return gs.reshape(gs.stack(mat, axis=-1), shape)
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., dim]
+            Base point.
 
+        Returns
+        -------
+        cometric_matrix : array-like, shape=[..., dim, dim]
+            Inverse of inner-product matrix.
+        """
+        return gs.linalg.inv(self.metric_matrix(base_point))
+
+    @_memoize_at_point
     def inner_product_derivative_matrix(self, base_point):
         r"""Compute the inner-product derivative matrix.
 
@@ -125,12 +176,69 @@ class PullbackMetric(RiemannianMetric):
             Inner-product derivative matrix, where the index of the derivation
             is last: :math:`mat_{ij}_k = \partial_k g_{ij}`.
         """
-        jacobian_ai = self._space.jacobian_immersion(base_point)
-        hessian_aij = self._space.hessian_immersion(base_point)
+        jacobian_ai = self._jacobian_immersion(base_point)
+        hessian_aij = self._hessian_immersion(base_point)
         return gs.einsum("...aki,...aj->...ijk", hessian_aij, jacobian_ai) + gs.einsum(
             "...akj,...ai->...ijk", hessian_aij, jacobian_ai
         )
 
+    @_memoize_at_point
+    def christoffels(self, base_point):
+        r"""Compute Christoffel symbols of the Levi-Civita connection.
+
+        For an immersion :math:`f` into the Euclidean space, the Christoffel
+        symbols of the first kind are the projections of the second
+        derivatives of the immersion on its first derivatives:
+        :math:`\Gamma^k_{ij}(p) = g^{kl}(p)
+        \langle \partial_l f(p), \partial_{ij}^2 f(p) \rangle`.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., dim]
+            Base point.
+
+        Returns
+        -------
+        christoffels : array-like, shape=[..., dim, dim, dim]
+            Christoffel symbols, where the contravariant index is first.
+        """
+        jacobian = self._jacobian_immersion(base_point)
+        hessian = self._hessian_immersion(base_point)
+        cometric = self.cometric_matrix(base_point)
+        return gs.einsum("...kl,...al,...aij->...kij", cometric, jacobian, hessian)
+
+    def geodesic_equation(self, state, _time):
+        """Compute the geodesic ODE associated with the connection.
+
+        The acceleration is obtained by solving a linear system with the
+        metric matrix, without forming the Christoffel symbols.
+
+        Parameters
+        ----------
+        state : array-like, shape=[..., dim]
+            Tangent vector at the position.
+        _time : array-like, shape=[..., dim]
+            Point on the manifold, the position at which to compute the
+            geodesic ODE.
+
+        Returns
+        -------
+        geodesic_ode : array-like, shape=[..., dim]
+            Value of the vector field to be integrated at position.
+        """
+        position, velocity = state
+        with self._memoization():
+            jacobian = self._jacobian_immersion(position)
+            hessian = self._hessian_immersion(position)
+            metric_matrix = self.metric_matrix(position)
+
+        second_derivative = gs.einsum(
+            "...aij,...i,...j->...a", hessian, velocity, velocity
+        )
+        projection = gs.einsum("...al,...a->...l", jacobian, second_derivative)
+        equation = -gs.linalg.solve(metric_matrix, projection[..., None])[..., 0]
+        return gs.stack([velocity, equation])
+
     def second_fundamental_form(self, base_point):
         r"""Compute the second fundamental form.
 
@@ -151,10 +259,10 @@ class PullbackMetric(RiemannianMetric):
             Second fundamental form :math:`\RN{2}(p)_{ij}^\alpha` where the
              :math:`\alpha` index is first.
         """
-        christoffels = self.christoffels(base_point)
-
-        jacobian = self._space.jacobian_immersion(base_point)
-        hessian = self._space.hessian_immersion(base_point)
+        with self._memoization():
+            christoffels = self.christoffels(base_point)
+            jacobian = self._jacobian_immersion(base_point)
+            hessian = self._hessian_immersion(base_point)
 
         return hessian - gs.einsum("...kij,...dk->...dij", christoffels, jacobian)
 
@@ -177,8 +285,9 @@ class PullbackMetric(RiemannianMetric):
         mean_curvature_vector : array-like, shape=[..., embedding_dim]
             Mean curvature vector.
         """
-        second_fund_form = self.second_fundamental_form(base_point)
-        cometric = self.cometric_matrix(base_point)
+        with self._memoization():
+            second_fund_form = self.second_fundamental_form(base_point)
+            cometric = self.cometric_matrix(base_point)
         return gs.einsum("...ij,...aij->...a", cometric, second_fund_form)
 
 
@@ -5,12 +5,10 @@ bundle TM of a Riemannian manifold M.
 
 Lead authors: E. Nava-Yazdani, F. Ambellan, M. Hanik and C. von Tycowicz.
 """
-from joblib import Parallel, delayed
-
 import geomstats.backend as gs
 from geomstats.geometry.base import Manifold
 from geomstats.geometry.riemannian_metric import RiemannianMetric
-from geomstats.vectorization import check_is_batch
+from geomstats.vectorization import get_batch_shape
 
 
 class GradientDescent:
@@ -22,15 +20,25 @@ class GradientDescent:
         self.tol = tol
 
     def minimize(self, x_ini, i_pt, e_pt, grad, exp):
-        """Apply a gradient descent until max_iter or a given tolerance is reached."""
+        """Apply a gradient descent until max_iter or a given tolerance is reached.
+
+        The descent is run simultaneously on a batch of problems, indexed by
+        the first axis of the inputs. Each problem stops being updated once
+        the norm of its gradient is below the tolerance.
+        """
         x = x_ini
+        active = gs.ones(x.shape[0], dtype=bool)
         for _ in range(self.max_iter):
-            grad_x = grad(x, i_pt, e_pt)
-            grad_norm = gs.linalg.norm(grad_x)
-            if grad_norm < self.tol:
+            grad_x = grad(x[active], i_pt[active], e_pt[active])
+            grad_norm = gs.linalg.norm(
+                gs.reshape(grad_x, (grad_x.shape[0], -1)), axis=-1
+            )
+            still_active = grad_norm >= self.tol
+            active = gs.assignment(active, still_active, active)
+            if not gs.any(active):
                 break
-            grad_x = -self.lrate * grad_x
-            x = exp(grad_x, x)
+            x_active = exp(-self.lrate * grad_x[still_active], x[active])
+            x = gs.assignment(x, x_active, active)
         return x
 
 
@@ -187,7 +195,8 @@ class SasakiMetric(RiemannianMetric):
     space : Manifold
         Tangent bundle.
     n_jobs: int
-        Number of jobs for parallel computing.
+        Unused, the discrete geodesics of a batch of pairs are computed
+        simultaneously.
         Optional, default: 1.
     n_steps : int
         Number of discrete time steps.
@@ -298,81 +307,97 @@ class SasakiMetric(RiemannianMetric):
         """
         metric = self._space.space.metric
         par_trans = metric.parallel_transport
+        space_ndim = self._space.space.point_ndim
+        time_axis = -(self._space.point_ndim + 1)
+        eps = 1 / self.n_steps
+
+        def _take_times(array, times):
+            """Slice the time axis of an array of shape [..., n_times, M.shape]."""
+            return array[(Ellipsis, times) + (slice(None),) * space_ndim]
+
+        def _scalarmul(scalar, array):
+            """Multiply an array of shape [..., n_times, M.shape] along time."""
+            ijk = "ijk"[:space_ndim]
+            return gs.einsum(f"p,...p{ijk}->...p{ijk}", scalar, array)
 
         def _grad(pu, i_pt, e_pt):
             """Gradient of discrete geodesic energy."""
-            pu = gs.vstack(
+            pu = gs.concatenate(
                 [
-                    gs.expand_dims(i_pt, axis=0),
+                    gs.expand_dims(i_pt, axis=time_axis),
                     pu,
-                    gs.expand_dims(e_pt, axis=0),
-                ]
+                    gs.expand_dims(e_pt, axis=time_axis),
+                ],
+                axis=time_axis,
             )
             p, u = self._space._unstack(pu)
 
-            p1, p2, p3 = p[:-2], p[1:-1], p[2:]
-            u1, u2, u3 = u[:-2], u[1:-1], u[2:]
-
-            eps = 1 / self.n_steps
+            p1, p2, p3 = (
+                _take_times(p, slice(None, -2)),
+                _take_times(p, slice(1, -1)),
+                _take_times(p, slice(2, None)),
+            )
+            u1, u2, u3 = (
+                _take_times(u, slice(None, -2)),
+                _take_times(u, slice(1, -1)),
+                _take_times(u, slice(2, None)),
+            )
 
-            v2 = metric.log(p3, p2) / eps
-            w2 = (par_trans(u3, p3, end_point=p2) - u2) / eps
+            log_p3 = metric.log(p3, p2)
+            u3_transported = par_trans(u3, p3, end_point=p2)
+            v2 = log_p3 / eps
+            w2 = (u3_transported - u2) / eps
 
-            gp = (metric.log(p3, p2) + metric.log(p1, p2)) / (
-                2 * eps**2
-            ) - metric.curvature(u2, w2, v2, p2)
+            gp = (log_p3 + metric.log(p1, p2)) / (2 * eps**2) - metric.curvature(
+                u2, w2, v2, p2
+            )
 
-            gu = (
-                par_trans(u3, p3, end_point=p2)
-                - 2 * u2
-                + par_trans(u1, p1, end_point=p2)
-            ) / eps**2
+            gu = (u3_transported - 2 * u2 + par_trans(u1, p1, end_point=p2)) / eps**2
 
             return -self._space._stack(gp, gu) * eps
 
-        def _geodesic_discrete_single(initial_point, end_point):
-            """Calculate the discrete geodesic."""
-            ijk = "ijk"[: self._space.space.point_ndim]
-
-            def _scalarmul(scalar, point):
-                return gs.einsum(f"...,...{ijk}->...{ijk}", scalar, point)
-
-            p0, u0 = initial_point[0], initial_point[1]
-            pL, uL = end_point[0], end_point[1]
-
-            v = metric.log(pL, p0)
-            s = gs.linspace(0.0, 1.0, self.n_steps + 1)[1:-1]
+        batch_shape = get_batch_shape(self._space, initial_point, end_point)
+        initial_point = gs.reshape(
+            gs.broadcast_to(initial_point, batch_shape + self._space.shape),
+            (-1,) + self._space.shape,
+        )
+        end_point = gs.reshape(
+            gs.broadcast_to(end_point, batch_shape + self._space.shape),
+            (-1,) + self._space.shape,
+        )
 
-            p_ini = metric.exp(gs.einsum(f"p, {ijk}->p{ijk}", s, v), p0)
-            u_ini = _scalarmul(
-                (1.0 - s), par_trans(u0, p0, end_point=p_ini)
-            ) + _scalarmul(s, par_trans(uL, pL, end_point=p_ini))
-            pu_ini = self._space._stack(p_ini, u_ini)
+        p0, u0 = self._space._unstack(initial_point)
+        pL, uL = self._space._unstack(end_point)
 
-            x = self._gradient_descent.minimize(
-                pu_ini, initial_point, end_point, _grad, self.exp
-            )
+        s = gs.linspace(0.0, 1.0, self.n_steps + 1)[1:-1]
+        interior_shape = (p0.shape[0], self.n_steps - 1) + p0.shape[1:]
 
-            return gs.vstack(
-                [
-                    gs.expand_dims(initial_point, axis=0),
-                    x,
-                    gs.expand_dims(end_point, axis=0),
-                ]
-            )
+        p0 = gs.broadcast_to(gs.expand_dims(p0, axis=1), interior_shape)
+        u0 = gs.broadcast_to(gs.expand_dims(u0, axis=1), interior_shape)
+        pL = gs.broadcast_to(gs.expand_dims(pL, axis=1), interior_shape)
+        uL = gs.broadcast_to(gs.expand_dims(uL, axis=1), interior_shape)
 
-        is_batch = check_is_batch(self._space, initial_point, end_point)
-        if not is_batch:
-            return _geodesic_discrete_single(initial_point, end_point)
+        p_ini = metric.exp(_scalarmul(s, metric.log(pL, p0)), p0)
+        u_ini = _scalarmul(1.0 - s, par_trans(u0, p0, end_point=p_ini)) + _scalarmul(
+            s, par_trans(uL, pL, end_point=p_ini)
+        )
+        pu_ini = self._space._stack(p_ini, u_ini)
 
-        initial_point, end_point = gs.broadcast_arrays(initial_point, end_point)
+        x = self._gradient_descent.minimize(
+            pu_ini, initial_point, end_point, _grad, self.exp
+        )
 
-        with Parallel(n_jobs=min(self.n_jobs, len(end_point)), verbose=0) as parallel:
-            rslt = parallel(
-                delayed(_geodesic_discrete_single)(i_pt, e_pt)
-                for i_pt, e_pt in zip(initial_point, end_point)
-            )
-        return gs.array(rslt)
+        geodesic = gs.concatenate(
+            [
+                gs.expand_dims(initial_point, axis=1),
+                x,
+                gs.expand_dims(end_point, axis=1),
+            ],
+            axis=1,
+        )
+        return gs.reshape(
+            geodesic, batch_shape + (self.n_steps + 1,) + self._space.shape
+        )
 
     def inner_product(self, tangent_vec_a, tangent_vec_b, base_point):
         """Inner product between two tangent vectors at a base point.
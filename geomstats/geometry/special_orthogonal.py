@@ -1518,16 +1518,15 @@ class _SpecialOrthogonal3Vectors(_SpecialOrthogonalVectors):
             gs.array([TAYLOR_COEFFS_1_AT_PI[k] * delta_angle**k for k in range(1, 7)])
         )
         coef_1 = utils.taylor_exp_even_func(squared_angle / 4, utils.inv_tanc_close_0)
-        coef_1 = gs.where(-delta_angle < utils.EPSILON, approx_at_pi, coef_1)
+        epsilon = utils.get_epsilon(squared_angle.dtype)
+        coef_1 = gs.where(-delta_angle < epsilon, approx_at_pi, coef_1)
 
         coef_2 = utils.taylor_exp_even_func(
             squared_angle, utils.var_inv_tanc_close_0, order=4
         )
-        squared_angle_ = gs.where(
-            squared_angle < utils.EPSILON, utils.EPSILON, squared_angle
-        )
+        squared_angle_ = gs.where(squared_angle < epsilon, epsilon, squared_angle)
         coef_2 = gs.where(
-            squared_angle < utils.EPSILON, coef_2, (1 - coef_1) / squared_angle_
+            squared_angle < epsilon, coef_2, (1 - coef_1) / squared_angle_
         )
 
         outer_ = gs.outer(point, point)
@@ -559,34 +559,25 @@ class _StiefelLogSolver:
         matrix_v = self._orthogonal_completion(matrix_m, matrix_n)
         matrix_v = self._procrustes_preprocessing(p, matrix_v, matrix_m, matrix_n)
 
-        matrix_lv = (
-            self._iter_log(p, matrix_v)
-            if gs.ndim(matrix_v) == 2
-            else gs.stack([self._iter_log(p, x) for x in matrix_v])
-        )
+        matrix_lv = self._iter_log(p, matrix_v)
 
         matrix_xv = gs.matmul(base_point, matrix_lv[..., :p, :p])
         matrix_qv = gs.matmul(matrix_q, matrix_lv[..., p:, :p])
 
         return matrix_xv + matrix_qv
 
-    def _iter_log(self, p, matrix_v):
-        matrix_lv = gs.zeros_like(matrix_v)
-        for _ in range(self.max_iter):
-            matrix_lv = gs.linalg.logm(matrix_v)
-
-            matrix_c = matrix_lv[..., p:, p:]
-            norm_matrix_c = gs.linalg.norm(matrix_c)
-            if norm_matrix_c <= self.tol:
-                break
+    def _real_logm(self, matrix_v):
+        """Compute the matrix logarithm and drop its imaginary part.
 
-            matrix_phi = gs.linalg.expm(-Matrices.to_skew_symmetric(matrix_c))
-            aux_matrix = gs.matmul(matrix_v[..., :, p:], matrix_phi)
-            matrix_v = gs.concatenate([matrix_v[..., :, :p], aux_matrix], axis=-1)
-
-        else:
-            warnings.warn("`log` hasn't converged.")
+        Parameters
+        ----------
+        matrix_v : array-like, shape=[..., n, n]
 
+        Returns
+        -------
+        matrix_lv : array-like, shape=[..., n, n]
+        """
+        matrix_lv = gs.linalg.logm(matrix_v)
         if gs.is_complex(matrix_lv):
             imag_sum = gs.amax(gs.abs(gs.imag(matrix_lv)))
             if imag_sum < self.imag_tol:
@@ -595,3 +586,46 @@ class _StiefelLogSolver:
                 raise ValueError(f"Non-neglible imaginary part. max is {imag_sum}")
 
         return matrix_lv
+
+    def _iter_log(self, p, matrix_v):
+        """Run the fixed point iterations of [ZR2017]_.
+
+        The iterations run on the whole batch. Only the matrices that have not
+        converged yet are updated.
+
+        Parameters
+        ----------
+        p : int
+        matrix_v : array-like, shape=[..., n, n]
+
+        Returns
+        -------
+        matrix_lv : array-like, shape=[..., n, n]
+        """
+        shape = matrix_v.shape
+        matrix_v = gs.reshape(matrix_v, (-1,) + shape[-2:])
+        matrix_lv = self._real_logm(matrix_v)
+        for _ in range(self.max_iter):
+            norm_matrix_c = gs.linalg.norm(matrix_lv[..., p:, p:], axis=(-2, -1))
+            active = norm_matrix_c > self.tol
+            if not gs.any(active):
+                break
+
+            matrix_v_active = matrix_v[active]
+            matrix_phi = gs.linalg.expm(
+                -Matrices.to_skew_symmetric(matrix_lv[active][..., p:, p:])
+            )
+            aux_matrix = gs.matmul(matrix_v_active[..., :, p:], matrix_phi)
+            matrix_v_active = gs.concatenate(
+                [matrix_v_active[..., :, :p], aux_matrix], axis=-1
+            )
+
+            matrix_v = gs.assignment(matrix_v, matrix_v_active, active)
+            matrix_lv = gs.assignment(
+                matrix_lv, self._real_logm(matrix_v_active), active
+            )
+
+        else:
+            warnings.warn("`log` hasn't converged.")
+
+        return gs.reshape(matrix_lv, shape)
@@ -3,10 +3,13 @@
 Lead author: Anna Calissano.
 """
 
+import collections
 import functools
+import hashlib
 import itertools
 from abc import ABCMeta, abstractmethod
 
+import joblib
 import networkx as nx
 import scipy
 
@@ -21,6 +24,41 @@ from geomstats.geometry.stratified.point_set import (
 )
 
 
+def _to_dense(adj):
+    """Turn an adjacency matrix into a dense array.
+
+    Parameters
+    ----------
+    adj : array-like or scipy.sparse matrix, shape=[n_nodes, n_nodes]
+        Adjacency matrix.
+
+    Returns
+    -------
+    adj : array-like, shape=[n_nodes, n_nodes]
+        Dense adjacency matrix. It is ``adj`` itself if already dense.
+    """
+    if scipy.sparse.issparse(adj):
+        return gs.array(adj.toarray())
+    return adj
+
+
+def _stack_adjs(adjs):
+    """Stack adjacency matrices, padding the smaller ones with zeros.
+
+    Parameters
+    ----------
+    adjs : list of array-like or scipy.sparse matrix
+        Adjacency matrices, possibly of different sizes.
+
+    Returns
+    -------
+    array : array-like, shape=[n_graphs, n_nodes, n_nodes]
+        Stacked adjacency matrices, with the largest number of nodes.
+    """
+    n_nodes = max(adj.shape[0] for adj in adjs)
+    return gs.stack([_pad_array_with_zeros(_to_dense(adj), n_nodes) for adj in adjs])
+
+
 def _pad_graph_points_with_zeros(points, n_nodes, copy=False):
     """Pad graphs point with zeros.
 
@@ -28,6 +66,10 @@ def _pad_graph_points_with_zeros(points, n_nodes, copy=False):
     graphs can be padded adding zero nodes and edges, i.e., block of zero rows and
     columns.
 
+    The adjacency matrix is only reallocated if padding is needed. Sparse
+    adjacency matrices are padded by enlarging their shape, without touching
+    the stored entries.
+
     Parameters
     ----------
     points : GraphPoint
@@ -45,7 +87,11 @@ def _pad_graph_points_with_zeros(points, n_nodes, copy=False):
             points = GraphPoint(points.adj)
 
         n = n_nodes - points.n_nodes
-        if n > 0:
+        if n > 0 and scipy.sparse.issparse(points.adj):
+            adj = points.adj.copy()
+            adj.resize((n_nodes, n_nodes))
+            points.adj = adj
+        elif n > 0:
             points.adj = gs.pad(points.adj, [[0, n], [0, n]])
     else:
         points = [
@@ -132,9 +178,9 @@ def _vectorize_graph(*args_positions):
             return arg
 
         if type(arg) is GraphPoint:
-            return arg.adj
+            return _to_dense(arg.adj)
 
-        return gs.array([graph.adj for graph in arg])
+        return _stack_adjs([graph.adj for graph in arg])
 
     return _vectorize_point(*args_positions, manipulate_input=_manipulate_input)
 
@@ -196,6 +242,31 @@ def _pad_with_zeros(*args_positions, copy=True):
     return _dec
 
 
+def _faq_align_single(base_graph, graph_to_permute, initial_perm=None):
+    """Align a pair of graphs with the Fast Approximate QAP algorithm.
+
+    Parameters
+    ----------
+    base_graph : array-like, shape=[n_nodes, n_nodes]
+        Base graph.
+    graph_to_permute : array-like, shape=[n_nodes, n_nodes]
+        Graph to align.
+    initial_perm : array-like, shape=[n_nodes], optional
+        Permutation from which to start the algorithm. If None, the algorithm
+        starts from the barycenter of the doubly stochastic matrices.
+
+    Returns
+    -------
+    perm : list, shape=[n_nodes]
+        Node permutation.
+    """
+    options = {"maximize": True}
+    if initial_perm is not None:
+        options["P0"] = gs.eye(base_graph.shape[-1])[initial_perm]
+
+    return gs.linalg.quadratic_assignment(base_graph, graph_to_permute, options)
+
+
 class _BaseAligner(metaclass=ABCMeta):
     """Base class for point to point aligner.
 
@@ -228,6 +299,27 @@ class _BaseAligner(metaclass=ABCMeta):
         """
         raise NotImplementedError("Not implemented")
 
+    def _compute_perms(self, space, base_graph, graph_to_permute, initial_perms=None):
+        """Compute the node permutations aligning batches of graphs.
+
+        Parameters
+        ----------
+        space : GraphSpace
+        base_graph : array-like, shape=[n_pairs, n_nodes, n_nodes]
+            Base graphs.
+        graph_to_permute : array-like, shape=[n_pairs, n_nodes, n_nodes]
+            Graphs to align.
+        initial_perms : list, optional
+            Permutations from which to start, or None for each pair. Only
+            used by iterative aligners.
+
+        Returns
+        -------
+        perms : array-like, shape=[n_pairs, n_nodes]
+            Node permutations.
+        """
+        raise NotImplementedError("Not implemented")
+
     def _broadcast(self, base_graph, graph_to_permute):
         base_graph, graph_to_permute = gs.broadcast_arrays(base_graph, graph_to_permute)
         is_single = gs.ndim(base_graph) == 2
@@ -250,8 +342,24 @@ class FAQAligner(_BaseAligner):
         Kratzer SG, Harley ET, Fishkind DE, Vogelstein RJ, Priebe CE.
         “Fast approximate quadratic programming for graph matching.“
         PLoS One. 2015 Apr 17; doi: 10.1371/journal.pone.0121002.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of jobs over which the pairs of a batch are aligned, using
+        joblib. Pairs are dispatched in chunks sized by joblib.
+        Optional, default: 1.
+
+    Notes
+    -----
+    To start from the permutations previously found for the same graphs,
+    wrap the aligner in a `CachedAligner` with `warm_start=True`.
     """
 
+    def __init__(self, n_jobs=1):
+        super().__init__()
+        self.n_jobs = n_jobs
+
     def align(self, space, base_graph, graph_to_permute):
         """Align graphs.
 
@@ -272,15 +380,33 @@ class FAQAligner(_BaseAligner):
             base_graph, graph_to_permute
         )
 
-        perm = [
-            gs.linalg.quadratic_assignment(x, y, options={"maximize": True})
-            for x, y in zip(base_graph, graph_to_permute)
-        ]
-
-        self.perm_ = gs.array(perm[0]) if is_single else gs.array(perm)
+        perm = self._compute_perms(space, base_graph, graph_to_permute)
+        self.perm_ = perm[0] if is_single else perm
 
         return self._permute(space, graph_to_permute, self.perm_)
 
+    def _compute_perms(self, space, base_graph, graph_to_permute, initial_perms=None):
+        """Compute the node permutations aligning batches of graphs."""
+        if initial_perms is None:
+            initial_perms = [None] * base_graph.shape[0]
+
+        if self.n_jobs == 1 or base_graph.shape[0] == 1:
+            perm = [
+                _faq_align_single(x, y, initial_perm)
+                for x, y, initial_perm in zip(
+                    base_graph, graph_to_permute, initial_perms
+                )
+            ]
+        else:
+            perm = joblib.Parallel(n_jobs=self.n_jobs)(
+                joblib.delayed(_faq_align_single)(x, y, initial_perm)
+                for x, y, initial_perm in zip(
+                    base_graph, graph_to_permute, initial_perms
+                )
+            )
+
+        return gs.array(perm)
+
 
 class IDAligner(_BaseAligner):
     """Identity alignment.
@@ -310,13 +436,18 @@ class IDAligner(_BaseAligner):
             base_graph, graph_to_permute
         )
 
-        n_nodes = base_graph.shape[1]
-        perm = gs.reshape(gs.tile(range(n_nodes), base_graph.shape[0]), (-1, n_nodes))
-
-        self.perm_ = gs.array(perm[0]) if is_single else gs.array(perm)
+        perm = self._compute_perms(space, base_graph, graph_to_permute)
+        self.perm_ = perm[0] if is_single else perm
 
         return self._permute(space, graph_to_permute, self.perm_)
 
+    def _compute_perms(self, space, base_graph, graph_to_permute, initial_perms=None):
+        """Compute the node permutations aligning batches of graphs."""
+        n_nodes = base_graph.shape[1]
+        return gs.reshape(
+            gs.tile(gs.arange(n_nodes), base_graph.shape[0]), (-1, n_nodes)
+        )
+
 
 class ExhaustiveAligner(_BaseAligner):
     """Brute force exact alignment.
@@ -362,19 +493,164 @@ class ExhaustiveAligner(_BaseAligner):
         permuted_graph : array-like, shape=[..., n_nodes, n_nodes]
             Permuted graph as to be aligned with respect to the geodesic.
         """
+        base_graph, graph_to_permute, is_single = self._broadcast(
+            base_graph, graph_to_permute
+        )
+
+        perms = self._compute_perms(space, base_graph, graph_to_permute)
+        self.perm_ = perms[0] if is_single else perms
+
+        return self._permute(space, graph_to_permute, self.perm_)
+
+    def _compute_perms(self, space, base_graph, graph_to_permute, initial_perms=None):
+        """Compute the node permutations aligning batches of graphs."""
         self._set_all_perms(space)
+        return gs.array(
+            [
+                self._align_single(space, base_graph_, graph_to_permute_)
+                for base_graph_, graph_to_permute_ in zip(base_graph, graph_to_permute)
+            ]
+        )
+
+
+class CachedAligner(_BaseAligner):
+    """Point to point aligner reusing the permutations of known pairs.
+
+    The permutations computed by an aligner are stored in a bounded cache,
+    keyed by hashes of the contents of the adjacency matrices, and evicted
+    in least recently used order. An exact hit reuses the stored permutation.
+
+    Parameters
+    ----------
+    aligner : _BaseAligner
+        Aligner computing the permutations of the pairs not found in the cache.
+    maxsize : int
+        Maximum number of cached pairs.
+        Optional, default: 1024.
+    warm_start : bool
+        If True, a pair not found in the cache whose graph to permute was
+        previously aligned to another base graph starts from the last
+        permutation found for it. This suits aligners based on iterative
+        algorithms, e.g. FAQ, when the base graphs change little, as along
+        the iterations of a Fréchet mean estimation.
+        Optional, default: False.
+
+    Attributes
+    ----------
+    hits : int
+        Number of pairs whose permutation was found in the cache.
+    misses : int
+        Number of pairs whose permutation was computed.
+    """
 
+    CacheInfo = collections.namedtuple(
+        "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+    )
+
+    def __init__(self, aligner, maxsize=1024, warm_start=False):
+        super().__init__()
+        self.aligner = aligner
+        self.maxsize = maxsize
+        self.warm_start = warm_start
+
+        self.hits = 0
+        self.misses = 0
+        self._cache = collections.OrderedDict()
+        self._last_perms = collections.OrderedDict()
+
+    @staticmethod
+    def _hash(graph):
+        """Hash the content of an adjacency matrix."""
+        array = gs.to_numpy(graph)
+        content = hashlib.blake2b(array.tobytes(), digest_size=16)
+        return array.shape, str(array.dtype), content.hexdigest()
+
+    @staticmethod
+    def _store(cache, key, value, maxsize):
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+
+    def cache_info(self):
+        """Report the statistics of the cache.
+
+        Returns
+        -------
+        cache_info : CacheInfo
+            Named tuple with the numbers of hits and misses, the maximum size
+            and the current size of the cache.
+        """
+        return self.CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        self._cache.clear()
+        self._last_perms.clear()
+        self.hits = self.misses = 0
+
+    def align(self, space, base_graph, graph_to_permute):
+        """Align graphs.
+
+        Parameters
+        ----------
+        space : GraphSpace
+        base_graph : array-like, shape=[..., n_nodes, n_nodes]
+            Base graph.
+        graph_to_permute : array-like, shape=[..., n_nodes, n_nodes]
+            Graph to align.
+
+        Returns
+        -------
+        permuted_graph : array-like, shape=[..., n_nodes, n_nodes]
+            Permuted graph as to be aligned with respect to the geodesic.
+        """
         base_graph, graph_to_permute, is_single = self._broadcast(
             base_graph, graph_to_permute
         )
-        perms = [
-            self._align_single(space, base_graph_, graph_to_permute_)
+
+        perms = self._compute_perms(space, base_graph, graph_to_permute)
+        self.perm_ = perms[0] if is_single else perms
+
+        return self._permute(space, graph_to_permute, self.perm_)
+
+    def _compute_perms(self, space, base_graph, graph_to_permute, initial_perms=None):
+        """Compute the node permutations aligning batches of graphs."""
+        keys = [
+            (self._hash(base_graph_), self._hash(graph_to_permute_))
             for base_graph_, graph_to_permute_ in zip(base_graph, graph_to_permute)
         ]
 
-        self.perm_ = gs.array(perms[0]) if is_single else gs.array(perms)
+        perms = [None] * len(keys)
+        missing = []
+        for index, key in enumerate(keys):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                perms[index] = self._cache[key]
+            else:
+                missing.append(index)
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            if self.warm_start:
+                initial_perms = [
+                    self._last_perms.get(keys[index][1]) for index in missing
+                ]
+
+            missing_perms = self.aligner._compute_perms(
+                space,
+                base_graph[missing],
+                graph_to_permute[missing],
+                initial_perms=initial_perms if self.warm_start else None,
+            )
+            for index, perm in zip(missing, missing_perms):
+                perms[index] = perm
+                self._store(self._cache, keys[index], perm, self.maxsize)
+                self._store(self._last_perms, keys[index][1], perm, self.maxsize)
 
-        return self._permute(space, graph_to_permute, self.perm_)
+        return gs.stack(perms)
 
 
 class _BasePointToGeodesicAligner(metaclass=ABCMeta):
@@ -424,6 +700,11 @@ class PointToGeodesicAligner(_BasePointToGeodesicAligner):
         Minimum value of the domain to sample along the geodesics.
     n_points: int
         Number of points to sample between s_min and s_max.
+    chunk_size : int
+        Maximum number of graphs compared at once to the points sampled along
+        the geodesic, bounding the memory used to n_points * chunk_size pairs.
+        If None, all graphs are compared at once.
+        Optional, default: None.
 
     References
     ----------
@@ -436,11 +717,12 @@ class PointToGeodesicAligner(_BasePointToGeodesicAligner):
         isometric Lie group actions." Statistica Sinica, 1-58, 2010.
     """
 
-    def __init__(self, s_min, s_max, n_points=10):
+    def __init__(self, s_min, s_max, n_points=10, chunk_size=None):
         super().__init__()
         self.s_min = s_min
         self.s_max = s_max
         self.n_points = n_points
+        self.chunk_size = chunk_size
         self._s = None
 
     def __setattr__(self, attr_name, value):
@@ -466,23 +748,46 @@ class PointToGeodesicAligner(_BasePointToGeodesicAligner):
         """Evaluate the geodesic in s."""
         return geodesic(self.s)
 
-    def _compute_dists(self, space, geodesic, graph):
-        geodesic_s = self._get_geodesic_s(geodesic)
+    def _compute_dists_chunk(self, space, geodesic_s, graph):
+        """Find the closest sampled point of the geodesic for a chunk of graphs."""
+        n_graphs = graph.shape[0]
+        shape = (self.n_points, n_graphs) + graph.shape[1:]
 
-        n_points = self._get_n_points(graph)
-        if n_points > 1:
-            geodesic_s = gs.repeat(geodesic_s, n_points, axis=0)
-            rep_graph = gs.concatenate([graph for _ in range(self.n_points)])
-        else:
-            rep_graph = graph
+        rep_geodesic_s = gs.reshape(
+            gs.broadcast_to(gs.expand_dims(geodesic_s, axis=1), shape),
+            (-1,) + graph.shape[1:],
+        )
+        rep_graph = gs.reshape(
+            gs.broadcast_to(gs.expand_dims(graph, axis=0), shape),
+            (-1,) + graph.shape[1:],
+        )
 
         dists = gs.reshape(
-            space.metric.dist(geodesic_s, rep_graph), (self.n_points, n_points)
+            space.metric.dist(rep_geodesic_s, rep_graph), (self.n_points, n_graphs)
         )
+        perms = gs.reshape(space.metric.perm_, (self.n_points, n_graphs, -1))
 
         min_dists_idx = gs.argmin(dists, axis=0)
+        graph_idx = gs.arange(n_graphs)
+        return dists[min_dists_idx, graph_idx], perms[min_dists_idx, graph_idx]
+
+    def _compute_dists(self, space, geodesic, graph):
+        geodesic_s = self._get_geodesic_s(geodesic)
+
+        n_points = self._get_n_points(graph)
+        if n_points == 1:
+            graph = gs.expand_dims(graph, axis=0)
+
+        chunk_size = n_points if self.chunk_size is None else self.chunk_size
+        min_dists, perms = [], []
+        for start in range(0, n_points, chunk_size):
+            min_dists_chunk, perms_chunk = self._compute_dists_chunk(
+                space, geodesic_s, graph[start : start + chunk_size]
+            )
+            min_dists.append(min_dists_chunk)
+            perms.append(perms_chunk)
 
-        return dists, min_dists_idx, n_points
+        return gs.concatenate(min_dists), gs.concatenate(perms), n_points
 
     def dist(self, space, geodesic, graph_to_permute):
         """Compute the distance between the geodesic and the point.
@@ -500,14 +805,9 @@ class PointToGeodesicAligner(_BasePointToGeodesicAligner):
         dist : array-like, shape=[..., n_nodes]
             Distance between the graph_to_permute and the geodesic.
         """
-        dists, min_dists_idx, n_points = self._compute_dists(
-            space, geodesic, graph_to_permute
-        )
+        dists, _, _ = self._compute_dists(space, geodesic, graph_to_permute)
 
-        return gs.take(
-            gs.transpose(dists),
-            min_dists_idx + gs.arange(n_points) * self.n_points,
-        )
+        return dists
 
     def align(self, space, geodesic, graph_to_permute):
         """Align the graph to the geodesic.
@@ -524,25 +824,47 @@ class PointToGeodesicAligner(_BasePointToGeodesicAligner):
         permuted_graph : array-like, shape=[..., n_nodes]
             Permuted graph as to be aligned with respect to the geodesic.
         """
-        _, min_dists_idx, n_points = self._compute_dists(
-            space, geodesic, graph_to_permute
-        )
-
-        perm_indices = min_dists_idx * n_points + gs.arange(n_points)
-        if n_points == 1:
-            perm_indices = perm_indices[0]
+        _, perms, n_points = self._compute_dists(space, geodesic, graph_to_permute)
 
-        self.perm_ = gs.take(space.metric.perm_, perm_indices, axis=0)
+        self.perm_ = perms[0] if n_points == 1 else perms
 
         return self._permute(space, graph_to_permute, self.perm_)
 
 
 class _GeodesicToPointAligner(_BasePointToGeodesicAligner):
-    def __init__(self, method="BFGS", *, save_opt_res=False):
+    """Alignment of points to a geodesic by continuous optimization.
+
+    The parameter of the closest point along the geodesic is found for each
+    graph by minimizing the distance, starting from the initial point of the
+    geodesic.
+
+    Parameters
+    ----------
+    method : str
+        If 'newton', the squared distances of all the graphs are minimized
+        simultaneously by a safeguarded Newton method using finite
+        differences, evaluating the distances of all the graphs in one call.
+        Otherwise, name of the `scipy.optimize.minimize` method used for
+        each graph in turn.
+        Optional, default: 'BFGS'.
+    save_opt_res : bool
+        Whether to save the optimization results, one per graph.
+        Optional, default: False.
+    max_iter : int
+        Maximum number of iterations of the Newton method.
+        Optional, default: 100.
+    tol : float
+        Tolerance on the step of the Newton method.
+        Optional, default: 1e-8.
+    """
+
+    def __init__(self, method="BFGS", *, save_opt_res=False, max_iter=100, tol=1e-8):
         super().__init__()
 
         self.method = method
         self.save_opt_res = save_opt_res
+        self.max_iter = max_iter
+        self.tol = tol
 
         self.opt_results_ = None
 
@@ -552,12 +874,98 @@ class _GeodesicToPointAligner(_BasePointToGeodesicAligner):
 
         return dist
 
+    def _batched_sq_objective(self, s, space, graph, geodesic):
+        """Squared distances of graphs to the points of parameters s."""
+        if s.shape[0] == 0:
+            return gs.zeros(0)
+        return space.metric.dist(geodesic(s), graph) ** 2
+
+    def _minimize_newton(self, space, geodesic, graph_to_permute):
+        """Minimize the squared distances of all graphs simultaneously."""
+        n_graphs = graph_to_permute.shape[0]
+        step_fd = gs.sqrt(self.tol)
+
+        s = gs.zeros(n_graphs)
+        fun = self._batched_sq_objective(s, space, graph_to_permute, geodesic)
+        active = gs.ones(n_graphs, dtype=bool)
+        n_iters = gs.zeros(n_graphs, dtype=gs.int64)
+        for n_iter in range(1, self.max_iter + 1):
+            n_iters = gs.where(active, n_iter, n_iters)
+            s_active, fun_active = s[active], fun[active]
+            graph_active = graph_to_permute[active]
+
+            fun_fd = self._batched_sq_objective(
+                gs.concatenate([s_active + step_fd, s_active - step_fd]),
+                space,
+                gs.concatenate([graph_active, graph_active]),
+                geodesic,
+            )
+            fun_plus, fun_minus = gs.split(fun_fd, 2)
+            grad = (fun_plus - fun_minus) / (2 * step_fd)
+            hess = (fun_plus - 2 * fun_active + fun_minus) / step_fd**2
+            step = gs.where(hess > 0.0, -grad / gs.where(hess > 0.0, hess, 1.0), -grad)
+
+            # backtracking, halving the steps which do not decrease the objective
+            accepted = gs.zeros(s_active.shape[0], dtype=bool)
+            for _ in range(30):
+                pending = ~accepted
+                new_fun = self._batched_sq_objective(
+                    s_active[pending] + step[pending],
+                    space,
+                    graph_active[pending],
+                    geodesic,
+                )
+                is_decrease = new_fun <= fun_active[pending]
+                s_active = gs.assignment(
+                    s_active,
+                    gs.where(
+                        is_decrease,
+                        s_active[pending] + step[pending],
+                        s_active[pending],
+                    ),
+                    pending,
+                )
+                fun_active = gs.assignment(
+                    fun_active,
+                    gs.where(is_decrease, new_fun, fun_active[pending]),
+                    pending,
+                )
+                accepted = gs.assignment(accepted, is_decrease, pending)
+                step = gs.where(accepted, step, step / 2.0)
+                if gs.all(accepted):
+                    break
+
+            s = gs.assignment(s, s_active, active)
+            fun = gs.assignment(fun, fun_active, active)
+            active = gs.assignment(active, accepted & (gs.abs(step) > self.tol), active)
+            if not gs.any(active):
+                break
+
+        dists = space.metric.dist(geodesic(s), graph_to_permute)
+        perms = space.metric.perm_
+        opt_results = [
+            scipy.optimize.OptimizeResult(
+                x=s_, fun=dist, nit=int(n_iters_), success=not bool(active_)
+            )
+            for s_, dist, n_iters_, active_ in zip(s, dists, n_iters, active)
+        ]
+        return dists, perms, opt_results
+
     def _compute_dists(self, space, geodesic, graph_to_permute):
         n_points = self._get_n_points(graph_to_permute)
 
         if n_points == 1:
             graph_to_permute = gs.expand_dims(graph_to_permute, axis=0)
 
+        if self.method == "newton":
+            min_dists, perms, opt_results = self._minimize_newton(
+                space, geodesic, graph_to_permute
+            )
+            if self.save_opt_res:
+                self.opt_results_ = opt_results
+
+            return min_dists, gs.reshape(perms, (n_points, -1)), n_points
+
         perms = []
         min_dists = []
         opt_results = []
@@ -597,10 +1005,12 @@ class GraphPoint(Point):
     r"""Class for the GraphPoint.
 
     Points are represented by :math:`nodes \times nodes` adjacency matrices.
+    Sparse networks can be stored as scipy.sparse matrices, which are turned
+    into dense arrays only when computations require it.
 
     Parameters
     ----------
-    adj : array-like, shape=[n_nodes, n_nodes]
+    adj : array-like or scipy.sparse matrix, shape=[n_nodes, n_nodes]
         Adjacency matrix.
 
     References
@@ -630,10 +1040,14 @@ class GraphPoint(Point):
 
     def to_array(self):
         """Return a copy of the adjacency matrix."""
+        if scipy.sparse.issparse(self.adj):
+            return _to_dense(self.adj)
         return gs.copy(self.adj)
 
     def to_networkx(self):
         """Turn the graph into a networkx format."""
+        if scipy.sparse.issparse(self.adj):
+            return nx.from_scipy_sparse_array(self.adj)
         return nx.from_numpy_array(self.adj)
 
 
@@ -779,25 +1193,16 @@ class GraphSpace(PointSet):
         graphs_permuted : array-like, shape=[..., n_nodes, n_nodes]
             Graphs permuted.
         """
+        permutation = gs.cast(gs.array(permutation), gs.int64)
+        rows = permutation[..., :, None]
+        cols = permutation[..., None, :]
 
-        def _get_permutation_matrix(indices_):
-            return gs.array_from_sparse(
-                data=gs.ones(self.n_nodes, dtype=gs.int64),
-                indices=list(zip(range(self.n_nodes), indices_)),
-                target_shape=(self.n_nodes, self.n_nodes),
-            )
-
-        if gs.ndim(permutation) == 1:
-            perm_matrices = _get_permutation_matrix(permutation)
+        if gs.ndim(permutation) == 1 or gs.ndim(graph_to_permute) == 2:
+            permuted_graph = graph_to_permute[..., rows, cols]
         else:
-            perm_matrices = []
-            for indices_ in permutation:
-                perm_matrices.append(_get_permutation_matrix(indices_))
-            perm_matrices = gs.stack(perm_matrices)
+            batch = gs.arange(graph_to_permute.shape[0])[:, None, None]
+            permuted_graph = graph_to_permute[batch, rows, cols]
 
-        permuted_graph = Matrices.mul(
-            perm_matrices, graph_to_permute, Matrices.transpose(perm_matrices)
-        )
         if gs.ndim(permuted_graph) == 3 and gs.shape(permuted_graph)[0] == 1:
             return permuted_graph[0]
 
@@ -870,10 +1275,12 @@ class GraphSpaceMetric(PointSetMetric):
 
         Parameters
         ----------
-        aligner : str
+        aligner : str or _BaseAligner
             'ID' Identity
             'FAQ' Fast Quadratic Assignment - only compatible with Frobenious norm
             'exhaustive' all group exhaustive search
+            An aligner instance can also be given, e.g. a `CachedAligner` to
+            reuse the permutations of pairs of graphs aligned before.
 
         References
         ----------
@@ -10,7 +10,6 @@ from geomstats.geometry.stratified.point_set import (
     PointSet,
     PointSetMetric,
     _vectorize_point,
-    broadcast_lists,
 )
 
 
@@ -107,6 +106,50 @@ class Spider(PointSet):
             ]
         return [SpiderPoint(stratum=0, stratum_coord=0)] * n_samples
 
+    @staticmethod
+    @_vectorize_point((0, "points"))
+    def points_to_arrays(points):
+        r"""Turn points into their array-native representation.
+
+        Parameters
+        ----------
+        points : SpiderPoint or list of SpiderPoint, shape=[...]
+            Points in the Spider.
+
+        Returns
+        -------
+        strata : array-like, shape=[...]
+            Integer array with the stratum of each point.
+        stratum_coords : array-like, shape=[...]
+            Array with the coordinate of each point on its stratum.
+        """
+        strata = gs.array([int(point.stratum) for point in points])
+        stratum_coords = gs.array([float(point.stratum_coord) for point in points])
+        return strata, stratum_coords
+
+    @staticmethod
+    def arrays_to_points(strata, stratum_coords):
+        r"""Turn the array-native representation into points.
+
+        Parameters
+        ----------
+        strata : array-like, shape=[...]
+            Integer array with the stratum of each point.
+        stratum_coords : array-like, shape=[...]
+            Array with the coordinate of each point on its stratum.
+
+        Returns
+        -------
+        points : list of SpiderPoint, shape=[...]
+            Points in the Spider, nested as the input arrays.
+        """
+        if gs.ndim(strata) == 0:
+            return SpiderPoint(stratum=int(strata), stratum_coord=float(stratum_coords))
+        return [
+            Spider.arrays_to_points(strata_, stratum_coords_)
+            for strata_, stratum_coords_ in zip(strata, stratum_coords)
+        ]
+
     @_vectorize_point((1, "point"))
     def belongs(self, point):
         r"""Check if a random point belongs to the spider set.
@@ -199,6 +242,33 @@ class SpiderMetric(PointSetMetric):
         """Get number of rays."""
         return self._space.n_rays
 
+    def dist_from_arrays(self, strata_a, coords_a, strata_b, coords_b):
+        """Compute distances between points given as arrays.
+
+        Points on the same ray, or pairs where one point is the origin, are at
+        the distance given by the ray geometry. Points on different rays are at
+        distance d(x, 0) + d(0, y).
+
+        Parameters
+        ----------
+        strata_a : array-like, shape=[...]
+            Strata of the first points.
+        coords_a : array-like, shape=[...]
+            Stratum coordinates of the first points.
+        strata_b : array-like, shape=[...]
+            Strata of the second points.
+        coords_b : array-like, shape=[...]
+            Stratum coordinates of the second points.
+
+        Returns
+        -------
+        dist : array-like, shape=[...]
+            Distances.
+        """
+        same_ray = (strata_a == strata_b) | (strata_a == 0) | (strata_b == 0)
+        ray_dist = self.ray_metric.norm(gs.expand_dims(coords_a - coords_b, axis=-1))
+        return gs.where(same_ray, ray_dist, coords_a + coords_b)
+
     @_vectorize_point((1, "a"), (2, "b"))
     def dist(self, point_a, point_b):
         """Compute the distance between two points on the Spider using the ray geometry.
@@ -218,102 +288,84 @@ class SpiderMetric(PointSetMetric):
         point_array : array-like, shape=[...]
             An array with the distance.
         """
-        point_a, point_b = broadcast_lists(point_a, point_b)
-
-        result = []
-        for point_a_, point_b_ in zip(point_a, point_b):
-            if (
-                point_a_.stratum == point_b_.stratum
-                or point_a_.stratum == 0
-                or point_b_.stratum == 0
-            ):
-                result += [
-                    self.ray_metric.norm(
-                        gs.array([point_a_.stratum_coord - point_b_.stratum_coord])
-                    )
-                ]
-            else:
-                result += [point_a_.stratum_coord + point_b_.stratum_coord]
-        return gs.array(result) if len(result) != 1 else result[0]
+        result = self.dist_from_arrays(
+            *Spider.points_to_arrays(point_a), *Spider.points_to_arrays(point_b)
+        )
+        return result if len(result) != 1 else result[0]
 
-    @_vectorize_point((1, "initial_point"), (2, "end_point"))
-    def geodesic(self, initial_point, end_point):
-        """Return the geodesic between two lists of Spider points.
+    def geodesic_from_arrays(self, strata_a, coords_a, strata_b, coords_b):
+        """Compute geodesics between points given as arrays.
+
+        On different rays, the geodesic passes through the origin. It is computed
+        as the ray geodesic from the opposite of the initial coordinate to the
+        end coordinate, negative values lying on the initial ray.
 
         Parameters
         ----------
-        initial_point : SpiderPoint or list of SpiderPoint, shape=[...]
-             Point in the Spider.
-        end_point : SpiderPoint or list of SpiderPoint, shape=[...]
-             Point in the Spider.
+        strata_a : array-like, shape=[n_geodesics]
+            Strata of the initial points.
+        coords_a : array-like, shape=[n_geodesics]
+            Stratum coordinates of the initial points.
+        strata_b : array-like, shape=[n_geodesics]
+            Strata of the end points.
+        coords_b : array-like, shape=[n_geodesics]
+            Stratum coordinates of the end points.
 
         Returns
         -------
-        geo : function
-            Return a vectorized geodesic function.
+        path : callable
+            Time parametrized geodesics, returning the strata and stratum
+            coordinates of the points, each of shape=[n_geodesics, n_times].
         """
+        strata_a, strata_b = gs.broadcast_arrays(strata_a, strata_b)
+        coords_a, coords_b = gs.broadcast_arrays(coords_a, coords_b)
+        same_ray = (strata_a == strata_b) | (strata_a == 0) | (strata_b == 0)
 
-        def _vec(t, fncs):
-            if len(fncs) == 1:
-                return fncs[0](t)
-
-            return [fnc(t) for fnc in fncs]
-
-        initial_point, end_point = broadcast_lists(initial_point, end_point)
+        ray_geodesic = self.ray_metric.geodesic(
+            initial_point=gs.expand_dims(gs.where(same_ray, coords_a, -coords_a), -1),
+            end_point=gs.expand_dims(coords_b, -1),
+        )
+        same_ray = same_ray[:, None]
+        strata_a, strata_b = strata_a[:, None], strata_b[:, None]
+
+        def path(t):
+            t = gs.reshape(gs.array(t, dtype=coords_a.dtype), (-1,))
+            ray_coords = gs.reshape(ray_geodesic(t), (coords_a.shape[0], t.shape[0]))
+
+            ray_strata = gs.where(ray_coords != 0.0, gs.maximum(strata_a, strata_b), 0)
+            strata = gs.where(
+                same_ray,
+                ray_strata,
+                gs.where(ray_coords < 0.0, strata_a, strata_b),
+            )
+            stratum_coords = gs.where(same_ray, ray_coords, gs.abs(ray_coords))
+            return strata, stratum_coords
 
-        fncs = [
-            self._point_geodesic(pt_a, pt_b)
-            for (pt_a, pt_b) in zip(initial_point, end_point)
-        ]
-        return lambda t: _vec(t, fncs=fncs)
+        return path
 
-    def _point_geodesic(self, initial_point, end_point):
-        """Compute the distance between two Spider points.
+    @_vectorize_point((1, "initial_point"), (2, "end_point"))
+    def geodesic(self, initial_point, end_point):
+        """Return the geodesic between two lists of Spider points.
 
         Parameters
         ----------
-        initial_point : SpiderPoint
+        initial_point : SpiderPoint or list of SpiderPoint, shape=[...]
              Point in the Spider.
-        end_point : SpiderPoint
+        end_point : SpiderPoint or list of SpiderPoint, shape=[...]
              Point in the Spider.
 
         Returns
         -------
-        geo: function
-            Geodesic between two Spider Points.
+        geo : function
+            Return a vectorized geodesic function.
         """
-        if (
-            initial_point.stratum == end_point.stratum
-            or initial_point.stratum == 0
-            or end_point.stratum == 0
-        ):
-            s = gs.maximum(initial_point.stratum, end_point.stratum)
-
-            def ray_geo(t):
-                g = self.ray_metric.geodesic(
-                    initial_point=gs.array([initial_point.stratum_coord]),
-                    end_point=gs.array([end_point.stratum_coord]),
-                )
-
-                x = g(t)
-                return [
-                    SpiderPoint(stratum=s if xx[0] else 0, stratum_coord=xx[0])
-                    for xx in x
-                ]
-
-            return ray_geo
-
-        def ray_geo(t):
-            g = self.ray_metric.geodesic(
-                initial_point=gs.array([-initial_point.stratum_coord]),
-                end_point=gs.array([end_point.stratum_coord]),
-            )
-            x = g(t)
-            return [
-                SpiderPoint(stratum=initial_point.stratum, stratum_coord=-xx[0])
-                if xx < 0.0
-                else SpiderPoint(stratum=end_point.stratum, stratum_coord=xx[0])
-                for xx in x
-            ]
+        path = self.geodesic_from_arrays(
+            *Spider.points_to_arrays(initial_point),
+            *Spider.points_to_arrays(end_point),
+        )
+
+        def _vec(t):
+            points = Spider.arrays_to_points(*path(t))
+            return points[0] if len(points) == 1 else points
 
-        return ray_geo
+        return _vec
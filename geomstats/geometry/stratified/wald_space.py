@@ -55,6 +55,48 @@ import geomstats.geometry.spd_matrices as spd
 from geomstats.geometry.stratified.point_set import Point, PointSet, _vectorize_point
 
 
+def _labels_to_mask(labels):
+    """Encode a set of labels as an integer bitmask.
+
+    Parameters
+    ----------
+    labels : iterable of int
+        Labels, non-negative integers.
+
+    Returns
+    -------
+    mask : int
+        Integer whose bit u is set if and only if u is in labels.
+    """
+    mask = 0
+    for label in labels:
+        mask |= 1 << int(label)
+    return mask
+
+
+def _mask_to_labels(mask):
+    """Decode an integer bitmask into the sorted list of its labels.
+
+    Parameters
+    ----------
+    mask : int
+        Integer bitmask.
+
+    Returns
+    -------
+    labels : list of int
+        Labels whose bit is set in mask, in increasing order.
+    """
+    labels = []
+    label = 0
+    while mask:
+        if mask & 1:
+            labels.append(label)
+        mask >>= 1
+        label += 1
+    return labels
+
+
 @functools.total_ordering
 class Split:
     r"""Class for two-set partitions of sets.
@@ -77,6 +119,13 @@ class Split:
         The second part of the split, an iterable that is a subset of
         :math:`\{0,\dots,n-1\}`. It may be empty, but must have empty intersection with
         ``part1``.
+
+    Attributes
+    ----------
+    mask1 : int
+        Bitmask of ``self.part1``, whose bit u is set if u is in the part.
+    mask2 : int
+        Bitmask of ``self.part2``, whose bit u is set if u is in the part.
     """
 
     def __init__(self, part1, part2):
@@ -93,6 +142,21 @@ class Split:
             self.part1 = part1 or part2
             self.part2 = set()
 
+        self.mask1 = _labels_to_mask(self.part1)
+        self.mask2 = _labels_to_mask(self.part2)
+        self._hash = hash((tuple(self.part1), tuple(self.part2)))
+
+    @staticmethod
+    def _to_mask(labels):
+        """Encode a label or a collection of labels as a bitmask."""
+        if isinstance(labels, int):
+            return 1 << labels
+        return _labels_to_mask(labels)
+
+    def _part_contains_mask(self, mask):
+        """Determine if the labels of a bitmask are contained in either part."""
+        return not mask & ~self.mask1 or not mask & ~self.mask2
+
     def __bool__(self):
         """Return True if and only if both parts are non-empty.
 
@@ -104,7 +168,7 @@ class Split:
         boolean_of_split : bool
             Returns the boolean representation of a split.
         """
-        return bool(self.part1) and bool(self.part2)
+        return bool(self.mask1) and bool(self.mask2)
 
     def __eq__(self, other):
         """Check for equal hashes of the two splits.
@@ -124,14 +188,15 @@ class Split:
     def __hash__(self):
         """Compute the hash of a split.
 
-        Note that this hash simply uses the hash function for tuples.
+        Note that this hash simply uses the hash function for tuples, and is
+        computed once at initialization.
 
         Returns
         -------
         hash_of_split : int
             Return the hash of the split.
         """
-        return hash((tuple(self.part1), tuple(self.part2)))
+        return self._hash
 
     def __lt__(self, other):
         """Check if the hash of this split is less than the hash of the other split.
@@ -194,9 +259,9 @@ class Split:
         is_compatible_with : bool
             Return ``True`` if the splits are compatible, else ``False``.
         """
-        p1, p2 = self.part1, self.part2
-        o1, o2 = other.part1, other.part2
-        return sum([bool(s) for s in [p1 & o1, p1 & o2, p2 & o1, p2 & o2]]) < 4
+        p1, p2 = self.mask1, self.mask2
+        o1, o2 = other.mask1, other.mask2
+        return not (p1 & o1 and p1 & o2 and p2 & o1 and p2 & o2)
 
     def get_part_away_from(self, other):
         """Return the part of this split that is directed away from other split.
@@ -212,7 +277,7 @@ class Split:
             Return the part of the split ``self`` that does not point toward
             ``other``. See ``self.get_part_towards`` for further explanation.
         """
-        if other.part_contains(self.part1):
+        if other._part_contains_mask(self.mask1):
             return self.part1
         return self.part2
 
@@ -237,7 +302,7 @@ class Split:
         part_towards : iterable
             Return the part of the split ``self`` that points toward ``other_split``.
         """
-        if other.part_contains(self.part1):
+        if other._part_contains_mask(self.mask1):
             return self.part2
         return self.part1
 
@@ -255,7 +320,7 @@ class Split:
             A boolean that is true if the subset is contained in ``self.part1`` or
             ``self.part2``.
         """
-        return subset.issubset(self.part1) or subset.issubset(self.part2)
+        return self._part_contains_mask(_labels_to_mask(subset))
 
     def restrict_to(self, subset: set):
         r"""Return the restriction of a split to a subset.
@@ -271,9 +336,10 @@ class Split:
             The restricted split, if the split is :math:`A\vert B`, then the split
             restricted to the subset :math:`C` is :math:`A\cap C\vert B\cap C`.
         """
+        mask = _labels_to_mask(subset)
         return Split(
-            part1=self.part1 & subset,
-            part2=self.part2 & subset,
+            part1=_mask_to_labels(self.mask1 & mask),
+            part2=_mask_to_labels(self.mask2 & mask),
         )
 
     def separates(self, u, v):
@@ -292,10 +358,9 @@ class Split:
             A boolean determining whether u and v are separated by the split (i.e. if
              they are not in the same part).
         """
-        u = {u} if isinstance(u, int) else set(u)
-        v = {v} if isinstance(v, int) else set(v)
-        b1 = u.issubset(self.part1) and v.issubset(self.part2)
-        b2 = v.issubset(self.part1) and u.issubset(self.part2)
+        u, v = self._to_mask(u), self._to_mask(v)
+        b1 = not u & ~self.mask1 and not v & ~self.mask2
+        b2 = not v & ~self.mask1 and not u & ~self.mask2
         return b1 or b2
 
 
@@ -330,11 +395,11 @@ class Topology:
         A list of dictionaries, each dictionary is for the respective connected
         component of the forest, and the items of each dictionary are for each pair
         of labels u, v, u < v in the respective component, a list of the splits on the
-        unique path between the labels u and v.
+        unique path between the labels u and v. Computed on first access.
     support : list of array-like
         For each split, give an :math:`n\times n` dimensional matrix, where the
         uv-th entry is ``True`` if the split separates the labels u and v, else
-        ``False``.
+        ``False``. Computed on first access.
     """
 
     def __init__(self, n_labels, partition, split_sets):
@@ -353,26 +418,62 @@ class Topology:
         lengths = [len(splits) for splits in self.split_sets]
         self.sep = [0] + [sum(lengths[0:j]) for j in range(1, len(lengths) + 1)]
 
-        self.paths = [
-            {
-                (u, v): [s for s in splits if s.separates(u, v)]
-                for u, v in itertools.combinations(part, r=2)
-            }
-            for part, splits in zip(self.partition, self.split_sets)
-        ]
+        splits = self.flatten(self.split_sets)
+        self._sides = gs.reshape(
+            gs.array(
+                [
+                    [
+                        (split.mask1 >> u & 1) - (split.mask2 >> u & 1)
+                        for u in range(self.n_labels)
+                    ]
+                    for split in splits
+                ]
+            ),
+            (len(splits), self.n_labels),
+        )
 
-        _support = [
-            gs.zeros((self.n_labels, self.n_labels), dtype=bool)
-            for _ in self.flatten(self.split_sets)
-        ]
-        for path_dict in self.paths:
-            for (u, v), path in path_dict.items():
-                for split in path:
-                    _support[self.where[split]][u][v] = True
-                    _support[self.where[split]][v][u] = True
-        self.support = [gs.array(m) for m in self.flatten(_support)]
+        components = [0] * self.n_labels
+        for index, part in enumerate(self.partition):
+            for u in part:
+                components[u] = index
+        components = gs.array(components)
+        self._same_component = components[:, None] == components[None, :]
+
+        self._paths = None
+        self._support = None
         self._chart_gradient = None
 
+    def _separations(self):
+        """Compute which splits separate which pairs of labels.
+
+        Returns
+        -------
+        separations : array-like, shape=[n_splits, n, n]
+            The kuv-th entry is ``True`` if the k-th split separates the labels u
+            and v, else ``False``.
+        """
+        return self._sides[:, :, None] * self._sides[:, None, :] < 0
+
+    @property
+    def paths(self):
+        """Splits on the path between each pair of labels of each component."""
+        if self._paths is None:
+            self._paths = [
+                {
+                    (u, v): [s for s in splits if s.separates(u, v)]
+                    for u, v in itertools.combinations(part, r=2)
+                }
+                for part, splits in zip(self.partition, self.split_sets)
+            ]
+        return self._paths
+
+    @property
+    def support(self):
+        """Pairs of labels separated by each split."""
+        if self._support is None:
+            self._support = list(self._separations())
+        return self._support
+
     def _check_init(self, n_labels, partition, split_sets):
         if len(split_sets) != len(partition):
             raise ValueError(
@@ -556,22 +657,24 @@ class Topology:
 
         Parameters
         ----------
-        x : array-like
+        x : array-like, shape=[..., n_splits]
             Takes a vector of length 'number of total splits' of the structure.
 
         Returns
         -------
-        corr : array-like, shape=[n, n]
+        corr : array-like, shape=[..., n, n]
             Returns the corresponding correlation matrix.
         """
-        corr = gs.zeros((self.n_labels, self.n_labels))
-        for path_dict in self.paths:
-            for (u, v), path in path_dict.items():
-                corr[u][v] = gs.prod([1 - x[self.where[split]] for split in path])
-                corr[v][u] = corr[u][v]
-
-        corr = gs.array(corr)
-        return corr + gs.eye(corr.shape[0])
+        separations = self._separations()
+        if x.ndim == 1:
+            factors = gs.where(separations, 1 - x[:, None, None], 1.0)
+            corr = gs.prod(factors, axis=0)
+        else:
+            corr = gs.ones(x.shape[:-1] + (self.n_labels, self.n_labels))
+            for index, separation in enumerate(separations):
+                factor = 1 - x[..., index, None, None]
+                corr = gs.where(separation, corr * factor, corr)
+        return gs.where(self._same_component, corr, 0.0)
 
     def corr_gradient(self, x):
         """Compute the gradient of the correlation matrix, differentiated by weights.
@@ -588,7 +691,10 @@ class Topology:
         """
         x_list = [[y if i != k else 0 for i, y in enumerate(x)] for k in range(len(x))]
         gradient = gs.array(
-            [-supp * self.corr(x) for supp, x in zip(self.support, x_list)]
+            [
+                gs.where(supp, -self.corr(gs.array(x)), 0.0)
+                for supp, x in zip(self.support, x_list)
+            ]
         )
         return gradient
 
@@ -644,7 +750,14 @@ class Wald(Point):
         super().__init__()
         self.topology = topology
         self.weights = weights
-        self.corr = self.topology.corr(weights)
+        self._corr = None
+
+    @property
+    def corr(self):
+        """Correlation matrix of the wald, computed on first access."""
+        if self._corr is None:
+            self._corr = self.topology.corr(self.weights)
+        return self._corr
 
     @property
     def n_labels(self):
@@ -723,20 +836,27 @@ class Wald(Point):
         ----------
         labels : list[int]
             A list of integers, the set of labels that we generate splits for.
-        splits : list[Split]
-            A list of splits of the set of labels.
+        splits : list[tuple[int, int]]
+            A list of splits of the set of labels, each given by the bitmasks of
+            its two parts.
 
         Returns
         -------
         are_separated : bool
             True if the labels are pair-wise separated by a split else False.
         """
-        return gs.all(
-            [
-                gs.any([sp.separates(u, v) for sp in splits])
-                for u, v in itertools.combinations(labels, 2)
-            ]
-        )
+        labels_mask = _labels_to_mask(labels)
+        for u in labels:
+            u_mask = 1 << u
+            separated_from_u = u_mask
+            for mask1, mask2 in splits:
+                if mask1 & u_mask:
+                    separated_from_u |= mask2
+                elif mask2 & u_mask:
+                    separated_from_u |= mask1
+            if labels_mask & ~separated_from_u:
+                return False
+        return True
 
     @staticmethod
     def _delete_splits(splits, labels, p_keep, check=True):
@@ -748,8 +868,9 @@ class Wald(Point):
 
         Parameters
         ----------
-        splits : list[Split]
-            A list of splits of the set of labels.
+        splits : list[tuple[int, int]]
+            A list of splits of the set of labels, each given by the bitmasks of
+            its two parts.
         labels : list[int]
             A list of integers, the set of labels that we generate splits for.
         p_keep : float
@@ -761,24 +882,24 @@ class Wald(Point):
 
         Returns
         -------
-        left_over_splits : list[Split]
+        left_over_splits : list[tuple[int, int]]
             The list of splits that are not deleted.
         """
         if p_keep == 1:
             return splits
+        to_delete = gs.random.rand(len(splits)) > p_keep
         for i in reversed(range(len(splits))):
-            if gs.random.rand(1) > p_keep:
-                splits_cp = splits.copy()
-                splits_cp.pop(i)
-                if not check:
-                    splits = splits_cp
-                elif Wald._check_if_separated(splits=splits_cp, labels=labels):
+            if to_delete[i]:
+                splits_cp = splits[:i] + splits[i + 1 :]
+                if not check or Wald._check_if_separated(
+                    splits=splits_cp, labels=labels
+                ):
                     splits = splits_cp
         return splits
 
     @staticmethod
-    def _generate_partition(n_labels, p_new):
-        r"""Generate a random partition of :math:`\{0,\dots,n-1\}`.
+    def _generate_partitions(n_labels, p_new, n_samples=1):
+        r"""Generate random partitions of :math:`\{0,\dots,n-1\}`.
 
         This algorithm works as follows: Start with a single set containing zero,
         then successively add the labels from 1 to n-1 to the partition in the
@@ -786,25 +907,42 @@ class Wald(Point):
         label u to a random existing set of the partition, else add a new singleton
         set {u} to the partition (i.e. with probability 1 - `probability`).
 
+        The random choices are drawn for all samples at once, and the components
+        of the labels are assigned to all samples simultaneously.
+
         Parameters
         ----------
+        n_labels : int
+            Number of labels.
         p_new : float
             A float between 0 and 1, the probability that no new component is added,
             and 1 - probability that a new component is added.
+        n_samples : int
+            Number of partitions to generate. Optional, default: 1.
 
         Returns
         -------
-        partition : list[list[int]]
-            A partition of the set :math:`\{0,\dots,n-1\}` into non-empty sets.
+        partitions : list[list[list[int]]], shape=[n_samples]
+            Partitions of the set :math:`\{0,\dots,n-1\}` into non-empty sets.
         """
-        _partition = [[0]]
+        is_joined = gs.random.rand(n_samples, n_labels) < p_new
+        uniform = gs.random.rand(n_samples, n_labels)
+
+        n_components = gs.ones(n_samples, dtype=gs.int64)
+        components = [gs.zeros(n_samples, dtype=gs.int64)]
         for u in range(1, n_labels):
-            if gs.random.rand(1) < p_new:
-                index = int(gs.random.randint(0, len(_partition), (1,)))
-                _partition[index].append(u)
-            else:
-                _partition.append([u])
-        return _partition
+            existing = gs.cast(gs.floor(uniform[:, u] * n_components), gs.int64)
+            components.append(gs.where(is_joined[:, u], existing, n_components))
+            n_components = n_components + gs.cast(~is_joined[:, u], gs.int64)
+        components = gs.stack(components, axis=1)
+
+        partitions = []
+        for sample_components, n_sample_components in zip(components, n_components):
+            partition = [[] for _ in range(int(n_sample_components))]
+            for u, component in enumerate(sample_components):
+                partition[int(component)].append(u)
+            partitions.append(partition)
+        return partitions
 
     @staticmethod
     def _generate_splits(labels):
@@ -823,41 +961,116 @@ class Wald(Point):
 
         Returns
         -------
-        splits : list[Split]
-            A list of splits of the set of labels, maximal number of splits.
+        splits : list[tuple[int, int]]
+            A list of splits of the set of labels, maximal number of splits, each
+            given by the bitmasks of its two parts.
         """
         if len(labels) <= 1:
             return []
-        unused_labels = labels.copy()
-        random_index = int(gs.random.randint(0, len(unused_labels), (1,)))
-        u = unused_labels.pop(random_index)
-        random_index = int(gs.random.randint(0, len(unused_labels), (1,)))
-        v = unused_labels.pop(random_index)
-        used_labels = [u, v]
-        splits = [Split(part1={u}, part2={v})]
-        while unused_labels:
-            random_index = int(gs.random.randint(0, len(unused_labels), (1,)))
-            u = unused_labels.pop(random_index)
-            updated_splits = [Split(part1={u}, part2=used_labels)]
-            random_index = int(gs.random.randint(0, len(splits), (1,)))
-            divided_split = splits.pop(random_index)
-            updated_splits.append(
-                Split(part1=divided_split.part1 | {u}, part2=divided_split.part2)
-            )
-            updated_splits.append(
-                Split(part1=divided_split.part1, part2=divided_split.part2 | {u})
-            )
-            for split in splits:
-                updated_splits.append(
-                    Split(
-                        part1=split.get_part_away_from(divided_split),
-                        part2=split.get_part_towards(divided_split) | {u},
-                    )
-                )
-            used_labels.append(u)
+        keys = gs.random.rand(len(labels))
+        uniform = gs.random.rand(len(labels) - 2)
+        labels = [
+            labels[index] for index in sorted(range(len(labels)), key=keys.__getitem__)
+        ]
+
+        used_labels = (1 << labels[0]) | (1 << labels[1])
+        splits = [(1 << labels[0], 1 << labels[1])]
+        for u, uniform_ in zip(labels[2:], uniform):
+            u_mask = 1 << u
+            divided1, divided2 = splits.pop(int(uniform_ * len(splits)))
+            updated_splits = [
+                (u_mask, used_labels),
+                (divided1 | u_mask, divided2),
+                (divided1, divided2 | u_mask),
+            ]
+            for mask1, mask2 in splits:
+                if not mask1 & ~divided1 or not mask1 & ~divided2:
+                    updated_splits.append((mask1, mask2 | u_mask))
+                else:
+                    updated_splits.append((mask2, mask1 | u_mask))
+            used_labels |= u_mask
             splits = updated_splits
         return splits
 
+    @staticmethod
+    def generate_walder(n_labels, n_samples, p_keep, p_new, btol=10**-8, check=True):
+        """Generate random instances of class ``Wald``.
+
+        The partitions and the weights of all wälder are drawn at once. Wälder
+        sharing the same topology share the same instance of ``Topology``.
+
+        Parameters
+        ----------
+        n_labels : int
+            The number of labels the wälder are generated with respect to.
+        n_samples : int
+            Number of wälder to generate.
+        p_keep : float
+            The probability will be inserted into the generation of a partition as
+            well as for the generation of a split set for the topology of the wald.
+        p_new : float
+            A float between 0 and 1, the probability that no new component is added,
+            and probability of 1 - p_new_ that a new component is added.
+        btol: float
+            Tolerance for the boundary of the coordinates in each grove. Defaults to
+            1e-08.
+        check : bool
+            If True, checks if splits still separate all labels. In this case, the split
+            will not be deleted. If False, any split can be randomly deleted.
+
+        Returns
+        -------
+        random_walder : list[Wald], shape=[n_samples]
+            The randomly generated wälder.
+        """
+        partitions = Wald._generate_partitions(
+            n_labels=n_labels, p_new=p_new, n_samples=n_samples
+        )
+
+        topologies = {}
+        sample_topologies = []
+        for partition in partitions:
+            split_sets = [
+                Wald._delete_splits(
+                    splits=Wald._generate_splits(labels=part),
+                    labels=part,
+                    p_keep=p_keep,
+                    check=check,
+                )
+                for part in partition
+            ]
+            key = (
+                tuple(tuple(part) for part in partition),
+                frozenset(
+                    frozenset(split) for splits in split_sets for split in splits
+                ),
+            )
+            if key not in topologies:
+                split_sets = [
+                    [
+                        Split(
+                            part1=_mask_to_labels(mask1), part2=_mask_to_labels(mask2)
+                        )
+                        for mask1, mask2 in splits
+                    ]
+                    for splits in split_sets
+                ]
+                topologies[key] = Topology(
+                    n_labels=n_labels, partition=partition, split_sets=split_sets
+                )
+            sample_topologies.append(topologies[key])
+
+        n_splits = [len(top.where) for top in sample_topologies]
+        x = gs.random.uniform(size=(sum(n_splits),), low=0, high=1)
+        x = gs.minimum(gs.maximum(btol, x), 1 - btol)
+
+        walder = []
+        start = 0
+        for top, n_splits_ in zip(sample_topologies, n_splits):
+            walder.append(Wald(topology=top, weights=x[start : start + n_splits_]))
+            start += n_splits_
+        return walder
+
     @staticmethod
     def generate_wald(n_labels, p_keep, p_new, btol=10**-8, check=True):
         """Generate a random instance of class ``Wald``.
@@ -884,16 +1097,9 @@ class Wald(Point):
         random_wald : Wald
             The randomly generated wald.
         """
-        partition = Wald._generate_partition(n_labels=n_labels, p_new=p_new)
-        split_sets = [Wald._generate_splits(labels=_part) for _part in partition]
-        split_sets = [
-            Wald._delete_splits(splits=splits, labels=part, p_keep=p_keep, check=check)
-            for part, splits in zip(partition, split_sets)
+        return Wald.generate_walder(n_labels, 1, p_keep, p_new, btol=btol, check=check)[
+            0
         ]
-        top = Topology(n_labels=n_labels, partition=partition, split_sets=split_sets)
-        x = gs.random.uniform(size=(len(top.flatten(split_sets)),), low=0, high=1)
-        x = gs.minimum(gs.maximum(btol, x), 1 - btol)
-        return Wald(topology=top, weights=x)
 
 
 class WaldSpace(PointSet):
@@ -971,11 +1177,9 @@ class WaldSpace(PointSet):
             Points sampled in Wald space.
         """
         p_new = p_tree ** (1 / (self.n_labels - 1))
-        sample = [
-            Wald.generate_wald(self.n_labels, p_keep, p_new, btol, check=True)
-            for _ in range(n_samples)
-        ]
-        return sample
+        return Wald.generate_walder(
+            self.n_labels, n_samples, p_keep, p_new, btol, check=True
+        )
 
     @_vectorize_point((1, "point"))
     def set_to_array(self, points):
@@ -991,5 +1195,16 @@ class WaldSpace(PointSet):
         points_array : array-like, shape=[...]
             Array of the wälder that are turned into arrays.
         """
-        results = gs.array([wald.to_array() for wald in points])
-        return results
+        indices = {}
+        for index, wald in enumerate(points):
+            indices.setdefault(wald.topology, []).append(index)
+
+        results = [None] * len(points)
+        for topology, topology_indices in indices.items():
+            if len(topology_indices) == 1:
+                results[topology_indices[0]] = points[topology_indices[0]].corr
+                continue
+            weights = gs.stack([points[index].weights for index in topology_indices])
+            for index, corr in zip(topology_indices, topology.corr(weights)):
+                results[index] = corr
+        return gs.stack(results)
@@ -53,6 +53,26 @@ class InformationManifoldMixin:
         """
         raise NotImplementedError("`point_to_pdf` has not yet been implemented.")
 
+    def point_to_log_pdf(self, point):
+        """Compute log-pdf associated to point.
+
+        Compute the logarithm of the probability density function of the
+        probability distribution with parameters provided by point.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., dim]
+            Point representing a probability distribution.
+
+        Returns
+        -------
+        log_pdf : function
+            Logarithm of the probability density function of the probability
+            distribution with parameters provided by point.
+        """
+        pdf = self.point_to_pdf(point)
+        return lambda x: gs.log(pdf(x))
+
     def point_to_cdf(self, point):
         """Compute cdf associated to point.
 
@@ -180,9 +200,7 @@ class ScipyMultivariateRandomVariable(ScipyRandomVariable):
 
     def _pdf_single(self, x, point):
         out = self.scp_pdf(x, point)
-        if x.shape[0] == 1 and point.ndim == self.space.point_ndim:
-            return gs.array([out])
-        return gs.from_numpy(out)
+        return gs.reshape(gs.array(out), (-1,))
 
     def pdf(self, x, point):
         """Evaluate the probability density function at x.
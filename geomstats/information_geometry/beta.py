@@ -83,7 +83,7 @@ class BetaDistributions(DirichletDistributions):
 
             Parameters
             ----------
-            x : array-like, shape=[n_samples,]
+            x : array-like, shape=[..., n_samples]
                 Points at which to compute the probability density function.
 
             Returns
@@ -92,7 +92,7 @@ class BetaDistributions(DirichletDistributions):
                 Values of pdf at x for each value of the parameters provided
                 by point.
             """
-            x = gs.reshape(gs.array(x), (-1,))
+            x = gs.to_ndarray(gs.array(x), to_ndim=1)
             return (
                 x ** (alpha - 1)
                 * (1 - x) ** (beta - 1)
@@ -20,7 +20,7 @@ from geomstats.information_geometry.base import (
 from geomstats.numerics.bvp import ScipySolveBVP
 from geomstats.numerics.geodesic import ExpODESolver, LogODESolver
 from geomstats.numerics.ivp import ScipySolveIVP
-from geomstats.vectorization import repeat_out
+from geomstats.vectorization import get_batch_shape, repeat_out
 
 
 class DirichletDistributions(InformationManifoldMixin, OpenSet):
@@ -42,7 +42,6 @@ class DirichletDistributions(InformationManifoldMixin, OpenSet):
             embedding_space=Euclidean(dim=dim, equip=False),
             equip=equip,
         )
-        self._scp_rv = DirichletRandomVariable(self)
 
     @staticmethod
     def default_metric():
@@ -134,8 +133,18 @@ class DirichletDistributions(InformationManifoldMixin, OpenSet):
         -------
         samples : array-like, shape=[..., n_samples, dim]
             Sample from the Dirichlet distributions.
+
+        Notes
+        -----
+        Samples are obtained by normalizing independent Gamma random variables
+        with shape parameters given by point, for all points at once.
         """
-        return self._scp_rv.rvs(point, n_samples)
+        batch_shape = get_batch_shape(self, point)
+        shape = gs.broadcast_to(
+            gs.expand_dims(point, axis=-2), batch_shape + (n_samples, self.dim)
+        )
+        gamma_sample = gs.random.gamma(shape)
+        return gamma_sample / gs.sum(gamma_sample, axis=-1, keepdims=True)
 
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
@@ -154,7 +163,51 @@ class DirichletDistributions(InformationManifoldMixin, OpenSet):
             Probability density function of the Dirichlet distribution with
             parameters provided by point.
         """
-        return lambda x: self._scp_rv.pdf(x, point=point)
+        log_pdf = self.point_to_log_pdf(point)
+        return lambda x: gs.exp(log_pdf(x))
+
+    def point_to_log_pdf(self, point):
+        """Compute log-pdf associated to point.
+
+        Compute the logarithm of the probability density function of the
+        Dirichlet distribution with parameters provided by point.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., dim]
+            Point representing a Dirichlet distribution.
+
+        Returns
+        -------
+        log_pdf : function
+            Logarithm of the probability density function of the Dirichlet
+            distribution with parameters provided by point.
+        """
+        point = gs.expand_dims(point, axis=-2)
+        log_normalization = gs.gammaln(gs.sum(point, axis=-1)) - gs.sum(
+            gs.gammaln(point), axis=-1
+        )
+
+        def log_pdf(x):
+            """Generate parameterized function for Dirichlet log-pdf.
+
+            Parameters
+            ----------
+            x : array-like, shape=[n_samples, dim] or [dim]
+                Points of the simplex at which to compute the log-pdf.
+
+            Returns
+            -------
+            log_pdf_at_x : array-like, shape=[..., n_samples] or [...]
+                Values of the log-pdf at x for each value of the parameters
+                provided by point. The samples axis is dropped for a single x.
+            """
+            log_pdf_at_x = log_normalization + gs.sum(
+                (point - 1.0) * gs.log(gs.reshape(x, (-1, self.dim))), axis=-1
+            )
+            return log_pdf_at_x[..., 0] if x.ndim == 1 else log_pdf_at_x
+
+        return log_pdf
 
 
 class DirichletMetric(RiemannianMetric):
@@ -168,6 +221,74 @@ class DirichletMetric(RiemannianMetric):
         )
         self.exp_solver = ExpODESolver(integrator=ScipySolveIVP(method="LSODA"))
 
+    @staticmethod
+    def _polygammas(base_point, max_order):
+        """Evaluate polygamma functions at the parameters and at their sum.
+
+        Each order is evaluated in a single call, so that the metric matrix,
+        the Christoffel symbols and their Jacobian share the same evaluations.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., dim]
+            Base point.
+        max_order : int
+            Highest order of the polygamma functions to evaluate.
+
+        Returns
+        -------
+        polygammas : list of tuples
+            For each order from 1 to max_order, the polygamma function
+            evaluated at the parameters, shape=[..., dim], and at their
+            sum, shape=[...].
+        """
+        values = gs.concatenate(
+            [base_point, gs.expand_dims(gs.sum(base_point, axis=-1), axis=-1)],
+            axis=-1,
+        )
+        polygammas = []
+        for order in range(1, max_order + 1):
+            polygamma = gs.polygamma(order, values)
+            polygammas.append((polygamma[..., :-1], polygamma[..., -1]))
+        return polygammas
+
+    @staticmethod
+    def _christoffels_coefficients(polygammas):
+        r"""Compute the coefficients of the Christoffel symbols.
+
+        The Christoffel symbols write
+        :math:`2 \Gamma^k_{ij} = c_2^k + c_1^k \delta_{ij} r_i
+        + \delta_{ij} \delta_{ik} r_k`.
+
+        Parameters
+        ----------
+        polygammas : list of tuples
+            Output of `_polygammas` with max_order at least 2.
+
+        Returns
+        -------
+        coef_1 : array-like, shape=[..., dim]
+            Coefficients :math:`c_1`.
+        coef_2 : array-like, shape=[..., dim]
+            Coefficients :math:`c_2`.
+        ratio : array-like, shape=[..., dim]
+            Ratios :math:`r` of the second and first polygamma functions.
+        ratio_sum : array-like, shape=[...]
+            Ratio of the second and first polygamma functions at the sum.
+        denominator : array-like, shape=[...]
+            Denominator of the coefficients :math:`c_1`.
+        """
+        (trigamma, trigamma_sum), (tetragamma, tetragamma_sum) = polygammas[:2]
+        inv_trigamma = 1 / trigamma
+        denominator = 1 / trigamma_sum - gs.sum(inv_trigamma, axis=-1)
+
+        ratio = tetragamma / trigamma
+        ratio_sum = tetragamma_sum / trigamma_sum
+
+        coef_1 = inv_trigamma / gs.expand_dims(denominator, axis=-1)
+        coef_2 = -coef_1 * gs.expand_dims(ratio_sum, axis=-1)
+        return coef_1, coef_2, ratio, ratio_sum, denominator
+
     def metric_matrix(self, base_point):
         """Compute the inner-product matrix.
 
@@ -184,15 +305,12 @@ class DirichletMetric(RiemannianMetric):
         mat : array-like, shape=[..., dim, dim]
             Inner-product matrix.
         """
-        base_point = gs.to_ndarray(base_point, to_ndim=2)
-        n_points = base_point.shape[0]
-
-        mat_ones = gs.ones((n_points, self._space.dim, self._space.dim))
-        poly_sum = gs.polygamma(1, gs.sum(base_point, -1))
-        mat_diag = from_vector_to_diagonal_matrix(gs.polygamma(1, base_point))
+        ((trigamma, trigamma_sum),) = self._polygammas(base_point, 1)
+        dim = self._space.dim
 
-        mat = mat_diag - gs.einsum("i,ijk->ijk", poly_sum, mat_ones)
-        return gs.squeeze(mat)
+        return from_vector_to_diagonal_matrix(trigamma) - gs.einsum(
+            "...,ij->...ij", trigamma_sum, gs.ones((dim, dim))
+        )
 
     def christoffels(self, base_point):
         """Compute the Christoffel symbols.
@@ -217,51 +335,19 @@ class DirichletMetric(RiemannianMetric):
             the first dimension.
             :math: 'christoffels[..., i, j, k] = Gamma^i_{jk}'
         """
-        base_point = gs.to_ndarray(base_point, to_ndim=2)
-        n_points = base_point.shape[0]
-
-        def coefficients(ind_k):
-            """Christoffel symbols for contravariant index ind_k."""
-            param_k = base_point[..., ind_k]
-            param_sum = gs.sum(base_point, -1)
-            c1 = (
-                1
-                / gs.polygamma(1, param_k)
-                / (
-                    1 / gs.polygamma(1, param_sum)
-                    - gs.sum(1 / gs.polygamma(1, base_point), -1)
-                )
-            )
-            c2 = -c1 * gs.polygamma(2, param_sum) / gs.polygamma(1, param_sum)
-
-            mat_ones = gs.ones((n_points, self._space.dim, self._space.dim))
-            mat_diag = from_vector_to_diagonal_matrix(
-                -gs.polygamma(2, base_point) / gs.polygamma(1, base_point)
-            )
-            arrays = [
-                gs.zeros((1, ind_k)),
-                gs.ones((1, 1)),
-                gs.zeros((1, self._space.dim - ind_k - 1)),
-            ]
-            vec_k = gs.tile(gs.hstack(arrays), (n_points, 1))
-            val_k = gs.polygamma(2, param_k) / gs.polygamma(1, param_k)
-            vec_k = gs.einsum("i,ij->ij", val_k, vec_k)
-            mat_k = from_vector_to_diagonal_matrix(vec_k)
-
-            mat = (
-                gs.einsum("i,ijk->ijk", c2, mat_ones)
-                - gs.einsum("i,ijk->ijk", c1, mat_diag)
-                + mat_k
-            )
-
-            return 1 / 2 * mat
+        polygammas = self._polygammas(base_point, 2)
+        coef_1, coef_2, ratio, _, _ = self._christoffels_coefficients(polygammas)
 
-        christoffels = []
-        for ind_k in range(self._space.dim):
-            christoffels.append(coefficients(ind_k))
-        christoffels = gs.stack(christoffels, 1)
+        dim = self._space.dim
+        eye = gs.eye(dim)
+        diag_3 = gs.einsum("ki,kj->kij", eye, eye)
 
-        return gs.squeeze(christoffels)
+        christoffels = (
+            gs.einsum("...k,ij->...kij", coef_2, gs.ones((dim, dim)))
+            + gs.einsum("...k,...i,ij->...kij", coef_1, ratio, eye)
+            + gs.einsum("...k,kij->...kij", ratio, diag_3)
+        )
+        return christoffels / 2
 
     def jacobian_christoffels(self, base_point):
         """Compute the Jacobian of the Christoffel symbols.
@@ -280,79 +366,45 @@ class DirichletMetric(RiemannianMetric):
             Jacobian of the Christoffel symbols.
             :math: 'jac[..., i, j, k, l] = dGamma^i_{jk} / dx_l'
         """
-        dim = self._space.dim
-        n_dim = base_point.ndim
-        param = gs.transpose(base_point)
-        sum_param = gs.sum(param, 0)
-        term_1 = 1 / gs.polygamma(1, param)
-        term_2 = 1 / gs.polygamma(1, sum_param)
-        term_3 = -gs.polygamma(2, param) / gs.polygamma(1, param) ** 2
-        term_4 = -gs.polygamma(2, sum_param) / gs.polygamma(1, sum_param) ** 2
-        term_5 = term_3 / term_1
-        term_6 = term_4 / term_2
-        term_7 = (
-            gs.polygamma(2, param) ** 2
-            - gs.polygamma(1, param) * gs.polygamma(3, param)
-        ) / gs.polygamma(1, param) ** 2
-        term_8 = (
-            gs.polygamma(2, sum_param) ** 2
-            - gs.polygamma(1, sum_param) * gs.polygamma(3, sum_param)
-        ) / gs.polygamma(1, sum_param) ** 2
-        term_9 = term_2 - gs.sum(term_1, 0)
-
-        jac_1 = term_1 * term_8 / term_9
-        jac_1_mat = gs.squeeze(gs.tile(jac_1, (dim, dim, dim, 1, 1)))
-        jac_2 = (
-            -term_6
-            / term_9**2
-            * gs.einsum("j...,i...->ji...", term_4 - term_3, term_1)
-        )
-        jac_2_mat = gs.squeeze(gs.tile(jac_2, (dim, dim, 1, 1, 1)))
-        jac_3 = term_3 * term_6 / term_9
-        jac_3_mat = gs.transpose(from_vector_to_diagonal_matrix(gs.transpose(jac_3)))
-        jac_3_mat = gs.squeeze(gs.tile(jac_3_mat, (dim, dim, 1, 1, 1)))
-        jac_4 = (
-            1
-            / term_9**2
-            * gs.einsum("k...,j...,i...->kji...", term_5, term_4 - term_3, term_1)
-        )
-        jac_4_mat = gs.transpose(from_vector_to_diagonal_matrix(gs.transpose(jac_4)))
-        jac_5 = -gs.einsum("j...,i...->ji...", term_7, term_1) / term_9
-        jac_5_mat = from_vector_to_diagonal_matrix(gs.transpose(jac_5))
-        jac_5_mat = gs.transpose(from_vector_to_diagonal_matrix(jac_5_mat))
-        jac_6 = -gs.einsum("k...,j...->kj...", term_5, term_3) / term_9
-        jac_6_mat = gs.transpose(from_vector_to_diagonal_matrix(gs.transpose(jac_6)))
-        jac_6_mat = (
-            gs.transpose(
-                from_vector_to_diagonal_matrix(gs.transpose(jac_6_mat, [0, 1, 3, 2])),
-                [0, 1, 3, 4, 2],
-            )
-            if n_dim > 1
-            else from_vector_to_diagonal_matrix(jac_6_mat)
+        polygammas = self._polygammas(base_point, 3)
+        (
+            coef_1,
+            coef_2,
+            ratio,
+            ratio_sum,
+            denominator,
+        ) = self._christoffels_coefficients(polygammas)
+        (trigamma, trigamma_sum), _, (pentagamma, pentagamma_sum) = polygammas
+
+        ratio_derivative = pentagamma / trigamma - ratio**2
+        ratio_sum_derivative = pentagamma_sum / trigamma_sum - ratio_sum**2
+        denominator_derivative = ratio / trigamma - gs.expand_dims(
+            ratio_sum / trigamma_sum, axis=-1
         )
-        jac_7 = -from_vector_to_diagonal_matrix(gs.transpose(term_7))
-        jac_7_mat = from_vector_to_diagonal_matrix(jac_7)
-        jac_7_mat = gs.transpose(from_vector_to_diagonal_matrix(jac_7_mat))
 
-        jac = (
-            1
-            / 2
-            * (
-                jac_1_mat
-                + jac_2_mat
-                + jac_3_mat
-                + jac_4_mat
-                + jac_5_mat
-                + jac_6_mat
-                + jac_7_mat
-            )
+        dim = self._space.dim
+        eye = gs.eye(dim)
+        diag_3 = gs.einsum("ki,kj->kij", eye, eye)
+        diag_4 = gs.einsum("kij,kl->kijl", diag_3, eye)
+
+        coef_1_derivative = -gs.einsum(
+            "...k,kl->...kl", ratio * coef_1, eye
+        ) - gs.einsum(
+            "...k,...l->...kl",
+            coef_1 / gs.expand_dims(denominator, axis=-1),
+            denominator_derivative,
         )
+        coef_2_derivative = -gs.einsum(
+            "...kl,...->...kl", coef_1_derivative, ratio_sum
+        ) - gs.einsum("...k,...,l->...kl", coef_1, ratio_sum_derivative, gs.ones(dim))
 
-        return (
-            gs.transpose(jac, [3, 1, 0, 2])
-            if n_dim == 1
-            else gs.transpose(jac, [4, 3, 1, 0, 2])
+        jac = (
+            gs.einsum("...kl,ij->...kijl", coef_2_derivative, gs.ones((dim, dim)))
+            + gs.einsum("...kl,...i,ij->...kijl", coef_1_derivative, ratio, eye)
+            + gs.einsum("...k,...i,ijl->...kijl", coef_1, ratio_derivative, diag_3)
+            + gs.einsum("...k,kijl->...kijl", ratio_derivative, diag_4)
         )
+        return jac / 2
 
     def injectivity_radius(self, base_point):
         """Compute the radius of the injectivity domain.
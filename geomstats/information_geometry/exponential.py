@@ -147,14 +147,14 @@ class ExponentialDistributions(InformationManifoldMixin, OpenSet):
 
             Parameters
             ----------
-            x : array-like, shape=[n_points,]
+            x : array-like, shape=[..., n_points]
                 Points at which to compute the probability density function.
 
             Returns
             -------
             pdf_at_x : array-like, shape=[..., n_points]
             """
-            x = gs.reshape(gs.array(x), (-1,))
+            x = gs.to_ndarray(gs.array(x), to_ndim=1)
             pdf_at_x = point * gs.exp(-point * x)
             return gs.where(x >= 0, pdf_at_x, 0.0)
 
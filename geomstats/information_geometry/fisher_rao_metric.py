@@ -1,10 +1,94 @@
 """Class to implement simply the Fisher-Rao metric on information manifolds."""
 
+import logging
+import math
+
+import numpy as np
 from scipy.integrate import quad_vec
+from scipy.special import roots_hermite, roots_laguerre, roots_legendre
 
 import geomstats.backend as gs
 from geomstats.geometry.riemannian_metric import RiemannianMetric
 
+N_SCALES = 8.0
+MAX_ITER = 50
+TOL = 1e-6
+RULES = ("hermite", "laguerre", "legendre")
+
+
+def _standard_gauss_rules(n_nodes):
+    """Compute the standard Gauss-Hermite, Laguerre and Legendre rules.
+
+    The weight functions of the Hermite and Laguerre rules are folded into the
+    returned weights, so that the integral of any function g is approximated
+    by sum(weights * g(nodes)). Nodes whose weight underflows are dropped.
+
+    Parameters
+    ----------
+    n_nodes : int
+        Number of quadrature nodes.
+
+    Returns
+    -------
+    rules : dict
+        Nodes and weights of each rule, keyed by 'hermite', 'laguerre' and
+        'legendre'.
+    """
+    nodes, weights = roots_hermite(n_nodes)
+    nodes, weights = nodes[weights > 0.0], weights[weights > 0.0]
+    hermite = nodes, np.exp(np.log(weights) + nodes**2)
+
+    nodes, weights = roots_laguerre(n_nodes)
+    nodes, weights = nodes[weights > 0.0], weights[weights > 0.0]
+    laguerre = nodes, np.exp(np.log(weights) + nodes)
+
+    return {
+        "hermite": hermite,
+        "laguerre": laguerre,
+        "legendre": roots_legendre(n_nodes),
+    }
+
+
+def _pilot_grid(support, n_decades=8, n_per_decade=20):
+    """Compute a grid of nodes and trapezoidal weights spanning the support.
+
+    A bounded support is sampled uniformly. Otherwise the nodes are spaced
+    geometrically away from the finite bound, or from zero, so that the grid
+    resolves distributions of scales ranging over several orders of magnitude.
+
+    Parameters
+    ----------
+    support : list, shape = (2,)
+        Left and right bounds of the support, possibly infinite.
+    n_decades : int
+        Number of orders of magnitude spanned on each side of the origin.
+        Optional, default: 8.
+    n_per_decade : int
+        Number of nodes per order of magnitude.
+        Optional, default: 20.
+
+    Returns
+    -------
+    nodes : array-like, shape=[n_grid]
+        Nodes of the grid.
+    weights : array-like, shape=[n_grid]
+        Trapezoidal weights.
+    """
+    left, right = support
+    n_grid = 2 * n_decades * n_per_decade + 1
+    offsets = np.logspace(-n_decades, n_decades, n_grid)
+
+    if math.isfinite(left) and math.isfinite(right):
+        nodes = np.linspace(left, right, n_grid)[1:-1]
+    elif math.isfinite(left):
+        nodes = left + offsets
+    elif math.isfinite(right):
+        nodes = right - offsets[::-1]
+    else:
+        nodes = np.concatenate([-offsets[::-1], [0.0], offsets])
+
+    return nodes, np.gradient(nodes)
+
 
 class FisherRaoMetric(RiemannianMetric):
     r"""Class to derive the information metric from the pdf in InformationManifoldMixin.
@@ -22,14 +106,502 @@ class FisherRaoMetric(RiemannianMetric):
     support : list, shape = (2,)
         Left and right bounds for the support of the distribution.
         But this is just to help integration, bounds should be as large as needed.
+    n_nodes : int
+        Number of nodes of the Gauss quadrature rules used instead of adaptive
+        integration. The standard Hermite, Laguerre and Legendre rules are
+        computed once, and shifted and scaled for each base point. The mean
+        and standard deviation of the distributions are estimated on a grid
+        for all base points at once, then refined on their Gauss rules until
+        they are stable. The rule of a base point is built around them:
+        Hermite if both bounds of the support are more than `N_SCALES`
+        standard deviations away from the mean, Laguerre from the bound closer
+        than that if only one is, Legendre on the support otherwise. The pdf
+        and its derivatives are then evaluated at the nodes of all base
+        points sharing a rule in a single batched call, which makes the metric
+        cheap enough to be used by geodesic solvers. This requires the pdf to
+        broadcast samples of shape=[..., n_samples] against the base points.
+        The rule of a base point is accepted if the pdf integrates to one and
+        its derivatives to zero on it. Otherwise, e.g. when the pdf or its
+        logarithm is singular at a bound of the support as for beta or gamma
+        distributions with a small shape parameter, or when the grid misses
+        the distribution, `scipy.integrate.quad_vec` is used at this base
+        point only, and a warning is logged the first time. If None,
+        `scipy.integrate.quad_vec` is always used.
+        Optional, default: None.
     """
 
-    def __init__(self, space, support):
+    def __init__(self, space, support, n_nodes=None):
         super().__init__(
             space=space,
             signature=(space.dim, 0),
         )
         self.support = support
+        self.n_nodes = n_nodes
+
+        self._rules = self._pilot_nodes = self._pilot_weights = None
+        if n_nodes is not None:
+            self._rules = {}
+            for rule, (nodes, weights) in _standard_gauss_rules(n_nodes).items():
+                self._rules[rule] = (
+                    *self._from_numpy(nodes, weights),
+                    int(np.argmin(np.abs(nodes))),
+                )
+            self._pilot_nodes, self._pilot_weights = self._from_numpy(
+                *_pilot_grid(support)
+            )
+        self._has_warned = False
+
+    @staticmethod
+    def _from_numpy(*arrays):
+        dtype = gs.get_default_dtype()
+        return [gs.cast(gs.from_numpy(array), dtype) for array in arrays]
+
+    def _rule_parameters(self, location, scale):
+        """Choose the Gauss rules adapted to locations and scales.
+
+        Parameters
+        ----------
+        location : array-like, shape=[n_points]
+            Locations of the distributions, e.g. their means.
+        scale : array-like, shape=[n_points]
+            Scales of the distributions, e.g. their standard deviations.
+
+        Returns
+        -------
+        rule_index : array-like, shape=[n_points]
+            Index in `RULES` of the rule of each distribution.
+        shift : array-like, shape=[n_points]
+            Shift applied to the standard nodes.
+        scaling : array-like, shape=[n_points]
+            Scaling applied to the standard nodes, negative for a Laguerre
+            rule from the right bound.
+        """
+        left, right = self.support
+        false = gs.zeros(location.shape, dtype=bool)
+        left_near = location - left < N_SCALES * scale if math.isfinite(left) else false
+        right_near = (
+            right - location < N_SCALES * scale if math.isfinite(right) else false
+        )
+        is_legendre = gs.logical_and(left_near, right_near)
+        is_laguerre = left_near != right_near
+
+        rule_index = gs.where(
+            is_legendre,
+            RULES.index("legendre"),
+            gs.where(is_laguerre, RULES.index("laguerre"), RULES.index("hermite")),
+        )
+        center, half_length = 0.0, 1.0
+        if math.isfinite(left) and math.isfinite(right):
+            center, half_length = (left + right) / 2.0, (right - left) / 2.0
+        shift = gs.where(
+            is_legendre,
+            center,
+            gs.where(left_near, left, gs.where(right_near, right, location)),
+        )
+        scaling = gs.where(
+            is_legendre,
+            half_length,
+            gs.where(
+                left_near,
+                scale,
+                gs.where(right_near, -scale, math.sqrt(2.0) * scale),
+            ),
+        )
+        return rule_index, shift, scaling
+
+    def _shifted_rule(self, rule, shift, scaling):
+        """Shift and scale a standard Gauss rule.
+
+        Nodes outside the support are moved to the node closest to the shift,
+        and their weights are set to zero.
+
+        Parameters
+        ----------
+        rule : str, {'hermite', 'laguerre', 'legendre'}
+            Standard rule.
+        shift : array-like, shape=[...]
+            Shift applied to the standard nodes.
+        scaling : array-like, shape=[...]
+            Scaling applied to the standard nodes.
+
+        Returns
+        -------
+        nodes : array-like, shape=[..., n]
+            Quadrature nodes, with n <= n_nodes.
+        weights : array-like, shape=[..., n]
+            Quadrature weights.
+        """
+        standard_nodes, standard_weights, safe_index = self._rules[rule]
+        shift = gs.expand_dims(shift, axis=-1)
+        scaling = gs.expand_dims(scaling, axis=-1)
+
+        nodes = shift + scaling * standard_nodes
+        left, right = self.support
+        inside = gs.logical_and(nodes > left, nodes < right)
+        nodes = gs.where(inside, nodes, shift + scaling * standard_nodes[safe_index])
+        weights = gs.where(inside, gs.abs(scaling) * standard_weights, 0.0)
+        return nodes, weights
+
+    def _pdf_at_rule(self, rule):
+        """Get the function evaluating the pdf at the nodes of a shifted rule.
+
+        The shift and the scaling of the rule are appended to the point, so
+        that all points are evaluated at their own nodes in a single call,
+        and differentiated together.
+
+        Parameters
+        ----------
+        rule : str, {'hermite', 'laguerre', 'legendre'}
+            Standard rule.
+
+        Returns
+        -------
+        pdf_at_nodes : callable
+            Function mapping a point on the manifold, followed by the shift
+            and the scaling of its rule, with shape=[..., dim + 2], to the pdf
+            of its distribution at the nodes, with shape=[..., n].
+        """
+        dim = self._space.dim
+
+        def pdf_at_nodes(augmented_point):
+            nodes, _ = self._shifted_rule(
+                rule, augmented_point[..., dim], augmented_point[..., dim + 1]
+            )
+            return self._space.point_to_pdf(augmented_point[..., :dim])(nodes)
+
+        return pdf_at_nodes
+
+    @staticmethod
+    def _moments(nodes, weights, pdf_at_nodes):
+        """Compute the mass, mean and standard deviation of distributions.
+
+        Parameters
+        ----------
+        nodes : array-like, shape=[..., n]
+            Quadrature nodes.
+        weights : array-like, shape=[..., n]
+            Quadrature weights.
+        pdf_at_nodes : array-like, shape=[..., n]
+            Pdf of the distributions at the nodes.
+
+        Returns
+        -------
+        mass : array-like, shape=[...]
+            Integral of the pdf.
+        mean : array-like, shape=[...]
+            Mean of the distributions.
+        std : array-like, shape=[...]
+            Standard deviation of the distributions.
+        """
+        mass = gs.sum(weights * pdf_at_nodes, axis=-1)
+        safe_mass = gs.expand_dims(gs.where(mass > 0.0, mass, 1.0), axis=-1)
+        mean = gs.sum(weights * nodes * pdf_at_nodes / safe_mass, axis=-1)
+        variance = gs.sum(
+            weights * (nodes - gs.expand_dims(mean, axis=-1)) ** 2 * pdf_at_nodes,
+            axis=-1,
+        )
+        return mass, mean, gs.sqrt(variance / safe_mass[..., 0])
+
+    def _moments_at_rules(self, points, rule_index, shift, scaling):
+        """Compute the moments of distributions with their Gauss rules.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_points, dim]
+            Points on the manifold.
+        rule_index : array-like, shape=[n_points]
+            Index in `RULES` of the rule of each point.
+        shift : array-like, shape=[n_points]
+            Shift applied to the standard nodes.
+        scaling : array-like, shape=[n_points]
+            Scaling applied to the standard nodes.
+
+        Returns
+        -------
+        moments : list of array-like, shape=[n_points]
+            Mass, mean and standard deviation of the distributions.
+        """
+        moments = [gs.zeros(points.shape[:1], dtype=points.dtype) for _ in range(3)]
+        for index, rule in enumerate(RULES):
+            uses_rule = rule_index == index
+            if not gs.any(uses_rule):
+                continue
+
+            nodes, weights = self._shifted_rule(
+                rule, shift[uses_rule], scaling[uses_rule]
+            )
+            pdf = self._space.point_to_pdf(points[uses_rule])(nodes)
+            moments = [
+                gs.assignment(moment, new_moment, uses_rule)
+                for moment, new_moment in zip(
+                    moments, self._moments(nodes, weights, pdf)
+                )
+            ]
+        return moments
+
+    def _adapted_gauss_rules(self, points):
+        """Compute the Gauss rules adapted to the distributions of points.
+
+        The means and standard deviations are estimated on the pilot grid,
+        then on Gauss rules built around the current estimates, until they
+        are stable. Only the points whose estimates still move are refined.
+
+        Parameters
+        ----------
+        points : array-like, shape=[n_points, dim]
+            Points on the manifold.
+
+        Returns
+        -------
+        rule_index : array-like, shape=[n_points]
+            Index in `RULES` of the rule of each point.
+        shift : array-like, shape=[n_points]
+            Shift applied to the standard nodes.
+        scaling : array-like, shape=[n_points]
+            Scaling applied to the standard nodes.
+        is_located : array-like, shape=[n_points]
+            Whether the pdf is found on the grid. Otherwise, the rule is
+            meaningless.
+        """
+        pdf_at_grid = self._space.point_to_pdf(points)(self._pilot_nodes)
+        mass, location, scale = self._moments(
+            self._pilot_nodes, self._pilot_weights, pdf_at_grid
+        )
+        is_located = gs.logical_and(
+            mass > 0.0, gs.logical_and(gs.abs(location) < math.inf, scale < math.inf)
+        )
+        location = gs.where(is_located, location, 0.0)
+        # the grid does not resolve scales smaller than its spacing
+        spacing = self._pilot_weights[
+            gs.argmax(self._pilot_weights * pdf_at_grid, axis=-1)
+        ]
+        scale = gs.where(is_located, gs.maximum(scale, spacing), 1.0)
+
+        is_moving = is_located
+        for _ in range(MAX_ITER):
+            if not gs.any(is_moving):
+                break
+
+            new_mass, new_location, new_scale = self._moments_at_rules(
+                points[is_moving],
+                *self._rule_parameters(location[is_moving], scale[is_moving]),
+            )
+            is_valid = gs.logical_and(new_mass > 0.0, new_scale < math.inf)
+            is_converged = gs.logical_and(
+                gs.abs(new_location - location[is_moving]) <= 1e-3 * new_scale,
+                gs.abs(new_scale - scale[is_moving]) <= 1e-3 * new_scale,
+            )
+            location = gs.assignment(
+                location,
+                gs.where(is_valid, new_location, location[is_moving]),
+                is_moving,
+            )
+            scale = gs.assignment(
+                scale, gs.where(is_valid, new_scale, scale[is_moving]), is_moving
+            )
+            is_moving = gs.assignment(
+                is_moving, gs.logical_and(is_valid, ~is_converged), is_moving
+            )
+
+        return (*self._rule_parameters(location, scale), is_located)
+
+    def _is_accurate(self, weights, pdf, pdf_derivative):
+        """Check that rules integrate the pdf and its derivatives.
+
+        The pdf must integrate to one and its derivatives to zero, i.e. the
+        score must have zero mean, up to `TOL` times its standard deviation.
+
+        Parameters
+        ----------
+        weights : array-like, shape=[..., n]
+            Quadrature weights.
+        pdf : array-like, shape=[..., n]
+            Pdf at the quadrature nodes.
+        pdf_derivative : array-like, shape=[..., n, dim]
+            Derivative of the pdf with respect to the parameters at the nodes.
+
+        Returns
+        -------
+        is_accurate : array-like, shape=[...]
+            Whether each rule passes both checks.
+        """
+        mass = gs.sum(weights * pdf, axis=-1)
+        score_mean = gs.einsum("...n,...ni->...i", weights, pdf_derivative)
+        score_std = gs.sqrt(
+            gs.einsum(
+                "...n,...n,...ni->...i",
+                weights,
+                self._safe_inverse(pdf),
+                pdf_derivative**2,
+            )
+        )
+        return gs.logical_and(
+            gs.abs(mass - 1.0) <= TOL,
+            gs.all(gs.abs(score_mean) <= TOL * score_std, axis=-1),
+        )
+
+    def _integrate_with_gauss_rules(self, base_point, gauss_integral, quad_integral):
+        """Integrate with the adapted Gauss rules, or adaptively where inaccurate.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., dim]
+            Base point.
+        gauss_integral : callable
+            Function computing the integral from a rule and points augmented
+            with the shift and the scaling of their rule, and whether the
+            rule is accurate at each point.
+        quad_integral : callable
+            Function computing the integral at points by adaptive integration.
+
+        Returns
+        -------
+        integral_at_base_point : array-like, shape=[..., *integral_shape]
+            Integral at each base point.
+        """
+        batch_shape = base_point.shape[:-1]
+        points = gs.reshape(base_point, (-1, base_point.shape[-1]))
+        rule_index, shift, scaling, is_accurate = self._adapted_gauss_rules(points)
+
+        integrals = None
+        for index, rule in enumerate(RULES):
+            uses_rule = gs.logical_and(is_accurate, rule_index == index)
+            if not gs.any(uses_rule):
+                continue
+
+            augmented_points = gs.concatenate(
+                [
+                    points[uses_rule],
+                    gs.expand_dims(shift[uses_rule], axis=-1),
+                    gs.expand_dims(scaling[uses_rule], axis=-1),
+                ],
+                axis=-1,
+            )
+            integral, is_accurate_ = gauss_integral(rule, augmented_points)
+            if integrals is None:
+                integrals = gs.zeros(
+                    points.shape[:1] + integral.shape[1:], dtype=integral.dtype
+                )
+            integrals = gs.assignment(integrals, integral, uses_rule)
+            is_accurate = gs.assignment(is_accurate, is_accurate_, uses_rule)
+
+        if integrals is None:
+            integrals = quad_integral(points)
+        elif not gs.all(is_accurate):
+            if not self._has_warned:
+                logging.warning(
+                    "The Gauss rules of %d nodes are not accurate at %d of %d "
+                    "points. Using adaptive integration at these points. "
+                    "Further occurrences are not reported.",
+                    self.n_nodes,
+                    int(gs.sum(~is_accurate)),
+                    points.shape[0],
+                )
+                self._has_warned = True
+            integrals = gs.assignment(
+                integrals, quad_integral(points[~is_accurate]), ~is_accurate
+            )
+
+        return gs.reshape(integrals, batch_shape + integrals.shape[1:])
+
+    @staticmethod
+    def _safe_inverse(pdf):
+        """Invert the pdf, ignoring nodes where it is negligible.
+
+        Nodes far in the tails of the distribution, where the pdf is many
+        orders of magnitude below its maximum, do not contribute to the
+        integrals and are mapped to zero to avoid overflows.
+
+        Parameters
+        ----------
+        pdf : array-like, shape=[..., n_nodes]
+            Pdf at the quadrature nodes.
+
+        Returns
+        -------
+        inv_pdf : array-like, shape=[..., n_nodes]
+            Inverse of the pdf where non-negligible, zero elsewhere.
+        """
+        threshold = gs.expand_dims(gs.amax(pdf, axis=-1), axis=-1) * 1e-30
+        significant = pdf > threshold
+        return gs.where(significant, 1.0 / gs.where(significant, pdf, 1.0), 0.0)
+
+    def _gauss_metric_matrix(self, rule, augmented_point):
+        """Compute the inner-product matrix at points with a Gauss rule."""
+        dim = self._space.dim
+        _, weights = self._shifted_rule(
+            rule, augmented_point[..., dim], augmented_point[..., dim + 1]
+        )
+        pdf_at_nodes = self._pdf_at_rule(rule)
+        pdf = pdf_at_nodes(augmented_point)
+        pdf_derivative = gs.autodiff.jacobian_vec(pdf_at_nodes)(augmented_point)[
+            ..., :dim
+        ]
+
+        metric_mat = gs.einsum(
+            "...n,...n,...ni,...nj->...ij",
+            weights,
+            self._safe_inverse(pdf),
+            pdf_derivative,
+            pdf_derivative,
+        )
+        return metric_mat, self._is_accurate(weights, pdf, pdf_derivative)
+
+    def _gauss_inner_product_derivative_matrix(self, rule, augmented_point):
+        """Compute the inner-product derivative at points with a Gauss rule.
+
+        The second derivatives of the pdf only appear summed over the nodes
+        against the weighted scores. The hessian is thus taken of this sum,
+        which has dim values instead of one per node. The weighted scores are
+        appended to the points so that this is also done in a single call.
+        """
+        dim = self._space.dim
+        _, weights = self._shifted_rule(
+            rule, augmented_point[..., dim], augmented_point[..., dim + 1]
+        )
+        pdf_at_nodes = self._pdf_at_rule(rule)
+        pdf = pdf_at_nodes(augmented_point)
+        pdf_derivative = gs.autodiff.jacobian_vec(pdf_at_nodes)(augmented_point)[
+            ..., :dim
+        ]
+        score = gs.einsum("...n,...ni->...ni", self._safe_inverse(pdf), pdf_derivative)
+
+        n_augmented = augmented_point.shape[-1]
+
+        def pdf_against_weighted_score(point):
+            weighted_score = gs.reshape(
+                point[..., n_augmented:], point.shape[:-1] + (-1, dim)
+            )
+            return gs.einsum(
+                "...nj,...n->...j",
+                weighted_score,
+                pdf_at_nodes(point[..., :n_augmented]),
+            )
+
+        weighted_score = gs.einsum("...n,...nj->...nj", weights, score)
+        doubly_augmented_point = gs.concatenate(
+            [
+                augmented_point,
+                gs.reshape(weighted_score, weighted_score.shape[:-2] + (-1,)),
+            ],
+            axis=-1,
+        )
+        pdf_hessian = gs.autodiff.hessian_vec(
+            pdf_against_weighted_score, func_out_ndim=dim
+        )(doubly_augmented_point)[..., :dim, :dim]
+
+        mat = (
+            gs.einsum("...jki->...ijk", pdf_hessian)
+            + gs.einsum("...ikj->...ijk", pdf_hessian)
+            - gs.einsum(
+                "...n,...ni,...nj,...nk->...ijk",
+                weights,
+                score,
+                score,
+                pdf_derivative,
+            )
+        )
+        return mat, self._is_accurate(weights, pdf, pdf_derivative)
 
     def metric_matrix(self, base_point):
         r"""Compute the inner-product matrix.
@@ -85,24 +657,31 @@ class FisherRaoMetric(RiemannianMetric):
             """
             return lambda point: gs.squeeze(self._space.point_to_pdf(point)(x), axis=-1)
 
-        def _function_to_integrate(x):
-            pdf_x = pdf(x)
-            (
-                pdf_x_at_base_point,
-                pdf_x_derivative_at_base_point,
-            ) = gs.autodiff.value_and_grad(pdf_x, to_numpy=True)(base_point)
-
-            return gs.einsum(
-                "...ij,...->...ij",
-                gs.einsum(
-                    "...i,...j->...ij",
-                    pdf_x_derivative_at_base_point,
+        def quad_metric_matrix(base_point):
+            def _function_to_integrate(x):
+                pdf_x = pdf(x)
+                (
+                    pdf_x_at_base_point,
                     pdf_x_derivative_at_base_point,
-                ),
-                1 / pdf_x_at_base_point,
-            )
+                ) = gs.autodiff.value_and_grad(pdf_x, to_numpy=True)(base_point)
 
-        return quad_vec(_function_to_integrate, *self.support)[0]
+                return gs.einsum(
+                    "...ij,...->...ij",
+                    gs.einsum(
+                        "...i,...j->...ij",
+                        pdf_x_derivative_at_base_point,
+                        pdf_x_derivative_at_base_point,
+                    ),
+                    1 / pdf_x_at_base_point,
+                )
+
+            return quad_vec(_function_to_integrate, *self.support)[0]
+
+        if self.n_nodes is not None:
+            return self._integrate_with_gauss_rules(
+                base_point, self._gauss_metric_matrix, quad_metric_matrix
+            )
+        return quad_metric_matrix(base_point)
 
     def inner_product_derivative_matrix(self, base_point):
         r"""Compute the derivative of the inner-product matrix.
@@ -154,37 +733,46 @@ class FisherRaoMetric(RiemannianMetric):
             """
             return lambda point: gs.squeeze(self._space.point_to_pdf(point)(x), axis=-1)
 
-        def _function_to_integrate(x):
-            pdf_x = pdf(x)
-            (
-                pdf_x_at_base_point,
-                pdf_x_derivative_at_base_point,
-                pdf_x_hessian_at_base_point,
-            ) = gs.autodiff.value_jacobian_and_hessian(pdf_x)(base_point)
+        def quad_inner_product_derivative_matrix(base_point):
+            def _function_to_integrate(x):
+                pdf_x = pdf(x)
+                (
+                    pdf_x_at_base_point,
+                    pdf_x_derivative_at_base_point,
+                    pdf_x_hessian_at_base_point,
+                ) = gs.autodiff.value_jacobian_and_hessian(pdf_x)(base_point)
 
-            return gs.einsum(
-                "...,...ijk->...ijk",
-                1 / (pdf_x_at_base_point**2),
-                gs.einsum(
+                return gs.einsum(
                     "...,...ijk->...ijk",
-                    pdf_x_at_base_point,
+                    1 / (pdf_x_at_base_point**2),
                     gs.einsum(
-                        "...ki,...j->...ijk",
-                        pdf_x_hessian_at_base_point,
-                        pdf_x_derivative_at_base_point,
+                        "...,...ijk->...ijk",
+                        pdf_x_at_base_point,
+                        gs.einsum(
+                            "...ki,...j->...ijk",
+                            pdf_x_hessian_at_base_point,
+                            pdf_x_derivative_at_base_point,
+                        )
+                        + gs.einsum(
+                            "...kj,...i->...ijk",
+                            pdf_x_hessian_at_base_point,
+                            pdf_x_derivative_at_base_point,
+                        ),
                     )
-                    + gs.einsum(
-                        "...kj,...i->...ijk",
-                        pdf_x_hessian_at_base_point,
+                    - gs.einsum(
+                        "...i, ...j, ...k -> ...ijk",
+                        pdf_x_derivative_at_base_point,
+                        pdf_x_derivative_at_base_point,
                         pdf_x_derivative_at_base_point,
                     ),
                 )
-                - gs.einsum(
-                    "...i, ...j, ...k -> ...ijk",
-                    pdf_x_derivative_at_base_point,
-                    pdf_x_derivative_at_base_point,
-                    pdf_x_derivative_at_base_point,
-                ),
-            )
 
-        return quad_vec(_function_to_integrate, *self.support)[0]
+            return quad_vec(_function_to_integrate, *self.support)[0]
+
+        if self.n_nodes is not None:
+            return self._integrate_with_gauss_rules(
+                base_point,
+                self._gauss_inner_product_derivative_matrix,
+                quad_inner_product_derivative_matrix,
+            )
+        return quad_inner_product_derivative_matrix(base_point)
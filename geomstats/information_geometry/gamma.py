@@ -172,7 +172,7 @@ class GammaDistributions(InformationManifoldMixin, OpenSet):
 
             Parameters
             ----------
-            x : array-like, shape=[n_samples,]
+            x : array-like, shape=[..., n_samples]
                 Points at which to compute the probability
                 density function.
 
@@ -182,7 +182,7 @@ class GammaDistributions(InformationManifoldMixin, OpenSet):
                 Values of pdf at x for each value of the parameters provided
                 by point.
             """
-            x = gs.reshape(gs.array(x), (-1,))
+            x = gs.to_ndarray(gs.array(x), to_ndim=1)
             return (
                 kappa**kappa
                 * x ** (kappa - 1)
@@ -384,9 +384,7 @@ class GammaMetric(RiemannianMetric):
             the first dimension.
             :math: 'christoffels[..., i, j, k] = Gamma^i_{jk}'
         """
-        base_point = gs.to_ndarray(base_point, to_ndim=2)
-
-        kappa, gamma = base_point[:, 0], base_point[:, 1]
+        kappa, gamma = base_point[..., 0], base_point[..., 1]
 
         if gs.any(kappa > 4e15):
             raise ValueError(
@@ -394,39 +392,29 @@ class GammaMetric(RiemannianMetric):
                 "All values of kappa < 4e15 work."
             )
 
-        shape = kappa.shape
+        trigamma = gs.polygamma(1, kappa)
+        tetragamma = gs.polygamma(2, kappa)
+        excess = trigamma - 1 / kappa
+        well_conditioned = excess > gs.atol
 
         c111 = gs.where(
-            gs.polygamma(1, kappa) - 1 / kappa > gs.atol,
-            (gs.polygamma(2, kappa) + gs.array(kappa) ** -2)
-            / (2 * (gs.polygamma(1, kappa) - 1 / kappa)),
-            0.25 * (kappa**2 * gs.polygamma(2, kappa) + 1),
+            well_conditioned,
+            (tetragamma + kappa**-2) / (2 * excess),
+            0.25 * (kappa**2 * tetragamma + 1),
         )
-
         c122 = gs.where(
-            gs.polygamma(1, kappa) - 1 / kappa > gs.atol,
-            -1 / (2 * gamma**2 * (gs.polygamma(1, kappa) - 1 / kappa)),
+            well_conditioned,
+            -1 / (2 * gamma**2 * excess),
             -(kappa**2) / (4 * gamma**2),
         )
+        c212 = 1 / (2 * kappa)
+        c222 = -1 / gamma
+        zeros = gs.zeros_like(kappa)
 
-        c1 = gs.squeeze(
-            from_vector_to_diagonal_matrix(gs.transpose(gs.array([c111, c122])))
-        )
-
-        c2 = gs.squeeze(
-            gs.transpose(
-                gs.array(
-                    [[gs.zeros(shape), 1 / (2 * kappa)], [1 / (2 * kappa), -1 / gamma]]
-                )
-            )
+        christoffels = gs.stack(
+            [c111, zeros, zeros, c122, zeros, c212, c212, c222], axis=-1
         )
-
-        christoffels = gs.array([c1, c2])
-
-        if len(christoffels.shape) == 4:
-            christoffels = gs.transpose(christoffels, [1, 0, 2, 3])
-
-        return gs.squeeze(christoffels)
+        return gs.reshape(christoffels, kappa.shape + (2, 2, 2))
 
     def jacobian_christoffels(self, base_point):
         """Compute the Jacobian of the Christoffel symbols.
@@ -455,71 +443,48 @@ class GammaMetric(RiemannianMetric):
             Jacobian of the Christoffel symbols.
             :math: 'jac[..., i, j, k, l] = dGamma^i_{jk} / dx_l'
         """
-        base_point = gs.to_ndarray(base_point, 2)
-
-        n_points = base_point.shape[0]
+        kappa, gamma = base_point[..., 0], base_point[..., 1]
 
-        kappa, gamma = base_point[:, 0], base_point[:, 1]
+        trigamma = gs.polygamma(1, kappa)
+        tetragamma = gs.polygamma(2, kappa)
+        pentagamma = gs.polygamma(3, kappa)
+        excess = trigamma - 1 / kappa
+        well_conditioned = excess > gs.atol
 
-        term_0 = gs.zeros((n_points))
+        term_0 = gs.zeros_like(kappa)
         term_1 = 1 / gamma**2
         term_2 = gs.where(
-            gs.polygamma(1, kappa) - 1 / kappa > gs.atol,
-            kappa / (gamma**3 * (kappa * gs.polygamma(1, kappa) - 1)),
+            well_conditioned,
+            1 / (gamma**3 * excess),
             kappa**2 / gamma**3,
         )
         term_3 = -1 / (2 * kappa**2)
         term_4 = gs.where(
-            gs.polygamma(1, kappa) - 1 / kappa > gs.atol,
-            (kappa**2 * gs.polygamma(2, kappa) + 1)
-            / (2 * gamma**2 * (kappa * gs.polygamma(1, kappa) - 1) ** 2),
-            (kappa**4 * gs.polygamma(2, kappa) + kappa**2) / (2 * gamma**2),
+            well_conditioned,
+            (kappa**2 * tetragamma + 1) / (2 * gamma**2 * (kappa * excess) ** 2),
+            (kappa**4 * tetragamma + kappa**2) / (2 * gamma**2),
+        )
+        numerator_5 = (
+            kappa**4 * (trigamma * pentagamma - tetragamma**2)
+            - kappa**3 * pentagamma
+            - 2 * kappa**2 * tetragamma
+            - 2 * kappa * trigamma
+            + 1
         )
         term_5 = gs.where(
-            gs.polygamma(1, kappa) - 1 / kappa > gs.atol,
-            (
-                kappa**4
-                * (
-                    gs.polygamma(1, kappa) * gs.polygamma(3, kappa)
-                    - gs.polygamma(2, kappa) ** 2
-                )
-                - kappa**3 * gs.polygamma(3, kappa)
-                - 2 * kappa**2 * gs.polygamma(2, kappa)
-                - 2 * kappa * gs.polygamma(1, kappa)
-                + 1
-            )
-            / (2 * (kappa**2 * gs.polygamma(1, kappa) - kappa) ** 2),
-            0.5
-            * (
-                kappa**4
-                * (
-                    gs.polygamma(1, kappa) * gs.polygamma(3, kappa)
-                    - gs.polygamma(2, kappa) ** 2
-                )
-                - kappa**3 * gs.polygamma(3, kappa)
-                - 2 * kappa**2 * gs.polygamma(2, kappa)
-                - 2 * kappa * gs.polygamma(1, kappa)
-                + 1
-            ),
+            well_conditioned,
+            numerator_5 / (2 * (kappa**2 * excess) ** 2),
+            0.5 * numerator_5,
         )
 
-        jac = gs.array(
-            [
-                [
-                    [[term_5, term_0], [term_0, term_0]],
-                    [[term_0, term_0], [term_4, term_2]],
-                ],
-                [
-                    [[term_0, term_0], [term_3, term_0]],
-                    [[term_3, term_0], [term_0, term_1]],
-                ],
-            ]
+        jac_1 = gs.stack(
+            [term_5, term_0, term_0, term_0, term_0, term_0, term_4, term_2], axis=-1
         )
-
-        if n_points > 1:
-            jac = gs.transpose(jac, [4, 0, 1, 2, 3])
-
-        return gs.squeeze(jac)
+        jac_2 = gs.stack(
+            [term_0, term_0, term_3, term_0, term_3, term_0, term_0, term_1], axis=-1
+        )
+        jac = gs.stack([jac_1, jac_2], axis=-2)
+        return gs.reshape(jac, kappa.shape + (2, 2, 2, 2))
 
 
 class GammaDistributionsRandomVariable(ScipyUnivariateRandomVariable):
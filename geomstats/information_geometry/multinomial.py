@@ -3,6 +3,8 @@
 Lead author: Alice Le Brigant.
 """
 
+import math
+
 from scipy.stats import dirichlet, multinomial
 
 import geomstats.backend as gs
@@ -15,7 +17,7 @@ from geomstats.information_geometry.base import (
     InformationManifoldMixin,
     ScipyMultivariateRandomVariable,
 )
-from geomstats.vectorization import repeat_out
+from geomstats.vectorization import get_batch_shape, repeat_out
 
 
 class MultinomialDistributions(InformationManifoldMixin, LevelSet):
@@ -42,7 +44,6 @@ class MultinomialDistributions(InformationManifoldMixin, LevelSet):
             dim=dim, support_shape=(dim + 1,), shape=(dim + 1,), equip=equip
         )
         self.n_draws = n_draws
-        self._scp_rv = MultinomialRandomVariable(self)
 
     @staticmethod
     def default_metric():
@@ -169,8 +170,23 @@ class MultinomialDistributions(InformationManifoldMixin, LevelSet):
             Samples from multinomial distributions.
             Note that this can be of shape [n_points, n_samples, dim + 1] if
             several points and several samples are provided as inputs.
+
+        Notes
+        -----
+        Each draw is obtained by inverting the cumulative distribution function
+        of the outcomes at a uniform random variable, for all points and samples
+        at once. The counts of each outcome are the differences between the
+        numbers of draws falling below consecutive values of the cumulative
+        distribution function.
         """
-        return self._scp_rv.rvs(point, n_samples)
+        batch_shape = get_batch_shape(self, point)
+        uniform = gs.random.rand(*(batch_shape + (n_samples, self.n_draws, 1)))
+        cdf = gs.cumsum(point, axis=-1)[..., None, None, :-1]
+
+        n_below = gs.sum(uniform < cdf, axis=-2)
+        zeros = gs.zeros(batch_shape + (n_samples, 1), dtype=gs.int64)
+        n_below = gs.concatenate([zeros, n_below, zeros + self.n_draws], axis=-1)
+        return n_below[..., 1:] - n_below[..., :-1]
 
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
@@ -188,7 +204,58 @@ class MultinomialDistributions(InformationManifoldMixin, LevelSet):
         pdf : function
             (Discrete) probability density function.
         """
-        return lambda x: self._scp_rv.pdf(x, point=point)
+        log_pdf = self.point_to_log_pdf(point)
+        return lambda x: gs.exp(log_pdf(x))
+
+    def point_to_log_pdf(self, point):
+        """Compute log-pdf associated to point.
+
+        Compute the logarithm of the probability mass function of the
+        multinomial distribution with parameters provided by point.
+
+        Parameters
+        ----------
+        point : array-like, shape=[..., dim + 1]
+            Point representing a multinomial distribution.
+
+        Returns
+        -------
+        log_pdf : function
+            Logarithm of the (discrete) probability density function.
+        """
+        point = gs.expand_dims(point, axis=-2)
+        log_n_draws_factorial = gs.gammaln(gs.array(self.n_draws + 1.0))
+
+        def log_pdf(x):
+            """Generate parameterized function for multinomial log-pmf.
+
+            Parameters
+            ----------
+            x : array-like, shape=[n_samples, dim + 1] or [dim + 1]
+                Counts of each outcome at which to compute the log-pmf.
+
+            Returns
+            -------
+            log_pdf_at_x : array-like, shape=[..., n_samples] or [...]
+                Values of the log-pmf at x for each value of the parameters
+                provided by point. It is minus infinity where the counts do not
+                sum to the number of draws. The samples axis is dropped for a
+                single x.
+            """
+            is_single = x.ndim == 1
+            x = gs.cast(gs.reshape(x, (-1, self.dim + 1)), point.dtype)
+            is_drawn = x > 0.0
+            log_point = gs.log(gs.where(is_drawn, point, 1.0))
+            log_pmf = (
+                log_n_draws_factorial
+                - gs.sum(gs.gammaln(x + 1.0), axis=-1)
+                + gs.sum(gs.where(is_drawn, x * log_point, 0.0), axis=-1)
+            )
+            is_valid = gs.abs(gs.sum(x, axis=-1) - self.n_draws) < gs.atol
+            log_pmf = gs.where(is_valid, log_pmf, -math.inf)
+            return log_pmf[..., 0] if is_single else log_pmf
+
+        return log_pdf
 
 
 class MultinomialMetric(RiemannianMetric):
@@ -123,7 +123,11 @@ class UnivariateNormalDistributions(InformationManifoldMixin, PoincareHalfSpace)
         samples : array-like, shape=[..., n_samples]
             Sample from normal distributions.
         """
-        return self._scp_rv.rvs(point, n_samples)
+        batch_shape = get_batch_shape(self, point)
+        normal = gs.random.normal(size=batch_shape + (n_samples,))
+        means = gs.expand_dims(point[..., 0], axis=-1)
+        stds = gs.expand_dims(point[..., 1], axis=-1)
+        return means + stds * normal
 
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
@@ -151,7 +155,7 @@ class UnivariateNormalDistributions(InformationManifoldMixin, PoincareHalfSpace)
 
             Parameters
             ----------
-            x : array-like, shape=[n_samples,]
+            x : array-like, shape=[..., n_samples]
                 Points at which to compute the probability density function.
 
             Returns
@@ -160,7 +164,7 @@ class UnivariateNormalDistributions(InformationManifoldMixin, PoincareHalfSpace)
                 Values of pdf at x for each value of the parameters provided
                 by point.
             """
-            x = gs.reshape(gs.array(x), (-1,))
+            x = gs.to_ndarray(gs.array(x), to_ndim=1)
             return pdf_normalization * gs.exp(-((x - means) ** 2) / (2 * stds**2))
 
         return pdf
@@ -206,7 +210,9 @@ class CenteredNormalDistributions(InformationManifoldMixin, SPDMatrices):
         samples : array-like, shape=[..., n_samples, sample_dim]
             Sample from centered multivariate normal distributions.
         """
-        return self._scp_rv.rvs(point, n_samples)
+        batch_shape = get_batch_shape(self, point)
+        normal = gs.random.normal(size=batch_shape + (n_samples, self.sample_dim))
+        return gs.einsum("...ij,...nj->...ni", gs.linalg.cholesky(point), normal)
 
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
@@ -411,7 +417,13 @@ class DiagonalNormalDistributions(InformationManifoldMixin, OpenSet):
         samples : array-like, shape=[..., n_samples, sample_dim]
             Sample from multivariate normal distributions.
         """
-        return self._scp_rv.rvs(point, n_samples)
+        batch_shape = get_batch_shape(self, point)
+        normal = gs.random.normal(size=batch_shape + (n_samples, self.sample_dim))
+        mean, diagonal = self._unstack_mean_diagonal(point)
+        return (
+            gs.expand_dims(mean, axis=-2)
+            + gs.expand_dims(gs.sqrt(diagonal), axis=-2) * normal
+        )
 
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
@@ -518,7 +530,12 @@ class GeneralNormalDistributions(InformationManifoldMixin, ProductManifold):
         samples : array-like, shape=[..., n_samples, sample_dim]
             Sample from multivariate normal distributions.
         """
-        return self._scp_rv.rvs(point, n_samples)
+        batch_shape = get_batch_shape(self, point)
+        normal = gs.random.normal(size=batch_shape + (n_samples, self.sample_dim))
+        mean, cov = self._unstack_mean_covariance(point)
+        return gs.expand_dims(mean, axis=-2) + gs.einsum(
+            "...ij,...nj->...ni", gs.linalg.cholesky(cov), normal
+        )
 
     def point_to_pdf(self, point):
         """Compute pdf associated to point.
@@ -49,6 +49,13 @@ def _batchscalarmulsum(array_1, array_2):
     return gs.einsum("ni,ni...->i...", array_1, array_2)
 
 
+def _accumulated_sum(array, axis=None):
+    """Sum array, accumulating single precision inputs in double precision."""
+    if array.dtype != gs.float32:
+        return gs.sum(array, axis=axis)
+    return gs.cast(gs.sum(gs.cast(array, gs.float64), axis=axis), gs.float32)
+
+
 def variance(space, points, base_point, weights=None):
     """Variance of (weighted) points wrt a base point.
 
@@ -66,16 +73,20 @@ def variance(space, points, base_point, weights=None):
     -------
     var : float
        Weighted variance of the points.
+
+    Notes
+    -----
+    Single precision inputs are summed in double precision.
     """
     if weights is None:
         n_points = gs.shape(points)[0]
         weights = gs.ones((n_points,))
 
-    sum_weights = gs.sum(weights)
+    sum_weights = _accumulated_sum(weights)
     sq_dists = space.metric.squared_dist(base_point, points)
     var = weights * sq_dists
 
-    var = gs.sum(var)
+    var = _accumulated_sum(var)
     var /= sum_weights
 
     return var
@@ -101,15 +112,19 @@ def linear_mean(points, weights=None):
     -------
     mean : array-like, shape=[dim,]
         Weighted linear mean of the points.
+
+    Notes
+    -----
+    Single precision inputs are summed in double precision.
     """
     if weights is None:
         n_points = gs.shape(points)[0]
         weights = gs.ones(n_points)
-    sum_weights = gs.sum(weights)
+    sum_weights = _accumulated_sum(weights)
 
     weighted_points = _scalarmul(weights, points)
 
-    mean = gs.sum(weighted_points, axis=0) / sum_weights
+    mean = _accumulated_sum(weighted_points, axis=0) / sum_weights
     return mean
 
 
@@ -0,0 +1,273 @@
+"""Opt-in instrumentation of geometric and numerical primitives.
+
+Entry points of connections, metrics, geodesic solvers, integrators and
+optimizers are wrapped only while a profiling context is active. Outside such
+a context the original methods are left untouched, so instrumentation has no
+overhead when disabled.
+
+Examples
+--------
+>>> from geomstats.geometry.hypersphere import Hypersphere
+>>> from geomstats.profiling import profiling
+>>> space = Hypersphere(dim=2)
+>>> with profiling() as prof:
+...     _ = space.metric.dist(space.random_point(3), space.random_point(3))
+>>> prof.to_dict()["HypersphereMetric.dist"]["n_points"]
+3
+"""
+
+import contextlib
+import functools
+import importlib
+import inspect
+import json
+import math
+import time
+
+import geomstats.backend as gs
+
+PROFILED_METHODS = {
+    "geomstats.geometry.connection.Connection": [
+        "christoffels",
+        "exp",
+        "log",
+    ],
+    "geomstats.geometry.riemannian_metric.RiemannianMetric": [
+        "dist",
+        "inner_product",
+        "squared_dist",
+    ],
+    "geomstats.numerics.geodesic.ExpSolver": ["exp", "geodesic_ivp"],
+    "geomstats.numerics.geodesic.LogSolver": ["log", "geodesic_bvp"],
+    "geomstats.numerics.ivp.ODEIVPSolver": ["integrate", "integrate_t"],
+    "geomstats.numerics.bvp.ScipySolveBVP": ["integrate"],
+    "geomstats.numerics.optimizers.ScipyMinimize": ["minimize"],
+}
+
+_ACTIVE_PROFILERS = []
+_ACTIVE_CALLS = set()
+_PATCHED = []
+
+
+class _Record:
+    """Statistics collected for a given class method."""
+
+    __slots__ = ("calls", "time", "n_points", "n_fevals")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.n_points = 0
+        self.n_fevals = 0
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "time": self.time,
+            "mean_time": self.time / self.calls if self.calls else 0.0,
+            "n_points": self.n_points,
+            "n_fevals": self.n_fevals,
+        }
+
+
+class Profiler:
+    """Collector of call counts, timings, batch sizes and function evaluations.
+
+    Statistics are keyed by ``"<ClassName>.<method>"``, where the class is the
+    runtime class of the instance. Time is inclusive: a `dist` call also
+    accounts for the `log` it triggers, which gets its own record.
+
+    Attributes
+    ----------
+    records : dict
+        Statistics per key.
+    """
+
+    def __init__(self):
+        self.records = {}
+
+    def record(self, key, elapsed, n_points=0, n_fevals=0):
+        """Add a call to the statistics.
+
+        Parameters
+        ----------
+        key : str
+            Identifier of the profiled method.
+        elapsed : float
+            Wall time of the call, in seconds.
+        n_points : int
+            Number of points processed in the call.
+        n_fevals : int
+            Number of evaluations of the integrated or minimized function.
+        """
+        record = self.records.get(key)
+        if record is None:
+            record = self.records[key] = _Record()
+
+        record.calls += 1
+        record.time += elapsed
+        record.n_points += n_points
+        record.n_fevals += n_fevals
+
+    def reset(self):
+        """Clear collected statistics."""
+        self.records = {}
+
+    def to_dict(self):
+        """Export statistics.
+
+        Returns
+        -------
+        stats : dict
+            Dictionary with keys `calls`, `time`, `mean_time`, `n_points`
+            and `n_fevals` per profiled method.
+        """
+        return {key: record.to_dict() for key, record in self.records.items()}
+
+    def to_json(self, path=None, **kwargs):
+        """Export statistics to JSON.
+
+        Parameters
+        ----------
+        path : str
+            If given, statistics are also written to this file.
+        kwargs : dict
+            Keyword arguments passed to `json.dumps`.
+
+        Returns
+        -------
+        stats : str
+            JSON representation of the statistics.
+        """
+        stats = json.dumps(self.to_dict(), **kwargs)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(stats)
+        return stats
+
+
+def _import_class(path):
+    module_name, class_name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _all_subclasses(cls):
+    classes = {cls}
+    for subclass in cls.__subclasses__():
+        classes.update(_all_subclasses(subclass))
+    return classes
+
+
+def _get_space(obj, args):
+    space = getattr(obj, "_space", None)
+    if space is None and args:
+        space = args[0]
+    return space if hasattr(space, "point_ndim") else None
+
+
+def _count_points(space, args, kwargs):
+    if space is None:
+        return 0
+
+    n_points = 0
+    for arg in list(args) + list(kwargs.values()):
+        if not gs.is_array(arg) or arg.ndim < space.point_ndim:
+            continue
+        n_points = max(n_points, math.prod(arg.shape[: arg.ndim - space.point_ndim]))
+    return n_points
+
+
+class _CallCounter:
+    """Wrap a function and count its calls."""
+
+    def __init__(self, func):
+        self.func = func
+        self.n_calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.n_calls += 1
+        return self.func(*args, **kwargs)
+
+
+def _profiled(func, name):
+    @functools.wraps(func)
+    def _wrapped(self, *args, **kwargs):
+        key = (id(self), name)
+        if not _ACTIVE_PROFILERS or key in _ACTIVE_CALLS:
+            return func(self, *args, **kwargs)
+
+        counter = None
+        if args and callable(args[0]):
+            counter = _CallCounter(args[0])
+            args = (counter,) + args[1:]
+
+        _ACTIVE_CALLS.add(key)
+        start = time.perf_counter()
+        try:
+            out = func(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            _ACTIVE_CALLS.discard(key)
+
+        n_points = _count_points(_get_space(self, args), args, kwargs)
+        n_fevals = counter.n_calls if counter is not None else 0
+        for profiler in _ACTIVE_PROFILERS:
+            profiler.record(
+                f"{type(self).__name__}.{name}",
+                elapsed,
+                n_points=n_points,
+                n_fevals=n_fevals,
+            )
+        return out
+
+    return _wrapped
+
+
+def _patch():
+    patched = set()
+    for class_path, method_names in PROFILED_METHODS.items():
+        for cls in _all_subclasses(_import_class(class_path)):
+            for name in method_names:
+                func = cls.__dict__.get(name)
+                if not inspect.isfunction(func) or (cls, name) in patched:
+                    continue
+                patched.add((cls, name))
+                setattr(cls, name, _profiled(func, name))
+                _PATCHED.append((cls, name, func))
+
+
+def _unpatch():
+    while _PATCHED:
+        cls, name, func = _PATCHED.pop()
+        setattr(cls, name, func)
+
+
+@contextlib.contextmanager
+def profiling(profiler=None):
+    """Profile geometric and numerical primitives within a context.
+
+    Classes are instrumented when entering the outermost context, hence
+    classes defined afterwards are not profiled.
+
+    Parameters
+    ----------
+    profiler : Profiler
+        Collector to record into. If None, a new one is created.
+
+    Yields
+    ------
+    profiler : Profiler
+        Collector of the statistics.
+    """
+    if profiler is None:
+        profiler = Profiler()
+
+    if not _ACTIVE_PROFILERS:
+        _patch()
+    _ACTIVE_PROFILERS.append(profiler)
+    try:
+        yield profiler
+    finally:
+        _ACTIVE_PROFILERS.remove(profiler)
+        if not _ACTIVE_PROFILERS:
+            _unpatch()
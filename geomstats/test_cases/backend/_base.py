@@ -102,6 +102,15 @@ class AgainstScipyTestCase(_AgainstNumpyBasedTestCase):
     def test_unary_op_like_scipy(self, func_name, a):
         return self._test_func_like_scipy(func_name, [a])
 
+    def test_batched_func_like_scipy(self, func_name, args):
+        gs_fnc, scipy_fnc = get_backend_fncs(func_name, cmp_package=scipy)
+        np_args = convert_gs_to_np(args)
+
+        gs_array = gs_fnc(*args)
+        np_array = np.stack([scipy_fnc(*args_) for args_ in zip(*np_args)])
+
+        self.assertAllCloseToNp(gs_array, np_array)
+
 
 class AgainstEinsumTestCase(TestCase):
     def test_binary_op_like_einsum(self, func_name, a, b, einsum_expr):
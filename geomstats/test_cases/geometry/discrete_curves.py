@@ -13,10 +13,11 @@ from geomstats.vectorization import get_batch_shape
 class ClosedDiscreteCurvesTestCase(LevelSetTestCase):
     def _get_srv_point(self, n_points=1):
         # TODO: move into data_generator?
-        return DiscreteCurves(
+        curves_space = DiscreteCurves(
             ambient_manifold=self.space.ambient_manifold,
             k_sampling_points=self.space.k_sampling_points,
-        ).random_point(n_points)
+        )
+        return curves_space.metric.f_transform(curves_space.random_point(n_points))
 
     def _is_planar(self):
         is_euclidean = isinstance(self.space.ambient_manifold, Euclidean)
@@ -141,6 +142,76 @@ class SRVShapeBundleTestCase(FiberBundleTestCase):
         )
         self._test_vectorization(vec_data)
 
+    def test_horizontal_geodesic_against_single(
+        self, initial_point, end_point, times, atol
+    ):
+        res = self.bundle.horizontal_geodesic(initial_point, end_point)(times)
+
+        expected = gs.stack(
+            [
+                self.bundle.horizontal_geodesic(initial_point_, end_point_)(times)
+                for initial_point_, end_point_ in zip(initial_point, end_point)
+            ]
+        )
+        self.assertAllClose(res, expected, atol=atol)
+
+    def test_horizontal_geodesic_non_invertible(
+        self, initial_point, end_point, times, atol
+    ):
+        res = self.bundle.horizontal_geodesic(initial_point, end_point)(times)
+
+        expected = self.bundle.horizontal_geodesic(initial_point[0], end_point[0])(
+            times
+        )
+        self.assertAllClose(res[0], expected, atol=atol)
+        self.assertTrue(gs.all(gs.isnan(res[-1])))
+
+        with pytest.raises(ValueError):
+            self.bundle.horizontal_geodesic(initial_point[-1], end_point[-1])(times)
+
+    def test_align_against_single(self, point, base_point, atol):
+        res = self.bundle.align(point, base_point)
+
+        expected = gs.stack(
+            [
+                self.bundle.align(point_, base_point_)
+                for point_, base_point_ in zip(point, base_point)
+            ]
+        )
+        self.assertAllClose(res, expected, atol=atol)
+
+    def test_dynamic_programming_distance(
+        self, initial_point, end_point, expected, atol
+    ):
+        res = self.bundle._dynamic_programming(
+            initial_point, end_point, n_discretization=20
+        )["distances"]
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.vec
+    def test_dynamic_programming_distance_vec(self, n_reps, atol):
+        initial_point = self.data_generator.random_point()
+        end_point = self.data_generator.random_point()
+
+        expected = self.bundle._dynamic_programming(
+            initial_point, end_point, n_discretization=20
+        )["distances"]
+
+        vec_data = generate_vectorization_data(
+            data=[
+                dict(
+                    initial_point=initial_point,
+                    end_point=end_point,
+                    expected=expected,
+                    atol=atol,
+                )
+            ],
+            arg_names=["initial_point", "end_point"],
+            expected_name="expected",
+            n_reps=n_reps,
+        )
+        self._test_vectorization(vec_data)
+
     @pytest.mark.random
     def test_horizontal_geodesic_has_horizontal_derivative(
         self, n_points, n_times, atol
@@ -1,4 +1,7 @@
+import math
+
 import geomstats.backend as gs
+from geomstats.geometry.discrete_surfaces import _LogSolver
 from geomstats.test_cases.geometry.manifold import ManifoldTestCase
 from geomstats.test_cases.geometry.riemannian_metric import RiemannianMetricTestCase
 from geomstats.vectorization import get_n_points
@@ -81,3 +84,47 @@ class ElasticMetricTestCase(RiemannianMetricTestCase):
     def test_path_energy_per_time_is_positive(self, path, atol):
         energy = self.space.metric.path_energy_per_time(path)
         self.assertTrue(gs.all(energy > -1 * atol))
+
+    def test_path_energy_grad(self, path, atol):
+        """Check the path energy gradient against finite differences."""
+        res = self.space.metric.path_energy_grad(path)
+
+        step = 1e-6
+        directions = gs.reshape(gs.eye(math.prod(res.shape)), (-1,) + res.shape)
+        fixed_ends = gs.zeros((directions.shape[0], 1) + res.shape[-2:])
+        directions = gs.concatenate([fixed_ends, directions, fixed_ends], axis=1)
+        expected = (
+            self.space.metric.path_energy(path + step * directions)
+            - self.space.metric.path_energy(path - step * directions)
+        ) / (2 * step)
+
+        self.assertAllClose(res, gs.reshape(expected, res.shape), atol=atol)
+
+    def test_exp_after_log_solver(self, log_solver, point, base_point, atol):
+        """Check exp recovers the point from the log computed by a solver."""
+        tangent_vec = log_solver.log(self.space, point, base_point)
+        res = self.space.metric.exp(tangent_vec, base_point)
+        self.assertAllClose(res, point, atol=atol)
+
+    def test_log_solver_cache_follows_n_steps(
+        self, log_solver, n_steps, point, base_point, atol
+    ):
+        """Check a cached solution is not reused after n_steps changes."""
+        log_solver.log(self.space, point, base_point)
+
+        log_solver.n_steps = n_steps
+        res = log_solver.log(self.space, point, base_point)
+
+        fresh_solver = _LogSolver(n_steps=n_steps, n_levels=log_solver.n_levels)
+        expected = fresh_solver.log(self.space, point, base_point)
+        self.assertAllClose(res, expected, atol=atol)
+
+    def test_log_solver_cache_size(self, log_solver, points, base_point):
+        """Check only the last coarse solutions are kept in the cache."""
+        for point in points:
+            log_solver.log(self.space, point, base_point)
+
+        cached = list(log_solver._coarse_geodesics.values())
+        self.assertEqual(len(cached), log_solver.cache_size)
+        for geod in cached:
+            self.assertTrue(geod.shape[0] < log_solver.n_steps)
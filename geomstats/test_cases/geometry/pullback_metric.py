@@ -64,6 +64,48 @@ class SphereIntrinsic(ImmersedSet):
         return Euclidean(dim=self.dim + 1)
 
 
+class SphereIntrinsicWithDerivatives(SphereIntrinsic):
+    def jacobian_immersion(self, base_point):
+        theta = base_point[..., 0]
+        phi = base_point[..., 1]
+        return gs.stack(
+            [
+                gs.stack(
+                    [gs.cos(phi) * gs.cos(theta), -gs.sin(phi) * gs.sin(theta)], -1
+                ),
+                gs.stack(
+                    [gs.sin(phi) * gs.cos(theta), gs.cos(phi) * gs.sin(theta)], -1
+                ),
+                gs.stack([-gs.sin(theta), gs.zeros_like(theta)], -1),
+            ],
+            axis=-2,
+        )
+
+    def hessian_immersion(self, base_point):
+        theta = base_point[..., 0]
+        phi = base_point[..., 1]
+        immersed_point = self.immersion(base_point)
+        mixed = gs.stack(
+            [
+                -gs.cos(theta) * gs.sin(phi),
+                gs.cos(theta) * gs.cos(phi),
+                gs.zeros_like(theta),
+            ],
+            axis=-1,
+        )
+        horizontal = gs.stack(
+            [immersed_point[..., 0], immersed_point[..., 1], gs.zeros_like(theta)],
+            axis=-1,
+        )
+        return gs.stack(
+            [
+                gs.stack([-immersed_point, mixed], axis=-1),
+                gs.stack([mixed, -horizontal], axis=-1),
+            ],
+            axis=-1,
+        )
+
+
 class PullbackMetricTestCase(RiemannianMetricTestCase):
     def test_second_fundamental_form(self, base_point, expected, atol):
         res = self.space.metric.second_fundamental_form(base_point)
@@ -374,6 +374,38 @@ class RiemannianMetricTestCase(ConnectionTestCase):
         res = self.space.metric.scalar_curvature(base_point)
         self.assertAllClose(res, expected, atol=atol)
 
+    @pytest.mark.random
+    def test_jacobian_christoffels_against_finite_differences(self, n_points, atol):
+        """Check jacobian of christoffels against central finite differences.
+
+        Only collected for metrics implementing ``jacobian_christoffels``.
+
+        Parameters
+        ----------
+        n_points : int
+            Number of random points to generate.
+        atol : float
+            Absolute tolerance.
+        """
+        base_point = self.data_generator.random_point(n_points)
+        step = 1e-6
+        directions = gs.eye(self.space.dim)
+        christoffels = self.space.metric.christoffels
+
+        expected = gs.stack(
+            [
+                (
+                    christoffels(base_point + step * direction)
+                    - christoffels(base_point - step * direction)
+                )
+                / (2 * step)
+                for direction in directions
+            ],
+            axis=-1,
+        )
+        res = self.space.metric.jacobian_christoffels(base_point)
+        self.assertAllClose(res, expected, atol=atol)
+
     @pytest.mark.random
     def test_parallel_transport_ivp_norm(self, n_points, atol):
         """Check parallel transported norm is preserved.
@@ -48,6 +48,16 @@ class InformationManifoldMixinTestCase(TestCase):
         )
         self._test_vectorization(vec_data)
 
+    @pytest.mark.shape
+    def test_point_to_pdf_single_sample_shape(self, n_points):
+        point = self.data_generator.random_point(n_points)
+
+        sample_point = point if n_points == 1 else point[0]
+        x = self.space.sample(sample_point, n_samples=1)[0]
+        res = self.space.point_to_pdf(point)(x)
+
+        self.assertEqual(res.shape, get_batch_shape(self.space, point))
+
     @pytest.mark.random
     def test_point_to_pdf_against_scipy(self, n_points, n_samples, atol):
         point = self.data_generator.random_point(n_points)
@@ -29,9 +29,11 @@ def _get_max_ndim_point(*point):
         Point with higher dimension.
     """
     max_ndim_point = point[0]
+    max_ndim = max_ndim_point.ndim
     for point_ in point[1:]:
-        if point_.ndim > max_ndim_point.ndim:
+        if point_.ndim > max_ndim:
             max_ndim_point = point_
+            max_ndim = point_.ndim
 
     return max_ndim_point
 
@@ -70,7 +72,11 @@ def check_is_batch(space, *point):
     is_batch : bool
         Returns True if point contains several points.
     """
-    return any(point_.ndim > space.point_ndim for point_ in point)
+    point_ndim = space.point_ndim
+    for point_ in point:
+        if point_.ndim > point_ndim:
+            return True
+    return False
 
 
 def get_batch_shape(space, *point):
@@ -88,11 +94,17 @@ def get_batch_shape(space, *point):
     batch_shape : tuple
         Returns the shape related with batch. () if only one point.
     """
-    point = list(filter(_is_not_none, point))
-    if len(point) == 0:
+    point_ndim = space.point_ndim
+    max_ndim = point_ndim
+    point_max_ndim = None
+    for point_ in point:
+        if point_ is not None and point_.ndim > max_ndim:
+            point_max_ndim = point_
+            max_ndim = point_.ndim
+
+    if point_max_ndim is None:
         return ()
-    point_max_ndim = _get_max_ndim_point(*point)
-    return point_max_ndim.shape[: -space.point_ndim]
+    return point_max_ndim.shape[:-point_ndim]
 
 
 def repeat_point(point, n_reps=2, expand=False):
@@ -140,11 +152,11 @@ def repeat_out(space, out, *point, out_shape=()):
     Returns
     -------
     out : array-like
-        If no batch, then input is returned. Otherwise it is broadcasted.
+        If no batch, or if out already has the batch shape, then input is
+        returned. Otherwise it is broadcasted.
     """
-    point = filter(_is_not_none, point)
     batch_shape = get_batch_shape(space, *point)
-    if out.shape[: -len(out_shape)] != batch_shape:
+    if out.shape[: out.ndim - len(out_shape)] != batch_shape:
         return gs.broadcast_to(out, batch_shape + out_shape)
     return out
 
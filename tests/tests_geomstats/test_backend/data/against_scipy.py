@@ -21,3 +21,20 @@ class AgainstScipyTestData(TestData):
         smoke_data += self._logm_expm_data("linalg.expm")
 
         return self.generate_tests(smoke_data)
+
+    def batched_func_like_scipy_test_data(self):
+        n_points = 4
+        eye = gs.eye(3)
+        data = [
+            dict(func_name="linalg.logm", args=[rand(n_points, 3, 3) + 2 * eye]),
+            dict(func_name="linalg.sqrtm", args=[rand(n_points, 3, 3) + 2 * eye]),
+            dict(
+                func_name="linalg.sqrtm",
+                args=[Matrices.to_symmetric(rand(n_points, 3, 3)) + 3 * eye],
+            ),
+            dict(
+                func_name="linalg.solve_sylvester",
+                args=[rand(n_points, 3, 3), rand(n_points, 2, 2), rand(n_points, 3, 2)],
+            ),
+        ]
+        return self.generate_tests(data)
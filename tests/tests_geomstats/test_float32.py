@@ -0,0 +1,68 @@
+"""Unit tests for single precision execution."""
+
+import pytest
+
+import geomstats.algebra_utils as utils
+import geomstats.backend as gs
+from geomstats.geometry.hypersphere import Hypersphere
+from geomstats.geometry.spd_matrices import SPDMatrices
+from geomstats.geometry.special_orthogonal import SpecialOrthogonal
+from geomstats.learning.frechet_mean import linear_mean, variance
+from geomstats.test.test_case import TestCase
+
+SPACES = [
+    lambda: Hypersphere(dim=2),
+    lambda: SpecialOrthogonal(n=3, point_type="vector"),
+    lambda: SPDMatrices(n=3),
+]
+
+
+class TestFloat32(TestCase):
+    def setup_method(self):
+        gs.set_default_dtype("float32")
+
+    def teardown_method(self):
+        gs.set_default_dtype("float64")
+
+    def test_tolerances_follow_dtype(self):
+        self.assertTrue(gs.atol > 1e-7)
+        self.assertEqual(utils.get_epsilon(), utils.FLOAT32_EPSILON)
+        self.assertEqual(utils.get_epsilon(gs.float64), utils.EPSILON)
+
+    def test_taylor_exp_even_func(self):
+        point = gs.array([1e-4, 1e-1, 1.0])
+        result = utils.taylor_exp_even_func(point, utils.cosc_close_0)
+
+        point_64 = gs.cast(point, gs.float64)
+        expected = (1 - gs.cos(gs.sqrt(point_64))) / point_64
+        self.assertTrue(result.dtype == gs.float32)
+        self.assertAllClose(gs.cast(result, gs.float64), expected, atol=1e-6)
+
+    @pytest.mark.parametrize("space_fnc", SPACES)
+    def test_exp_log_dist(self, space_fnc):
+        space = space_fnc()
+        base_point = space.random_point(4)
+        point = space.random_point(4)
+
+        log = space.metric.log(point, base_point)
+        exp = space.metric.exp(log, base_point)
+        dist = space.metric.dist(point, base_point)
+        self.assertTrue(log.dtype == gs.float32)
+        self.assertTrue(exp.dtype == gs.float32)
+        self.assertTrue(dist.dtype == gs.float32)
+        self.assertAllClose(exp, point, atol=1e-4, rtol=1e-3)
+
+        gs.set_default_dtype("float64")
+        expected = space.metric.dist(
+            gs.cast(point, gs.float64), gs.cast(base_point, gs.float64)
+        )
+        self.assertAllClose(gs.cast(dist, gs.float64), expected, atol=1e-4)
+
+    def test_frechet_sums(self):
+        space = Hypersphere(dim=2)
+        points = space.random_point(10)
+
+        var = variance(space, points, points[0])
+        mean = linear_mean(points)
+        self.assertTrue(var.dtype == gs.float32)
+        self.assertTrue(mean.dtype == gs.float32)
@@ -1,3 +1,6 @@
+import geomstats.backend as gs
+from geomstats.test.data import TestData
+
 from .base import LevelSetTestData
 from .fiber_bundle import FiberBundleTestData
 from .manifold import ManifoldTestData
@@ -14,8 +17,6 @@ class DiscreteCurvesTestData(ProjectionMixinsTestData, ManifoldTestData):
 class ClosedDiscreteCurvesTestData(LevelSetTestData):
     fail_for_not_implemented_errors = False
 
-    skips = ("srv_projection_vec",)
-
     def srv_projection_vec_test_data(self):
         return self.generate_vec_data()
 
@@ -44,13 +45,11 @@ class SRVMetricTestData(PullbackDiffeoMetricTestData):
 class SRVShapeBundleTestData(FiberBundleTestData):
     fail_for_not_implemented_errors = False
 
-    skips = (
-        "horizontal_geodesic_vec",
-        "align_vec",
-        "log_after_align_is_horizontal",
-    )
+    skips = ("log_after_align_is_horizontal",)
     xfails = (
         # not robust
+        "horizontal_geodesic_vec",
+        "align_vec",
         "horizontal_geodesic_has_horizontal_derivative",
         "tangent_riemannian_submersion_after_horizontal_lift",
     )
@@ -75,6 +74,9 @@ class SRVShapeBundleTestData(FiberBundleTestData):
             )
         return self.generate_tests(data)
 
+    def dynamic_programming_distance_vec_test_data(self):
+        return self.generate_vec_data()
+
     def horizontal_geodesic_has_horizontal_derivative_test_data(self):
         data = []
         for n_times in [20]:
@@ -82,5 +84,89 @@ class SRVShapeBundleTestData(FiberBundleTestData):
         return self.generate_tests(data)
 
 
+class SRVShapeBundleSmokeTestData(TestData):
+    times = gs.linspace(0.0, 1.0, 21)
+    reparametrized_times = gs.where(times <= 0.5, times / 2, 1.5 * times - 0.5)
+
+    horizontal_segment = gs.stack([times, gs.zeros_like(times)], axis=-1)
+    vertical_segment = gs.stack([gs.zeros_like(times), times], axis=-1)
+    diagonal_segment = gs.stack([times, times / 2], axis=-1)
+    reparametrized_diagonal_segment = gs.stack(
+        [reparametrized_times, reparametrized_times / 2], axis=-1
+    )
+
+    arc = gs.stack([gs.cos(times), gs.sin(times)], axis=-1)
+    reparametrized_arc = gs.stack([gs.cos(times**2), gs.sin(times**2)], axis=-1)
+    ellipse_arc = gs.stack([2.0 * gs.cos(times**1.5), gs.sin(times**1.5)], axis=-1)
+    parabola = gs.stack([times, times**2], axis=-1)
+    wave = gs.stack([times, 0.3 * gs.sin(3.0 * times)], axis=-1)
+
+    def _smooth_pairs(self):
+        initial_point = gs.stack([self.arc, self.parabola, self.arc])
+        end_point = gs.stack([self.ellipse_arc, self.arc, self.reparametrized_arc])
+        return initial_point, end_point
+
+    def horizontal_geodesic_against_single_test_data(self):
+        initial_point, end_point = self._smooth_pairs()
+        data = [
+            dict(
+                initial_point=initial_point,
+                end_point=end_point,
+                times=gs.linspace(0.0, 1.0, 10),
+            )
+        ]
+        return self.generate_tests(data)
+
+    def horizontal_geodesic_non_invertible_test_data(self):
+        # the reparametrizations of the last pair cannot be inverted
+        data = [
+            dict(
+                initial_point=gs.stack([self.arc, self.wave]),
+                end_point=gs.stack([self.ellipse_arc, self.arc]),
+                times=gs.linspace(0.0, 1.0, 10),
+            )
+        ]
+        return self.generate_tests(data)
+
+    def align_against_single_test_data(self):
+        base_point, point = self._smooth_pairs()
+        data = [dict(point=point, base_point=base_point)]
+        return self.generate_tests(data)
+
+    def dynamic_programming_distance_test_data(self):
+        data = [
+            dict(
+                initial_point=self.diagonal_segment,
+                end_point=self.diagonal_segment,
+                expected=gs.array(0.0),
+            ),
+            dict(
+                initial_point=self.diagonal_segment,
+                end_point=self.reparametrized_diagonal_segment,
+                expected=gs.array(0.0),
+            ),
+            dict(
+                initial_point=self.horizontal_segment,
+                end_point=self.vertical_segment,
+                expected=gs.array(2.0**0.5),
+            ),
+            dict(
+                initial_point=self.horizontal_segment,
+                end_point=2.0 * self.horizontal_segment,
+                expected=gs.array(2.0**0.5 - 1.0),
+            ),
+            dict(
+                initial_point=gs.stack(
+                    [self.diagonal_segment, self.horizontal_segment]
+                ),
+                end_point=gs.stack(
+                    [self.reparametrized_diagonal_segment, self.vertical_segment]
+                ),
+                expected=gs.array([0.0, 2.0**0.5]),
+            ),
+        ]
+        return self.generate_tests(data)
+
+
 class SRVQuotientMetricTestData(QuotientMetricTestData):
     fail_for_not_implemented_errors = False
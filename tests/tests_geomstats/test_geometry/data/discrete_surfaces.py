@@ -1,5 +1,6 @@
 import geomstats.backend as gs
 import geomstats.datasets.utils as data_utils
+from geomstats.geometry.discrete_surfaces import _LogSolver
 from geomstats.test.data import TestData
 from geomstats.vectorization import repeat_point
 
@@ -31,10 +32,27 @@ class DiscreteSurfacesSmokeTestData(TestData):
                 ),
                 expected=repeat_point(expected),
             ),
+            dict(
+                point=self.vertices * gs.array([2.0, 1.0, 1.0]),
+                expected=self._stretched_vertex_areas(),
+            ),
         ]
 
         return self.generate_tests(data)
 
+    def _stretched_vertex_areas(self):
+        _, faces = data_utils.load_cube()
+        vertices = self.vertices * gs.array([2.0, 1.0, 1.0])
+        expected = [0.0] * vertices.shape[0]
+        for face in faces:
+            vertex_0, vertex_1, vertex_2 = (vertices[int(index)] for index in face)
+            area = 0.5 * gs.linalg.norm(
+                gs.cross(vertex_1 - vertex_0, vertex_2 - vertex_0)
+            )
+            for index in face:
+                expected[int(index)] += 2 * area / 3
+        return gs.array(expected)
+
     def normals_test_data(self):
         expected = cube_normals = gs.array(
             [
@@ -110,3 +128,53 @@ class ElasticMetricSmokeTestData(TestData):
             dict(path=gs.array([self.vertices, self.vertices, self.vertices])),
         ]
         return self.generate_tests(data)
+
+    def path_energy_grad_test_data(self):
+        path = gs.stack(
+            [
+                self.vertices,
+                self.vertices * gs.array([1.1, 1.0, 0.9]),
+                self.vertices * gs.array([1.2, 0.9, 0.9]) + 0.1,
+                self.vertices * gs.array([1.3, 0.8, 1.0]),
+            ]
+        )
+        data = [dict(path=path)]
+        return self.generate_tests(data)
+
+    def exp_after_log_solver_test_data(self):
+        point = self.vertices * gs.array([1.2, 1.0, 0.9])
+        data = [
+            dict(
+                log_solver=_LogSolver(n_levels=n_levels),
+                point=point,
+                base_point=self.vertices,
+                atol=5e-2,
+            )
+            for n_levels in [1, 3]
+        ]
+        return self.generate_tests(data)
+
+    def log_solver_cache_size_test_data(self):
+        data = [
+            dict(
+                log_solver=_LogSolver(n_steps=10, n_levels=2, cache_size=2),
+                points=[
+                    self.vertices * gs.array([1.2, 1.0, 0.9]),
+                    self.vertices * gs.array([1.0, 1.1, 1.0]),
+                    self.vertices * gs.array([0.9, 1.0, 1.1]),
+                ],
+                base_point=self.vertices,
+            )
+        ]
+        return self.generate_tests(data)
+
+    def log_solver_cache_follows_n_steps_test_data(self):
+        data = [
+            dict(
+                log_solver=_LogSolver(n_steps=10, n_levels=2),
+                n_steps=6,
+                point=self.vertices * gs.array([1.2, 1.0, 0.9]),
+                base_point=self.vertices,
+            )
+        ]
+        return self.generate_tests(data)
@@ -1,4 +1,5 @@
 import geomstats.backend as gs
+from geomstats.geometry.hypersphere import Hypersphere
 from geomstats.test.data import TestData
 
 from .riemannian_metric import (
@@ -114,6 +115,33 @@ def _expected_sphere_inner_product_derivativ_matrix(base_point):
     return expected_1, expected_2
 
 
+def _expected_sphere_christoffels(base_point):
+    theta = base_point[..., 0]
+    cot_theta = gs.cos(theta) / gs.sin(theta)
+    return gs.array(
+        [
+            [[0.0, 0.0], [0.0, -gs.sin(theta) * gs.cos(theta)]],
+            [[0.0, cot_theta], [cot_theta, 0.0]],
+        ]
+    )
+
+
+def _expected_sphere_exp(tangent_vec, base_point):
+    sphere = Hypersphere(dim=2)
+    theta, phi = base_point[..., 0], base_point[..., 1]
+    immersed_base_point = gs.stack(
+        [gs.cos(phi) * gs.sin(theta), gs.sin(phi) * gs.sin(theta), gs.cos(theta)],
+        axis=-1,
+    )
+    immersed_tangent_vec = gs.matvec(
+        _expected_jacobian_sphere_immersion(base_point), tangent_vec
+    )
+    point = sphere.metric.exp(immersed_tangent_vec, immersed_base_point)
+    return gs.stack(
+        [gs.arccos(point[..., 2]), gs.arctan2(point[..., 1], point[..., 0])], axis=-1
+    )
+
+
 class CircleIntrinsicTestData(TestData):
     fail_for_autodiff_exceptions = False
 
@@ -350,6 +378,44 @@ class SphereIntrinsicMetricTestData(TestData):
             )
         return self.generate_tests(data)
 
+    def christoffels_test_data(self):
+        base_points = [gs.array([0.6, -1.0]), gs.array([1.2, 0.4])]
+        data = []
+        for base_point in base_points:
+            data.append(
+                dict(
+                    base_point=base_point,
+                    expected=_expected_sphere_christoffels(base_point),
+                )
+            )
+        return self.generate_tests(data)
+
+    def exp_test_data(self):
+        data = [
+            dict(
+                tangent_vec=gs.array([0.0, 1.0]),
+                base_point=gs.array([gs.pi / 2.0, 0.0]),
+                expected=gs.array([gs.pi / 2.0, 1.0]),
+            ),
+            dict(
+                tangent_vec=gs.array([0.3, 0.5]),
+                base_point=gs.array([1.0, 0.2]),
+                expected=_expected_sphere_exp(
+                    gs.array([0.3, 0.5]), gs.array([1.0, 0.2])
+                ),
+            ),
+        ]
+        return self.generate_tests(data)
+
+
+class SphereIntrinsicWithDerivativesTestData(SphereIntrinsicTestData):
+    fail_for_autodiff_exceptions = True
+
+
+class SphereIntrinsicWithDerivativesMetricTestData(SphereIntrinsicMetricTestData):
+    fail_for_autodiff_exceptions = True
+    tolerances = {"exp": {"atol": 1e-2}}
+
 
 class CircleAsSO2PullbackDiffeoMetricCmpTestData(RiemannianMetricComparisonTestData):
     fail_for_autodiff_exceptions = False
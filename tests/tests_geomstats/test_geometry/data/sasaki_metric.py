@@ -1,5 +1,6 @@
 import geomstats.backend as gs
 from geomstats.test.data import TestData
+from geomstats.vectorization import repeat_point
 
 
 class SasakiMetricSphereTestData(TestData):
@@ -80,6 +81,12 @@ class SasakiMetricSphereTestData(TestData):
                 end_point=self.pu3,
                 expected=expected,
                 atol=6e-06,
-            )
+            ),
+            dict(
+                initial_point=gs.stack([self.pu2, self.pu3]),
+                end_point=gs.stack([self.pu3, self.pu3]),
+                expected=gs.stack([expected, repeat_point(self.pu3, 4)]),
+                atol=6e-06,
+            ),
         ]
         return self.generate_tests(data)
@@ -32,6 +32,7 @@ from .data.discrete_curves import (
     L2CurvesMetricTestData,
     SRVMetricTestData,
     SRVQuotientMetricTestData,
+    SRVShapeBundleSmokeTestData,
     SRVShapeBundleTestData,
 )
 
@@ -183,6 +184,15 @@ class TestSRVShapeBundle(SRVShapeBundleTestCase, metaclass=DataBasedParametrizer
     testing_data = SRVShapeBundleTestData()
 
 
+@pytest.mark.smoke
+class TestSRVShapeBundleSmoke(SRVShapeBundleTestCase, metaclass=DataBasedParametrizer):
+    total_space = base = DiscreteCurves(Euclidean(dim=2), k_sampling_points=21)
+    bundle = SRVShapeBundle(total_space)
+    sphere = Hypersphere(dim=1)
+
+    testing_data = SRVShapeBundleSmokeTestData()
+
+
 @pytest.fixture(
     scope="class",
     params=[
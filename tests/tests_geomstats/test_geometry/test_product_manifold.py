@@ -99,3 +99,19 @@ class TestProductRiemannianMetric(
     RiemannianMetricTestCase, metaclass=DataBasedParametrizer
 ):
     testing_data = ProductRiemannianMetricTestData()
+
+
+@pytest.fixture(scope="class", params=[2, 8, -1, None])
+def threaded_spaces(request):
+    request.cls.space = ProductManifold(
+        factors=(SpecialOrthogonal(n=3), Euclidean(dim=3)),
+        default_point_type="vector",
+        n_jobs=request.param,
+    )
+
+
+@pytest.mark.usefixtures("threaded_spaces")
+class TestProductRiemannianMetricThreaded(
+    RiemannianMetricTestCase, metaclass=DataBasedParametrizer
+):
+    testing_data = ProductRiemannianMetricTestData()
@@ -8,6 +8,7 @@ from geomstats.test_cases.geometry.pullback_metric import (
     CircleIntrinsic,
     PullbackMetricTestCase,
     SphereIntrinsic,
+    SphereIntrinsicWithDerivatives,
 )
 from geomstats.test_cases.geometry.riemannian_metric import (
     RiemannianMetricComparisonTestCase,
@@ -19,6 +20,8 @@ from .data.pullback_metric import (
     CircleIntrinsicTestData,
     SphereIntrinsicMetricTestData,
     SphereIntrinsicTestData,
+    SphereIntrinsicWithDerivativesMetricTestData,
+    SphereIntrinsicWithDerivativesTestData,
 )
 
 
@@ -42,13 +45,7 @@ class TestCircleIntrinsicMetric(
     testing_data = CircleIntrinsicMetricTestData()
 
 
-@pytest.mark.smoke
-class TestSphereIntrinsicMetric(
-    PullbackMetricTestCase, metaclass=DataBasedParametrizer
-):
-    space = SphereIntrinsic()
-    testing_data = SphereIntrinsicMetricTestData()
-
+class _SphereIntrinsicMetricTestCase(PullbackMetricTestCase):
     def test_second_fundamental_form(self, base_point, expected_11, expected_22, atol):
         res = self.space.metric.second_fundamental_form(base_point)
 
@@ -66,6 +63,30 @@ class TestSphereIntrinsicMetric(
         self.assertAllClose(res[:, :, 1], expected_2, atol=atol)
 
 
+@pytest.mark.smoke
+class TestSphereIntrinsicMetric(
+    _SphereIntrinsicMetricTestCase, metaclass=DataBasedParametrizer
+):
+    space = SphereIntrinsic()
+    testing_data = SphereIntrinsicMetricTestData()
+
+
+@pytest.mark.smoke
+class TestSphereIntrinsicWithDerivatives(
+    ImmersedSetTestCase, metaclass=DataBasedParametrizer
+):
+    space = SphereIntrinsicWithDerivatives(equip=False)
+    testing_data = SphereIntrinsicWithDerivativesTestData()
+
+
+@pytest.mark.smoke
+class TestSphereIntrinsicWithDerivativesMetric(
+    _SphereIntrinsicMetricTestCase, metaclass=DataBasedParametrizer
+):
+    space = SphereIntrinsicWithDerivatives()
+    testing_data = SphereIntrinsicWithDerivativesMetricTestData()
+
+
 class TestCircleAsSO2PullbackDiffeoMetricCmp(
     RiemannianMetricComparisonTestCase, metaclass=DataBasedParametrizer
 ):
@@ -1,8 +1,11 @@
 import random
 
+import scipy
+
 import geomstats.backend as gs
 from geomstats.geometry.matrices import Matrices
 from geomstats.geometry.stratified.graph_space import (
+    CachedAligner,
     ExhaustiveAligner,
     FAQAligner,
     GraphPoint,
@@ -71,10 +74,45 @@ class GraphSpaceTestData(PointSetTestData):
         space = self._PointSet(2)
         graph = gs.array([[0.0, 1.0], [2.0, 3.0]])
 
+        graph_perm = gs.array([[3.0, 2.0], [1.0, 0.0]])
+
         smoke_data = [
             dict(
                 space=space, graph=graph, permutation=gs.array([0, 1]), expected=graph
             ),
+            dict(
+                space=space,
+                graph=graph,
+                permutation=gs.array([1, 0]),
+                expected=graph_perm,
+            ),
+            dict(
+                space=space,
+                graph=graph,
+                permutation=gs.array([[0, 1], [1, 0]]),
+                expected=gs.stack([graph, graph_perm]),
+            ),
+            dict(
+                space=space,
+                graph=gs.stack([graph, graph_perm]),
+                permutation=gs.array([[1, 0], [1, 0]]),
+                expected=gs.stack([graph_perm, graph]),
+            ),
+        ]
+        return self.generate_tests(smoke_data)
+
+    def pad_with_zeros_test_data(self):
+        space = self._PointSet(3)
+
+        smoke_data = [
+            dict(space=space, points=gs.ones((2, 2))),
+            dict(space=space, points=gs.ones((2, 2, 2))),
+            dict(space=space, points=self._Point(gs.ones((2, 2)))),
+            dict(
+                space=space,
+                points=[self._Point(gs.ones((2, 2))), self._Point(gs.ones((3, 3)))],
+            ),
+            dict(space=space, points=self._Point(scipy.sparse.eye(2, format="csr"))),
         ]
         return self.generate_tests(smoke_data)
 
@@ -91,8 +129,8 @@ class GraphTestData(PointTestData):
                 expected=gs.array([[1.0, 2.0], [3.0, 4.0]]),
             ),
             dict(
-                point_args=(gs.array([[1.0, 2.0], [3.0, 4.0]]),),
-                expected=gs.array([[1.0, 2.0], [3.0, 4.0]]),
+                point_args=(scipy.sparse.csr_matrix([[0.0, 2.0], [3.0, 0.0]]),),
+                expected=gs.array([[0.0, 2.0], [3.0, 0.0]]),
             ),
         ]
 
@@ -267,6 +305,57 @@ class AlignerTestData(TestData):
 
         return self.generate_tests(smoke_data)
 
+    def align_warm_start_test_data(self):
+        smoke_data = []
+        for space_args in self.space_args_list:
+            space = GraphSpace(*space_args, equip=True)
+            smoke_data.append(
+                dict(
+                    space=space,
+                    base_point=space.random_point(3),
+                    permute_point=space.random_point(3),
+                    new_base_point=space.random_point(3),
+                )
+            )
+
+        return self.generate_tests(smoke_data)
+
+    def align_cache_test_data(self):
+        smoke_data = []
+        for space_args in self.space_args_list:
+            space = GraphSpace(*space_args, equip=True)
+            for aligner in [FAQAligner(), ExhaustiveAligner()]:
+                for warm_start in [False, True]:
+                    smoke_data.append(
+                        dict(
+                            space=space,
+                            aligner=CachedAligner(aligner, warm_start=warm_start),
+                            base_point=space.random_point(3),
+                            permute_point=space.random_point(3),
+                        )
+                    )
+
+        return self.generate_tests(smoke_data)
+
+    def align_cmp_points_test_data(self):
+        smoke_data = []
+        for space_args in self.space_args_list:
+            space = GraphSpace(*space_args, equip=True)
+            base_point, permute_point = space.random_point(3), space.random_point(3)
+
+            expected = FAQAligner().align(space, base_point, permute_point)
+            smoke_data.append(
+                dict(
+                    space=space,
+                    aligner=FAQAligner(n_jobs=2),
+                    base_point=base_point,
+                    permute_point=permute_point,
+                    expected=expected,
+                )
+            )
+
+        return self.generate_tests(smoke_data)
+
 
 class PointToGeodesicAlignerTestData(TestData):
     skip_all = IS_NOT_NP
@@ -289,7 +378,9 @@ class PointToGeodesicAlignerTestData(TestData):
 
         aligners = [
             PointToGeodesicAligner(s_min=0.0, s_max=1.0, n_points=3),
+            PointToGeodesicAligner(s_min=0.0, s_max=1.0, n_points=3, chunk_size=2),
             _GeodesicToPointAligner(),
+            _GeodesicToPointAligner(method="newton"),
         ]
         return aligners, geodesic
 
@@ -336,3 +427,24 @@ class PointToGeodesicAlignerTestData(TestData):
                 )
 
         return self.generate_tests(smoke_data)
+
+    def opt_results_test_data(self):
+        smoke_data = []
+        for space_args in self.space_args_list:
+            space = GraphSpace(*space_args, equip=True)
+            space.metric.set_aligner(ExhaustiveAligner())
+            geodesic = space.metric.geodesic(*space.random_point(2))
+
+            for method in ["BFGS", "newton"]:
+                smoke_data.append(
+                    dict(
+                        space=space,
+                        aligner=_GeodesicToPointAligner(
+                            method=method, save_opt_res=True
+                        ),
+                        geodesic=geodesic,
+                        point=space.random_point(3),
+                    )
+                )
+
+        return self.generate_tests(smoke_data)
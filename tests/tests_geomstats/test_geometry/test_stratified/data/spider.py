@@ -96,6 +96,44 @@ class SpiderMetricTestData(PointMetricTestData):
                 point_b=pts_end,
                 expected=gs.array([30.0, 5.0]),
             ),
+            dict(
+                space_args=(3,),
+                point_a=self._Point(1, 2.0),
+                point_b=[self._Point(1, 3.0), self._Point(2, 1.0), self._Point(0, 0)],
+                expected=gs.array([1.0, 3.0, 2.0]),
+            ),
+        ]
+
+        return self.generate_tests(smoke_data)
+
+    def dist_from_arrays_test_data(self):
+        smoke_data = [
+            dict(
+                space_args=(12,),
+                strata_a=gs.array([10, 3, 0, 2]),
+                coords_a=gs.array([1.0, 1.0, 0.0, 2.0]),
+                strata_b=gs.array([10, 1, 5, 2]),
+                coords_b=gs.array([31.0, 4.0, 2.0, 2.0]),
+                expected=gs.array([30.0, 5.0, 2.0, 0.0]),
+            ),
+        ]
+
+        return self.generate_tests(smoke_data)
+
+    def geodesic_from_arrays_test_data(self):
+        smoke_data = [
+            dict(
+                space_args=(12,),
+                strata_a=gs.array([10, 10, 0]),
+                coords_a=gs.array([1.0, 1.0, 0.0]),
+                strata_b=gs.array([10, 11, 3]),
+                coords_b=gs.array([31.0, 2.0, 2.0]),
+                t=gs.array([0.0, 0.4, 1.0]),
+                expected_strata=gs.array([[10, 10, 10], [10, 11, 11], [0, 3, 3]]),
+                expected_coords=gs.array(
+                    [[1.0, 13.0, 31.0], [1.0, 0.2, 2.0], [0.0, 0.8, 2.0]]
+                ),
+            ),
         ]
 
         return self.generate_tests(smoke_data)
@@ -1,5 +1,7 @@
 import random
 
+import pytest
+
 import geomstats.backend as gs
 from geomstats.geometry.stratified.wald_space import Split, Topology, Wald, WaldSpace
 from geomstats.test.data import TestData
@@ -24,7 +26,16 @@ class WaldTestData(PointTestData):
             dict(point_args=point_args) for point_args in self.point_args_list
         ]
 
-        return self.generate_tests([], random_data)
+        return self.generate_tests(random_data, marks=(pytest.mark.random,))
+
+    def generate_walder_test_data(self):
+        random_data = [
+            dict(point_args=point_args, n_samples=n_samples)
+            for point_args in self.point_args_list
+            for n_samples in [1, 10]
+        ]
+
+        return self.generate_tests(random_data, marks=(pytest.mark.random,))
 
     def to_array_test_data(self):
         smoke_data = []
@@ -184,6 +195,13 @@ class WaldSpaceTestData(PointSetTestData):
             gs.array([[1.0, 0.56, 0.63], [0.56, 1.0, 0.72], [0.63, 0.72, 1.0]])
         )
 
+        x = gs.array([0.5, 0.5, 0.5])
+        point = Wald(top, x)
+        points.append(point)
+        expected.append(
+            gs.array([[1.0, 0.25, 0.25], [0.25, 1.0, 0.25], [0.25, 0.25, 1.0]])
+        )
+
         smoke_data.append(
             dict(space_args=(3,), points=points, expected=gs.array(expected))
         )
@@ -274,14 +292,17 @@ class SplitTestData(TestData):
         return self.generate_tests(smoke_data)
 
     def is_compatible_test_data(self):
-        # TODO: add a non compatible example
-
         smoke_data = [
             dict(
                 split_a=Split(part1=[0, 4], part2=[1, 2, 3]),
                 split_b=Split(part1=[2, 3], part2=[0, 1, 4]),
                 expected=True,
             ),
+            dict(
+                split_a=Split(part1=[0, 1], part2=[2, 3]),
+                split_b=Split(part1=[0, 2], part2=[1, 3]),
+                expected=False,
+            ),
         ]
 
         return self.generate_tests(smoke_data)
@@ -311,6 +332,36 @@ class SplitTestData(TestData):
 class TopologyTestData(TestData):
     skip_all = IS_NOT_NP
 
+    def support_test_data(self):
+        partition = ((0, 1, 2, 3),)
+        split_sets = ((((0, 1), (2, 3)), ((0,), (1, 2, 3))),)
+        split_sets = [[Split(a, b) for a, b in splits] for splits in split_sets]
+        topology = Topology(n_labels=4, partition=partition, split_sets=split_sets)
+
+        expected = [
+            gs.array(
+                [
+                    [False, False, True, True],
+                    [False, False, True, True],
+                    [True, True, False, False],
+                    [True, True, False, False],
+                ]
+            ),
+            gs.array(
+                [
+                    [False, True, True, True],
+                    [True, False, False, False],
+                    [True, False, False, False],
+                    [True, False, False, False],
+                ]
+            ),
+        ]
+        smoke_data = [
+            dict(topology=topology, splits=split_sets[0], expected=expected),
+        ]
+
+        return self.generate_tests(smoke_data)
+
     def partition_test_data(self):
         # TODO: add false example
         smoke_data = [
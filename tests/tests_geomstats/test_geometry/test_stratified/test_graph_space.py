@@ -4,6 +4,7 @@ import networkx as nx
 import pytest
 
 import geomstats.backend as gs
+from geomstats.geometry.stratified.graph_space import CachedAligner, FAQAligner
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.test_case import TestCase
 from geomstats.test_cases.geometry.stratified.point_set import (
@@ -192,6 +193,31 @@ class TestAligner(TestCase, metaclass=DataBasedParametrizer):
 
         self.assertAllClose(res, expected)
 
+    def test_align_cache(self, space, aligner, base_point, permute_point):
+        n_pairs = base_point.shape[0]
+        expected = aligner.aligner.align(space, base_point, permute_point)
+
+        res = aligner.align(space, base_point, permute_point)
+        self.assertAllClose(res, expected)
+        self.assertEqual(aligner.cache_info(), (0, n_pairs, aligner.maxsize, n_pairs))
+
+        res = aligner.align(space, base_point, permute_point)
+        self.assertAllClose(res, expected)
+        self.assertEqual(aligner.cache_info().hits, n_pairs)
+
+    def test_align_warm_start(self, space, base_point, permute_point, new_base_point):
+        aligner = CachedAligner(FAQAligner(), warm_start=True)
+        aligner.align(space, base_point, permute_point)
+
+        res = aligner.align(space, new_base_point, permute_point)
+        n_pairs, n_nodes = permute_point.shape[:2]
+        self.assertEqual(aligner.cache_info().misses, 2 * n_pairs)
+        self.assertAllEqual(
+            gs.sort(aligner.perm_, axis=-1),
+            gs.broadcast_to(gs.arange(n_nodes), (n_pairs, n_nodes)),
+        )
+        self.assertAllClose(res, space.permute(permute_point, aligner.perm_))
+
     def test_align_output_shape(self, space, aligner, base_point, permute_point):
         expected = aligner.align(space, base_point, permute_point)
 
@@ -218,6 +244,14 @@ class TestPointToGeodesicAligner(TestCase, metaclass=DataBasedParametrizer):
         aligned_point = aligner.align(space, geodesic, point)
         self.assertAllClose(aligned_point, expected)
 
+    def test_opt_results(self, space, aligner, geodesic, point):
+        dist = aligner.dist(space, geodesic, point)
+
+        self.assertEqual(len(aligner.opt_results_), point.shape[0])
+        self.assertAllClose(
+            gs.array([opt_res.fun for opt_res in aligner.opt_results_]), dist
+        )
+
     @pytest.mark.skip(reason="unknown reason")
     def test_dist(self, space, aligner, geodesic, point, expected, atol):
         dist = aligner.dist(space, geodesic, point)
@@ -24,3 +24,27 @@ class TestSpiderPoint(PointTestCase, metaclass=DataBasedParametrizer):
 
 class TestSpiderMetric(PointSetMetricTestCase, metaclass=DataBasedParametrizer):
     testing_data = SpiderMetricTestData()
+
+    def test_dist_from_arrays(
+        self, space_args, strata_a, coords_a, strata_b, coords_b, expected
+    ):
+        space = self.testing_data._PointSet(*space_args)
+        result = space.metric.dist_from_arrays(strata_a, coords_a, strata_b, coords_b)
+        self.assertAllClose(result, expected)
+
+    def test_geodesic_from_arrays(
+        self,
+        space_args,
+        strata_a,
+        coords_a,
+        strata_b,
+        coords_b,
+        t,
+        expected_strata,
+        expected_coords,
+    ):
+        space = self.testing_data._PointSet(*space_args)
+        path = space.metric.geodesic_from_arrays(strata_a, coords_a, strata_b, coords_b)
+        strata, coords = path(t)
+        self.assertAllEqual(strata, expected_strata)
+        self.assertAllClose(coords, expected_coords)
@@ -1,3 +1,4 @@
+from geomstats.geometry.stratified.wald_space import WaldSpace
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.test_case import TestCase
 from geomstats.test_cases.geometry.stratified.point_set import (
@@ -26,6 +27,14 @@ class TestWald(PointTestCase, metaclass=DataBasedParametrizer):
         result = isinstance(generated_point, self._Point)
         self.assertAllClose(result, True)
 
+    def test_generate_walder(self, point_args, n_samples):
+        n_labels, p_keep, p_new = point_args
+        walder = self._Point.generate_walder(n_labels, n_samples, p_keep, p_new)
+        self.assertEqual(len(walder), n_samples)
+
+        space = WaldSpace(n_labels)
+        self.assertTrue(all(space.belongs(walder)))
+
 
 class TestSplit(TestCase, metaclass=DataBasedParametrizer):
     testing_data = SplitTestData()
@@ -65,6 +74,11 @@ class TestSplit(TestCase, metaclass=DataBasedParametrizer):
 class TestTopology(TestCase, metaclass=DataBasedParametrizer):
     testing_data = TopologyTestData()
 
+    def test_support(self, topology, splits, expected):
+        for split, expected_ in zip(splits, expected):
+            result = topology.support[topology.where[split]]
+            self.assertAllEqual(result, expected_)
+
     def test_partition(self, st_a, st_b, expected):
         result = st_a.partition == st_b.partition
         self.assertEqual(result, expected)
@@ -0,0 +1,48 @@
+"""Unit tests for lazy imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import geomstats
+import geomstats.backend as gs
+from geomstats.geometry import _bch_coefficients
+from geomstats.test.test_case import TestCase
+
+
+def _run(code):
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return out.stdout.split()
+
+
+class TestLazyImport(TestCase):
+    def test_import_geomstats_is_lazy(self):
+        modules = _run(
+            "import sys; import geomstats; "
+            "print(' '.join(name for name in sys.modules))"
+        )
+
+        self.assertTrue("geomstats.geometry" not in modules)
+        self.assertTrue("geomstats.learning" not in modules)
+
+    def test_bch_coefficients_are_lazy(self):
+        (n_loaded,) = _run(
+            "from geomstats.geometry import lie_algebra, _bch_coefficients; "
+            "print(_bch_coefficients.get_bch_coefficients.cache_info().currsize)"
+        )
+        self.assertEqual(n_loaded, "0")
+
+    def test_bch_coefficients(self):
+        bch_coefficients = _bch_coefficients.BCH_COEFFICIENTS
+        self.assertEqual(bch_coefficients.shape, (4720, 5))
+        self.assertAllClose(bch_coefficients[3], gs.array([4, 3, 1, 1, 12]))
+
+    def test_getattr_submodule(self):
+        self.assertTrue(geomstats.geometry.hypersphere.Hypersphere is not None)
+
+    def test_getattr_unknown(self):
+        with pytest.raises(AttributeError):
+            geomstats.unknown_module
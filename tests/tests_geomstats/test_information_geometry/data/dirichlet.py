@@ -9,6 +9,12 @@ from .base import InformationManifoldMixinTestData
 class DirichletDistributionsTestData(InformationManifoldMixinTestData, OpenSetTestData):
     fail_for_not_implemented_errors = False
 
+    def point_to_pdf_against_scipy_test_data(self):
+        return self.generate_random_data_with_samples()
+
+    def point_to_pdf_single_sample_shape_test_data(self):
+        return self.generate_shape_data()
+
 
 class DirichletDistributions3TestData(TestData):
     def belongs_test_data(self):
@@ -43,6 +49,9 @@ class DirichletMetricTestData(RiemannianMetricTestData):
     def jacobian_christoffels_vec_test_data(self):
         return self.generate_vec_data()
 
+    def jacobian_christoffels_against_finite_differences_test_data(self):
+        return self.generate_random_data()
+
     def sectional_curvature_is_negative_test_data(self):
         return self.generate_random_data()
 
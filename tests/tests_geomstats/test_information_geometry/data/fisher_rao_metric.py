@@ -140,3 +140,93 @@ class FisherRaoMetricCmpBetaTestData(TestData):
             ),
         ]
         return self.generate_tests(smoke_data)
+
+
+class FisherRaoMetricGaussCmpUnivariateNormalTestData(
+    FisherRaoMetricCmpUnivariateNormalTestData
+):
+    tolerances = {
+        "metric_matrix": {"atol": 1e-8},
+        "inner_product": {"atol": 1e-8},
+        "inner_product_derivative_matrix": {"atol": 1e-8},
+    }
+
+    def metric_matrix_test_data(self):
+        smoke_data = [
+            dict(base_point=gs.array([0.1, 0.8])),
+            dict(base_point=gs.array([30.0, 0.5])),
+            dict(base_point=gs.array([0.0, 0.05])),
+            dict(base_point=gs.array([[-200.0, 3.0], [1000.0, 10.0], [0.0, 100.0]])),
+        ]
+
+        return self.generate_tests(smoke_data)
+
+    def inner_product_derivative_matrix_test_data(self):
+        smoke_data = [
+            dict(base_point=gs.array([1.0, 2.0])),
+            dict(base_point=gs.array([[30.0, 0.5], [0.0, 0.05]])),
+        ]
+
+        return self.generate_tests(smoke_data)
+
+
+class FisherRaoMetricGaussCmpExponentialTestData(FisherRaoMetricCmpExponentialTestData):
+    tolerances = {
+        "metric_matrix": {"atol": 1e-8},
+        "inner_product": {"atol": 1e-8},
+        "inner_product_derivative_matrix": {"atol": 1e-8},
+    }
+
+    def metric_matrix_test_data(self):
+        smoke_data = [
+            dict(base_point=gs.array([1.0])),
+            dict(base_point=gs.array([0.01])),
+            dict(base_point=gs.array([[100.0], [0.5]])),
+        ]
+
+        return self.generate_tests(smoke_data)
+
+    def inner_product_derivative_matrix_test_data(self):
+        smoke_data = [
+            dict(base_point=gs.array([0.5])),
+            dict(base_point=gs.array([[0.01], [100.0]])),
+        ]
+
+        return self.generate_tests(smoke_data)
+
+
+class FisherRaoMetricGaussCmpBetaTestData(TestData):
+    fail_for_autodiff_exceptions = False
+    tolerances = {
+        "metric_matrix": {"atol": 1e-6},
+        "inner_product": {"atol": 1e-5},
+    }
+
+    def metric_matrix_test_data(self):
+        smoke_data = [
+            dict(
+                base_point=gs.array([2.0, 3.0]),
+            ),
+            dict(
+                base_point=gs.array([[2.0, 3.0], [4.0, 3.0], [20.0, 30.0]]),
+            ),
+            dict(
+                base_point=gs.array([[2.0, 3.0], [0.5, 1.0]]),
+            ),
+        ]
+        return self.generate_tests(smoke_data)
+
+    def inner_product_test_data(self):
+        smoke_data = [
+            dict(
+                tangent_vec_a=gs.array([1.0, 2.0]),
+                tangent_vec_b=gs.array([1.0, 2.0]),
+                base_point=gs.array([2.0, 3.0]),
+            ),
+            dict(
+                tangent_vec_a=gs.array([[1.0, 2.0], [3.0, 2.0]]),
+                tangent_vec_b=gs.array([[1.0, 2.0], [3.0, 2.0]]),
+                base_point=gs.array([[2.0, 3.0], [3.0, 2.0]]),
+            ),
+        ]
+        return self.generate_tests(smoke_data)
@@ -136,5 +136,8 @@ class GammaMetricTestData(RiemannianMetricTestData):
     def jacobian_christoffels_vec_test_data(self):
         return self.generate_vec_data()
 
+    def jacobian_christoffels_against_finite_differences_test_data(self):
+        return self.generate_random_data()
+
     def scalar_curvature_against_closed_form_test_data(self):
         return self.generate_random_data()
@@ -11,6 +11,12 @@ class MultinomialDistributionsTestData(
 ):
     fail_for_not_implemented_errors = False
 
+    def point_to_pdf_against_scipy_test_data(self):
+        return self.generate_random_data_with_samples()
+
+    def point_to_pdf_single_sample_shape_test_data(self):
+        return self.generate_shape_data()
+
 
 class MultinomialDistributions2TestData(TestData):
     def belongs_test_data(self):
@@ -3,6 +3,7 @@ import random
 import pytest
 
 from geomstats.information_geometry.categorical import CategoricalDistributions
+from geomstats.information_geometry.multinomial import MultinomialRandomVariable
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.random import RandomDataGenerator
 from geomstats.test_cases.information_geometry.multinomial import (
@@ -22,7 +23,8 @@ from .data.multinomial import MultinomialDistributionsTestData
     ],
 )
 def spaces(request):
-    request.cls.space = CategoricalDistributions(dim=request.param, equip=False)
+    space = request.cls.space = CategoricalDistributions(dim=request.param, equip=False)
+    request.cls.random_variable = MultinomialRandomVariable(space)
 
 
 @pytest.mark.usefixtures("spaces")
@@ -2,7 +2,10 @@ import random
 
 import pytest
 
-from geomstats.information_geometry.dirichlet import DirichletDistributions
+from geomstats.information_geometry.dirichlet import (
+    DirichletDistributions,
+    DirichletRandomVariable,
+)
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.random import RandomDataGenerator
 from geomstats.test_cases.information_geometry.dirichlet import (
@@ -24,7 +27,8 @@ from .data.dirichlet import (
     ],
 )
 def spaces(request):
-    request.cls.space = DirichletDistributions(dim=request.param, equip=False)
+    space = request.cls.space = DirichletDistributions(dim=request.param, equip=False)
+    request.cls.random_variable = DirichletRandomVariable(space)
 
 
 @pytest.mark.usefixtures("spaces")
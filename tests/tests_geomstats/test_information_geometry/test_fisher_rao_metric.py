@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from geomstats.information_geometry.beta import BetaDistributions
@@ -6,6 +8,7 @@ from geomstats.information_geometry.fisher_rao_metric import FisherRaoMetric
 from geomstats.information_geometry.gamma import GammaDistributions
 from geomstats.information_geometry.normal import UnivariateNormalDistributions
 from geomstats.test.parametrizers import DataBasedParametrizer
+from geomstats.test.test_case import autograd_and_torch_only
 from geomstats.test_cases.geometry.riemannian_metric import (
     RiemannianMetricComparisonTestCase,
 )
@@ -15,6 +18,9 @@ from .data.fisher_rao_metric import (
     FisherRaoMetricCmpExponentialTestData,
     FisherRaoMetricCmpGammaTestData,
     FisherRaoMetricCmpUnivariateNormalTestData,
+    FisherRaoMetricGaussCmpBetaTestData,
+    FisherRaoMetricGaussCmpExponentialTestData,
+    FisherRaoMetricGaussCmpUnivariateNormalTestData,
 )
 
 
@@ -68,3 +74,45 @@ class TestFisherRaoCmpBeta(
     other_space = BetaDistributions()
 
     testing_data = FisherRaoMetricCmpBetaTestData()
+
+
+@autograd_and_torch_only
+@pytest.mark.smoke
+class TestFisherRaoGaussCmpUnivariateNormal(
+    RiemannianMetricComparisonTestCase, metaclass=DataBasedParametrizer
+):
+    support = (-math.inf, math.inf)
+    space = UnivariateNormalDistributions(equip=False)
+    space.equip_with_metric(FisherRaoMetric, support=support, n_nodes=100)
+
+    other_space = UnivariateNormalDistributions()
+
+    testing_data = FisherRaoMetricGaussCmpUnivariateNormalTestData()
+
+
+@autograd_and_torch_only
+@pytest.mark.smoke
+class TestFisherRaoGaussCmpExponential(
+    RiemannianMetricComparisonTestCase, metaclass=DataBasedParametrizer
+):
+    support = (0, math.inf)
+    space = ExponentialDistributions(equip=False)
+    space.equip_with_metric(FisherRaoMetric, support=support, n_nodes=100)
+
+    other_space = ExponentialDistributions()
+
+    testing_data = FisherRaoMetricGaussCmpExponentialTestData()
+
+
+@autograd_and_torch_only
+@pytest.mark.smoke
+class TestFisherRaoGaussCmpBeta(
+    RiemannianMetricComparisonTestCase, metaclass=DataBasedParametrizer
+):
+    support = (0, 1)
+    space = BetaDistributions(equip=False)
+    space.equip_with_metric(FisherRaoMetric, support=support, n_nodes=100)
+
+    other_space = BetaDistributions()
+
+    testing_data = FisherRaoMetricGaussCmpBetaTestData()
@@ -2,7 +2,10 @@ import random
 
 import pytest
 
-from geomstats.information_geometry.multinomial import MultinomialDistributions
+from geomstats.information_geometry.multinomial import (
+    MultinomialDistributions,
+    MultinomialRandomVariable,
+)
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.random import RandomDataGenerator
 from geomstats.test_cases.information_geometry.multinomial import (
@@ -24,7 +27,10 @@ from .data.multinomial import (
 )
 def spaces(request):
     dim, n_draws = request.param
-    request.cls.space = MultinomialDistributions(dim=dim, n_draws=n_draws, equip=False)
+    space = request.cls.space = MultinomialDistributions(
+        dim=dim, n_draws=n_draws, equip=False
+    )
+    request.cls.random_variable = MultinomialRandomVariable(space)
 
 
 @pytest.mark.usefixtures("spaces")
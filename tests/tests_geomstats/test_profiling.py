@@ -0,0 +1,68 @@
+"""Unit tests for profiling."""
+
+import json
+
+import geomstats.backend as gs
+from geomstats.geometry.hypersphere import Hypersphere, HypersphereMetric
+from geomstats.numerics.ivp import GSIVPIntegrator
+from geomstats.profiling import Profiler, profiling
+from geomstats.test.test_case import TestCase
+
+
+class TestProfiling(TestCase):
+    def test_records_calls_and_points(self):
+        space = Hypersphere(dim=2)
+        point_a = space.random_point(3)
+        point_b = space.random_point(3)
+
+        with profiling() as prof:
+            space.metric.dist(point_a, point_b)
+            space.metric.dist(point_a[0], point_b[0])
+
+        record = prof.to_dict()["HypersphereMetric.dist"]
+        self.assertEqual(record["calls"], 2)
+        self.assertEqual(record["n_points"], 4)
+        self.assertTrue(record["time"] > 0.0)
+
+    def test_restores_methods(self):
+        original = HypersphereMetric.exp
+        with profiling():
+            self.assertTrue(HypersphereMetric.exp is not original)
+        self.assertTrue(HypersphereMetric.exp is original)
+
+    def test_counts_function_evaluations(self):
+        integrator = GSIVPIntegrator(n_steps=5, step_type="rk4")
+
+        def force(state, _time):
+            return gs.stack([state[1], gs.zeros_like(state[1])])
+
+        with profiling() as prof:
+            integrator.integrate(force, gs.array([[0.0, 1.0], [1.0, 2.0]]))
+
+        record = prof.to_dict()["GSIVPIntegrator.integrate"]
+        self.assertEqual(record["calls"], 1)
+        self.assertEqual(record["n_fevals"], 20)
+
+    def test_nested_contexts(self):
+        space = Hypersphere(dim=2)
+        point = space.random_point()
+        outer_profiler = Profiler()
+
+        with profiling(outer_profiler):
+            with profiling() as inner:
+                space.metric.inner_product(point, point, point)
+            space.metric.inner_product(point, point, point)
+
+        self.assertEqual(inner.to_dict()["HypersphereMetric.inner_product"]["calls"], 1)
+        self.assertEqual(
+            outer_profiler.to_dict()["HypersphereMetric.inner_product"]["calls"], 2
+        )
+
+    def test_to_json(self):
+        space = Hypersphere(dim=2)
+        point = space.random_point()
+
+        with profiling() as prof:
+            space.metric.exp(gs.zeros(3), point)
+
+        self.assertEqual(json.loads(prof.to_json()), prof.to_dict())
@@ -0,0 +1,34 @@
+"""Unit tests for vectorization helpers."""
+
+import geomstats.backend as gs
+from geomstats.geometry.hypersphere import Hypersphere
+from geomstats.test.test_case import TestCase
+from geomstats.vectorization import check_is_batch, get_batch_shape, repeat_out
+
+
+class TestVectorization(TestCase):
+    def setup_method(self):
+        self.space = Hypersphere(dim=2)
+
+    def test_get_batch_shape(self):
+        point = self.space.random_point()
+        points = self.space.random_point(4)
+
+        self.assertEqual(get_batch_shape(self.space, point, None, point), ())
+        self.assertEqual(get_batch_shape(self.space, point, None, points), (4,))
+        self.assertEqual(get_batch_shape(self.space, None), ())
+
+    def test_check_is_batch(self):
+        point = self.space.random_point()
+        self.assertFalse(check_is_batch(self.space, point, point))
+        self.assertTrue(check_is_batch(self.space, point, self.space.random_point(2)))
+
+    def test_repeat_out_broadcasts(self):
+        points = self.space.random_point(4)
+        out = repeat_out(self.space, gs.array(1.0), points, None)
+        self.assertAllClose(out, gs.ones(4))
+
+    def test_repeat_out_skips_matching_shape(self):
+        points = self.space.random_point(4)
+        out = gs.ones((4, 3))
+        self.assertTrue(repeat_out(self.space, out, points, out_shape=(3,)) is out)